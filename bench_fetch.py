@@ -0,0 +1,90 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src import WarehouseFacade
+from src.analysis.lottery import LotteryAnalysis
+
+
+QUERIES = {
+    'daily_lottery_results': """
+        SELECT d.full_date, d.day_of_week, s.station_name, s.region,
+               p.prize_name, p.prize_order, l.prize_sequence, l.result_number
+        FROM Fact_Lottery_Result l
+        JOIN Dim_Date d ON l.date_id = d.date_id
+        JOIN Dim_Station s ON l.station_id = s.station_id
+        JOIN Dim_Prize p ON l.prize_id = p.prize_id
+        ORDER BY d.full_date DESC, s.station_name, p.prize_order, l.prize_sequence
+    """,
+    'special_prize_history': """
+        SELECT d.full_date, d.day_of_week, s.station_name, l.result_number
+        FROM Fact_Lottery_Result l
+        JOIN Dim_Date d ON l.date_id = d.date_id
+        JOIN Dim_Station s ON l.station_id = s.station_id
+        JOIN Dim_Prize p ON l.prize_id = p.prize_id
+        WHERE p.prize_name = 'Đặc biệt'
+        ORDER BY d.full_date DESC LIMIT 1000
+    """
+}
+
+
+def row_dicts(db, query: str) -> pd.DataFrame:
+    results = db.fetchall(query)
+    df = pd.DataFrame([dict(row) for row in results])
+    df['full_date'] = pd.to_datetime(df['full_date'])
+    return df
+
+
+def columnar(db, query: str) -> pd.DataFrame:
+    return db.fetch_df(query, dtypes={'full_date': 'datetime64[ns]'})
+
+
+def time_call(fn, repeats: int):
+    rows = len(fn())
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    seconds = (time.perf_counter() - start) / repeats
+    return rows, seconds
+
+
+def bench_fetch(years: int = 2, repeats: int = 5):
+    print("=" * 70)
+    print(f"BENCHMARK QUERY -> DATAFRAME ({years}-year warehouse)")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        facade = WarehouseFacade(
+            db_path=str(Path(tmp_dir) / "warehouse.db"),
+            lottery_csv=str(Path(tmp_dir) / "lottery_results.csv"),
+            revenue_csv=str(Path(tmp_dir) / "revenue_data.csv")
+        )
+        facade.generate_raw_data(f"{2025 - years}-01-01", "2024-12-31")
+        facade.initialize_database()
+        facade.load_data_to_warehouse()
+        db = facade.db_connection
+
+        print(f"{'Query':<24} {'Rows':>9} {'Approach':<12} {'ms':>10} {'rows/sec':>14}")
+        print("-" * 70)
+        for name, query in QUERIES.items():
+            query_only = lambda: db.conn.execute(query).fetchall()
+            for approach, fn in (
+                ('query only', query_only),
+                ('row dicts', lambda: row_dicts(db, query)),
+                ('fetch_df', lambda: columnar(db, query))
+            ):
+                rows, seconds = time_call(fn, repeats)
+                print(f"{name:<24} {rows:>9,} {approach:<12} {seconds * 1000:>10.1f} {rows / seconds:>14,.0f}")
+
+        lottery = LotteryAnalysis(db)
+        rows, seconds = time_call(lottery.get_daily_lottery_results, repeats)
+        print(f"\nget_daily_lottery_results(): {rows:,} rows in {seconds * 1000:.1f} ms")
+
+        facade.close()
+
+
+if __name__ == "__main__":
+    bench_fetch(*(int(arg) for arg in sys.argv[1:]))
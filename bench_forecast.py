@@ -0,0 +1,103 @@
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from src.forecasting import RevenueForecasting
+
+
+def legacy_forecast_next_months(forecaster: RevenueForecasting, historical_data: pd.DataFrame, months: int = 12):
+    df = forecaster.prepare_features(historical_data)
+
+    last_date = df['year_month'].max()
+    last_revenue = df['total_revenue'].iloc[-1]
+    last_index = df['month_index'].iloc[-1]
+
+    future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=months, freq='MS')
+
+    predictions = []
+    current_lags = {
+        'lag1': df['total_revenue'].iloc[-1],
+        'lag3': df['total_revenue'].iloc[-3] if len(df) >= 3 else last_revenue,
+        'lag6': df['total_revenue'].iloc[-6] if len(df) >= 6 else last_revenue,
+        'ma3': df['total_revenue'].iloc[-3:].mean() if len(df) >= 3 else last_revenue,
+        'ma6': df['total_revenue'].iloc[-6:].mean() if len(df) >= 6 else last_revenue
+    }
+
+    for i, date in enumerate(future_dates):
+        month = date.month
+        features = {
+            'month': month,
+            'year': date.year,
+            'quarter': (month - 1) // 3 + 1,
+            'month_index': last_index + i + 1,
+            'sin_month': np.sin(2 * np.pi * month / 12),
+            'cos_month': np.cos(2 * np.pi * month / 12),
+            'revenue_lag1': current_lags['lag1'],
+            'revenue_lag3': current_lags['lag3'],
+            'revenue_lag6': current_lags['lag6'],
+            'revenue_ma3': current_lags['ma3'],
+            'revenue_ma6': current_lags['ma6']
+        }
+
+        X_future = pd.DataFrame([features])[forecaster.feature_names]
+        pred = forecaster.predict(X_future)[0]
+        predictions.append({'year_month': date.strftime('%Y-%m'), 'predicted_revenue': max(0, pred)})
+
+        current_lags['lag1'] = pred
+        if i >= 2:
+            current_lags['lag3'] = predictions[i - 2]['predicted_revenue']
+        if i >= 5:
+            current_lags['lag6'] = predictions[i - 5]['predicted_revenue']
+        current_lags['ma3'] = np.mean([p['predicted_revenue'] for p in predictions[-3:]])
+        current_lags['ma6'] = np.mean([p['predicted_revenue'] for p in predictions[-6:]])
+
+    return pd.DataFrame(predictions)
+
+
+def monthly_history(years: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    months = years * 12
+    index = np.arange(months)
+    revenue = 4e12 * (1 + 0.01 * index) * (1 + 0.1 * np.sin(2 * np.pi * index / 12)) * rng.uniform(0.95, 1.05, months)
+    return pd.DataFrame({
+        'year_month': pd.date_range('2015-01-01', periods=months, freq='MS').strftime('%Y-%m'),
+        'total_revenue': revenue
+    })
+
+
+def time_call(fn, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def bench_forecast(years: int = 10, repeats: int = 20):
+    warnings.filterwarnings('ignore', category=FutureWarning)
+    print("=" * 70)
+    print(f"BENCHMARK RECURSIVE FORECAST ({years}-year monthly history, ms per call)")
+    print("=" * 70)
+
+    history = monthly_history(years)
+    forecaster = RevenueForecasting()
+    features = forecaster.prepare_features(history)
+    forecaster.fit(features[RevenueForecasting.FEATURE_COLUMNS], features['total_revenue'])
+
+    print(f"{'Horizon':>8} {'Per-step DF':>14} {'NumPy':>10} {'Speedup':>10} {'Max rel diff':>14}")
+    print("-" * 70)
+    for months in (1, 12, 24, 36, 72):
+        legacy = legacy_forecast_next_months(forecaster, history, months)['predicted_revenue'].to_numpy()
+        current = forecaster.forecast_next_months(history, months)['predicted_revenue'].to_numpy()
+        max_diff = np.max(np.abs(current - legacy) / np.maximum(np.abs(legacy), 1))
+
+        legacy_ms = time_call(lambda: legacy_forecast_next_months(forecaster, history, months), repeats)
+        current_ms = time_call(lambda: forecaster.forecast_next_months(history, months), repeats)
+        print(f"{months:>7}m {legacy_ms:>14.2f} {current_ms:>10.2f} {legacy_ms / current_ms:>9.1f}x {max_diff:>14.1e}")
+
+
+if __name__ == "__main__":
+    bench_forecast(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,53 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.utils.generator import DataGenerator
+
+
+def bench_generator(years: int = 10, repeats: int = 3):
+    print("=" * 70)
+    print(f"BENCHMARK DATA GENERATOR ({years} years, in-memory frames)")
+    print("=" * 70)
+
+    start_date, end_date = f"{2025 - years}-01-01", "2024-12-31"
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for engine in DataGenerator.ENGINES:
+            generator = DataGenerator(
+                str(Path(tmp_dir) / "lottery_results.csv"),
+                str(Path(tmp_dir) / "revenue_data.csv"),
+                engine=engine,
+                seed=42
+            )
+            generator.build(start_date, end_date)
+            started = time.perf_counter()
+            for _ in range(repeats):
+                lottery_df, revenue_df = generator.build(start_date, end_date)
+            seconds = (time.perf_counter() - started) / repeats
+            results[engine] = (seconds, lottery_df, revenue_df)
+
+    print(f"{'Engine':<10} {'Lottery':>10} {'Revenue':>10} {'Seconds':>10} {'Rows/sec':>14}")
+    print("-" * 70)
+    for engine, (seconds, lottery_df, revenue_df) in results.items():
+        rows = len(lottery_df) + len(revenue_df)
+        print(f"{engine:<10} {len(lottery_df):>10,} {len(revenue_df):>10,} {seconds:>10.3f} {rows / seconds:>14,.0f}")
+    print(f"\nSpeedup: {results['python'][0] / results['numpy'][0]:.1f}x")
+
+    print(f"\n{'Statistic':<28} {'python':>18} {'numpy':>18}")
+    print("-" * 70)
+    stats = {
+        'tickets_sold mean': lambda r: r['tickets_sold'].mean(),
+        'tickets_sold std': lambda r: r['tickets_sold'].std(),
+        'net_profit mean': lambda r: r['net_profit'].mean(),
+        'agencies per station-day': lambda r: len(r) / r.groupby(['sale_date', 'station_name'], observed=True).ngroups,
+        'Cấp 1 share': lambda r: (r['agency_type'] == 'Cấp 1').mean()
+    }
+    for name, stat in stats.items():
+        print(f"{name:<28} {stat(results['python'][2]):>18,.3f} {stat(results['numpy'][2]):>18,.3f}")
+
+
+if __name__ == "__main__":
+    bench_generator(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,88 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src import WarehouseFacade
+from src.analysis.lottery import LotteryAnalysis
+
+
+LEGACY_QUERY = """
+SELECT
+    SUBSTR(l.result_number, -{digit_length}) as number,
+    COUNT(*) as frequency,
+    MAX(d.full_date) as last_appeared,
+    MIN(d.full_date) as first_appeared,
+    CASE
+        WHEN COUNT(*) >= (
+            SELECT AVG(cnt) * 1.2
+            FROM (
+                SELECT SUBSTR(result_number, -{digit_length}) as num, COUNT(*) as cnt
+                FROM Fact_Lottery_Result
+                JOIN Dim_Date ON Fact_Lottery_Result.date_id = Dim_Date.date_id
+                WHERE Dim_Date.full_date >= date('{anchor}', '-{period_days} days')
+                GROUP BY num
+            )
+        ) THEN 'Hot'
+        WHEN COUNT(*) <= (
+            SELECT AVG(cnt) * 0.8
+            FROM (
+                SELECT SUBSTR(result_number, -{digit_length}) as num, COUNT(*) as cnt
+                FROM Fact_Lottery_Result
+                JOIN Dim_Date ON Fact_Lottery_Result.date_id = Dim_Date.date_id
+                WHERE Dim_Date.full_date >= date('{anchor}', '-{period_days} days')
+                GROUP BY num
+            )
+        ) THEN 'Cold'
+        ELSE 'Normal'
+    END as status
+FROM Fact_Lottery_Result l
+JOIN Dim_Date d ON l.date_id = d.date_id
+WHERE d.full_date >= date('{anchor}', '-{period_days} days')
+GROUP BY number
+ORDER BY frequency DESC
+"""
+
+
+def time_call(fn, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def bench_hot_cold(years: int = 10, repeats: int = 20):
+    print("=" * 70)
+    print(f"BENCHMARK HOT/COLD NUMBERS ({years}-year warehouse, ms per call)")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        facade = WarehouseFacade(
+            db_path=str(Path(tmp_dir) / "warehouse.db"),
+            lottery_csv=str(Path(tmp_dir) / "lottery_results.csv"),
+            revenue_csv=str(Path(tmp_dir) / "revenue_data.csv")
+        )
+        facade.generate_raw_data(f"{2025 - years}-01-01", "2024-12-31")
+        facade.initialize_database()
+        facade.load_data_to_warehouse()
+
+        lottery = LotteryAnalysis(facade.db_connection)
+        anchor = "2024-12-31"
+
+        print(f"{'Window':>10} {'Legacy SQL':>15} {'Single pass':>15} {'Speedup':>10}")
+        print("-" * 70)
+        for period_days in (30, 365, 365 * years):
+            legacy_query = LEGACY_QUERY.format(digit_length=2, period_days=period_days, anchor=anchor)
+            legacy_ms = time_call(lambda: facade.db_connection.fetchall(legacy_query), repeats)
+            new_ms = time_call(
+                lambda: lottery.get_hot_cold_numbers(digit_length=2, period_days=period_days, anchor=anchor),
+                repeats
+            )
+            print(f"{period_days:>9}d {legacy_ms:>15.2f} {new_ms:>15.2f} {legacy_ms / new_ms:>9.1f}x")
+
+        facade.close()
+
+
+if __name__ == "__main__":
+    bench_hot_cold(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,104 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.database.connection import DatabaseConnection
+from src.database.schema import SchemaManager
+from src.etl.transformer import DataTransformer
+from src.etl.loader import DataLoader
+
+
+DEFAULT_SIZES = [1_000_000, 10_000_000]
+LEGACY_ROW_LIMIT = 2_000_000
+
+
+def make_fact_lottery(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    stations = np.array(['Hà Nội', 'TP Hồ Chí Minh', 'Đà Nẵng', 'Cần Thơ', 'An Giang',
+                         'Bình Dương', 'Đồng Nai', 'Kiên Giang', 'Tây Ninh', 'Vũng Tàu'])
+    prizes = np.array(['Đặc biệt', 'Nhất', 'Nhì', 'Ba', 'Tư', 'Năm', 'Sáu', 'Bảy'])
+    dates = pd.date_range('2015-01-01', periods=3650, freq='D').strftime('%Y%m%d').astype(int).to_numpy()
+
+    return pd.DataFrame({
+        'date_id': rng.choice(dates, rows),
+        'station_name': rng.choice(stations, rows),
+        'prize_name': rng.choice(prizes, rows),
+        'prize_sequence': rng.integers(1, 8, rows),
+        'result_number': pd.Series(rng.integers(0, 1_000_000, rows)).map('{:06d}'.format)
+    })
+
+
+def legacy_load_fact_lottery(loader: DataLoader) -> int:
+    fact_lottery = loader.transformer.get_fact_lottery()
+    station_map = loader._get_station_id_map()
+    prize_map = loader._get_prize_id_map()
+
+    records = []
+    for _, row in fact_lottery.iterrows():
+        station_id = station_map.get(row['station_name'])
+        prize_id = prize_map.get(row['prize_name'])
+
+        if station_id and prize_id:
+            records.append((
+                row['date_id'],
+                station_id,
+                prize_id,
+                row['prize_sequence'],
+                row['result_number']
+            ))
+
+    query = """
+    INSERT OR IGNORE INTO Fact_Lottery_Result (date_id, station_id, prize_id, prize_sequence, result_number)
+    VALUES (?, ?, ?, ?, ?)
+    """
+    loader.db.executemany(query, records)
+    return len(records)
+
+
+def run_load(fact_lottery: pd.DataFrame, load_fn) -> float:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = DatabaseConnection(str(Path(tmp_dir) / "bench.db"))
+        db.connect()
+        schema = SchemaManager(db)
+        schema.create_all_tables()
+        schema.initialize_reference_data()
+
+        transformer = DataTransformer(fact_lottery.head(0), pd.DataFrame())
+        transformer.fact_lottery = fact_lottery
+        loader = DataLoader(db, transformer)
+
+        start = time.perf_counter()
+        load_fn(loader)
+        elapsed = time.perf_counter() - start
+        db.close()
+
+    return len(fact_lottery) / elapsed
+
+
+def bench_loader(sizes):
+    print("=" * 70)
+    print("BENCHMARK FACT LOADING (rows/sec)")
+    print("=" * 70)
+    print(f"{'Rows':>12} {'iterrows':>15} {'columnar':>15} {'Speedup':>10}")
+    print("-" * 70)
+
+    for rows in sizes:
+        fact_lottery = make_fact_lottery(rows)
+
+        columnar_rate = run_load(fact_lottery, lambda loader: loader._load_fact_lottery())
+        if rows <= LEGACY_ROW_LIMIT:
+            legacy_rate = run_load(fact_lottery, legacy_load_fact_lottery)
+        else:
+            # iterrows at this size takes hours; extrapolate from the largest measured sample
+            legacy_rate = run_load(fact_lottery.head(LEGACY_ROW_LIMIT), legacy_load_fact_lottery)
+
+        print(f"{rows:>12,} {legacy_rate:>15,.0f} {columnar_rate:>15,.0f} {columnar_rate / legacy_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    bench_loader(sizes)
@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.etl.extractor import DataExtractor
+from src.utils.staging import ColumnarStaging
+from src.utils.generator import DataGenerator
+
+
+def time_call(fn, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def bench_staging(years: int = 10, repeats: int = 5):
+    print("=" * 70)
+    print(f"BENCHMARK CSV vs PARQUET STAGING ({years} years of data)")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {
+            fmt: (str(Path(tmp_dir) / f"lottery.{fmt}"), str(Path(tmp_dir) / f"revenue.{fmt}"))
+            for fmt in ('csv', 'parquet')
+        }
+        lottery_df, revenue_df = DataGenerator(*paths['csv']).generate(f"{2025 - years}-01-01", "2024-12-31")
+        ColumnarStaging.write(lottery_df, paths['parquet'][0], DataExtractor.LOTTERY_DTYPES, 'draw_date')
+        ColumnarStaging.write(revenue_df, paths['parquet'][1], DataExtractor.REVENUE_DTYPES, 'sale_date')
+        print(f"Rows: lottery {len(lottery_df):,}, revenue {len(revenue_df):,}\n")
+
+        print(f"{'Source':<10} {'CSV size':>12} {'Parquet size':>14} {'Ratio':>8}")
+        print("-" * 70)
+        for index, source in enumerate(('lottery', 'revenue')):
+            csv_size = os.path.getsize(paths['csv'][index])
+            parquet_size = os.path.getsize(paths['parquet'][index])
+            print(f"{source:<10} {csv_size / 1024:>10,.0f}KB {parquet_size / 1024:>12,.0f}KB "
+                  f"{csv_size / parquet_size:>7.1f}x")
+
+        hwm = 20241130
+        cases = {
+            'full extract': lambda fmt: DataExtractor(*paths[fmt]).extract(),
+            'streamed chunks': lambda fmt: sum(
+                len(chunk[1]) + len(chunk[2]) for chunk in DataExtractor(*paths[fmt]).iter_chunks(50_000)
+            ),
+            'incremental (~1 month)': lambda fmt: DataExtractor(
+                *paths[fmt], high_water_marks={'lottery': hwm, 'revenue': hwm}
+            ).extract()
+        }
+
+        print(f"\n{'Read (ms)':<24} {'CSV':>10} {'Parquet':>10} {'Speedup':>10}")
+        print("-" * 70)
+        for name, case in cases.items():
+            csv_ms = time_call(lambda: case('csv'), repeats)
+            parquet_ms = time_call(lambda: case('parquet'), repeats)
+            print(f"{name:<24} {csv_ms:>10.1f} {parquet_ms:>10.1f} {csv_ms / parquet_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    bench_staging(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,50 @@
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from bench_forecast import monthly_history
+from src.forecasting import (
+    HoltWintersForecasting, SeasonalNaiveForecasting, StrategySelector, WalkForwardBacktester
+)
+
+
+def daily_panel(n_series: int, days: int, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    index = np.arange(days)
+    draw_days = (index % 7)[np.newaxis, :] == rng.integers(0, 7, (n_series, 1))
+    level = rng.uniform(1e7, 1e9, (n_series, 1)) * (1 + 0.0005 * index)
+    return level * draw_days * rng.uniform(0.9, 1.1, (n_series, days))
+
+
+def bench_strategies(years: int = 10, n_series: int = 2000, days: int = 365):
+    warnings.filterwarnings('ignore', category=FutureWarning)
+    print("=" * 70)
+    print(f"BENCHMARK STRATEGIES ({years}-year monthly history, walk-forward, horizon 12)")
+    print("=" * 70)
+
+    history = monthly_history(years)
+    backtester = WalkForwardBacktester(horizon=12, min_train=24)
+    print(f"{'Strategy':<20} {'Folds':>6} {'Backtest s':>11} {'MAE':>14} {'MAPE %':>8}")
+    print("-" * 70)
+    for name, strategy_factory in StrategySelector.DEFAULT_STRATEGIES.items():
+        started = time.perf_counter()
+        summary = backtester.summarize(backtester.run(history, strategy_factory))
+        elapsed = time.perf_counter() - started
+        print(f"{name:<20} {summary['folds'].iloc[0]:>6} {elapsed:>11.2f} "
+              f"{summary['MAE'].mean():>14,.0f} {summary['MAPE'].mean():>8.2f}")
+
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK DAILY PANEL ({n_series:,} series x {days} days, weekly season, 28-day horizon)")
+    print("=" * 70)
+    panel = daily_panel(n_series, days)
+    for strategy in (SeasonalNaiveForecasting(season_length=7), HoltWintersForecasting(season_length=7)):
+        started = time.perf_counter()
+        strategy.forecast_many(panel, 28)
+        elapsed = time.perf_counter() - started
+        print(f"{type(strategy).__name__:<28} {elapsed:>8.3f} s  {elapsed / n_series * 1e6:>8.1f} us/series")
+
+
+if __name__ == "__main__":
+    bench_strategies(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,76 @@
+import argparse
+import sys
+import tempfile
+import warnings
+
+from src.benchmark import BenchmarkSuite, compare_results, load_results, save_results
+
+
+def print_results(results: dict):
+    for scale, groups in results['scales'].items():
+        dataset = groups['dataset']
+        print("=" * 88)
+        print(f"{scale.upper()}: {dataset['lottery_records']:,} lottery + {dataset['revenue_records']:,} revenue rows, "
+              f"{dataset['stations']} stations, {dataset['agencies']} agencies")
+        print("=" * 88)
+        print(f"{'Benchmark':<62} {'p50 ms':>9} {'p95 ms':>9} {'peak MB':>8}")
+        for group in ('etl', 'analysis', 'forecasting'):
+            print("-" * 88)
+            for name, stats in groups[group].items():
+                peak = f"{stats['peak_mb']:.1f}" if stats['peak_mb'] is not None else '-'
+                print(f"{group + '.' + name:<62} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {peak:>8}")
+
+
+def print_comparison(comparisons: list, show_all: bool = False) -> int:
+    regressions = [c for c in comparisons if c['regression']]
+    rows = comparisons if show_all else regressions
+
+    print("\n" + "=" * 88)
+    print(f"COMPARISON: {len(regressions)} regression(s) in {len(comparisons)} metrics")
+    print("=" * 88)
+    for c in rows:
+        flag = 'REGRESSION' if c['regression'] else ''
+        print(f"{c['scale']:<6} {c['benchmark']:<58} {c['metric']:<8} "
+              f"{c['baseline']:>10.2f} -> {c['current']:>10.2f} {c['change']:>+8.1%} {flag}")
+    return len(regressions)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end ETL, analysis and forecasting benchmarks")
+    parser.add_argument('--scales', nargs='+', default=['sf1'], choices=list(BenchmarkSuite.SCALES))
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--etl-repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--staging', default='parquet', choices=['csv', 'parquet'])
+    parser.add_argument('--work-dir', help="Keep generated datasets here instead of a temporary directory")
+    parser.add_argument('--output', '-o', help="Write results as JSON")
+    parser.add_argument('--baseline', help="Compare against a stored results JSON")
+    parser.add_argument('--compare', metavar='RESULTS', help="Compare an existing results JSON instead of running")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Relative slowdown flagged as regression")
+    parser.add_argument('--show-all', action='store_true', help="Print every compared metric, not just regressions")
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore', category=FutureWarning)
+
+    if args.compare:
+        if not args.baseline:
+            parser.error("--compare requires --baseline")
+        results = load_results(args.compare)
+    elif args.work_dir:
+        results = BenchmarkSuite(args.work_dir, args.seed, args.repeats, args.etl_repeats, args.staging).run(args.scales)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = BenchmarkSuite(tmp_dir, args.seed, args.repeats, args.etl_repeats, args.staging).run(args.scales)
+
+    print_results(results)
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        comparisons = compare_results(results, load_results(args.baseline), threshold=args.threshold)
+        return 1 if print_comparison(comparisons, args.show_all) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from .revenue import RevenueAnalysis
 from .lottery import LotteryAnalysis
+from .cache import QueryCache
 
-__all__ = ['RevenueAnalysis', 'LotteryAnalysis']
+__all__ = ['RevenueAnalysis', 'LotteryAnalysis', 'QueryCache']
@@ -0,0 +1,181 @@
+import functools
+import hashlib
+import inspect
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+from ..database.metadata import WarehouseMetadata
+
+
+class QueryCache:
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        persist_dir: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        
+        self._entries: 'OrderedDict[Tuple, Tuple[pd.DataFrame, int]]' = OrderedDict()
+        self._versions: Dict[str, str] = {}
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'disk_hits': 0,
+            'disk_writes': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+        
+        if self.persist_dir is not None:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError("Parquet persistence requires pyarrow (pip install pyarrow)") from e
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+    
+    def get_or_compute(
+        self,
+        db_path: str,
+        data_version: str,
+        name: str,
+        arguments: Tuple,
+        compute: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        key = (db_path, name, arguments)
+        
+        with self._lock:
+            self._check_version(db_path, data_version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[0].copy()
+        
+        df = self._read_persisted(key, data_version)
+        if df is not None:
+            with self._lock:
+                self._stats['disk_hits'] += 1
+        else:
+            df = compute()
+            self._write_persisted(key, data_version, df)
+            with self._lock:
+                self._stats['misses'] += 1
+        
+        with self._lock:
+            if self._versions.get(db_path) == data_version:
+                self._store(key, df)
+        return df.copy()
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._size_bytes = 0
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['disk_hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'hit_rate': (self._stats['hits'] + self._stats['disk_hits']) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+    
+    def _check_version(self, db_path: str, data_version: str):
+        if self._versions.get(db_path) == data_version:
+            return
+        
+        stale = [key for key in self._entries if key[0] == db_path]
+        for key in stale:
+            self._size_bytes -= self._entries.pop(key)[1]
+        self._stats['invalidations'] += len(stale)
+        self._remove_persisted(db_path, data_version)
+        self._versions[db_path] = data_version
+    
+    def _store(self, key: Tuple, df: pd.DataFrame):
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        
+        if key in self._entries:
+            self._size_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (df, size)
+        self._size_bytes += size
+        
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._size_bytes > self.max_bytes
+        ):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+            self._stats['evictions'] += 1
+    
+    def _persisted_dir(self, db_path: str) -> Path:
+        return self.persist_dir / hashlib.sha1(db_path.encode()).hexdigest()[:16]
+    
+    def _persisted_path(self, key: Tuple, data_version: str) -> Path:
+        db_path, name, arguments = key
+        entry = hashlib.sha1(repr((name, arguments)).encode()).hexdigest()
+        return self._persisted_dir(db_path) / f"v{data_version}" / f"{entry}.parquet"
+    
+    def _read_persisted(self, key: Tuple, data_version: str) -> Optional[pd.DataFrame]:
+        if self.persist_dir is None:
+            return None
+        path = self._persisted_path(key, data_version)
+        if not path.exists():
+            return None
+        return pd.read_parquet(path)
+    
+    def _write_persisted(self, key: Tuple, data_version: str, df: pd.DataFrame):
+        if self.persist_dir is None:
+            return
+        path = self._persisted_path(key, data_version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        df.to_parquet(tmp_path, index=True)
+        tmp_path.replace(path)
+        with self._lock:
+            self._stats['disk_writes'] += 1
+    
+    def _remove_persisted(self, db_path: str, data_version: str):
+        if self.persist_dir is None:
+            return
+        db_dir = self._persisted_dir(db_path)
+        if not db_dir.exists():
+            return
+        for version_dir in db_dir.iterdir():
+            if version_dir.name != f"v{data_version}":
+                shutil.rmtree(version_dir, ignore_errors=True)
+
+
+def cached(method: Callable) -> Callable:
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return method(self, *args, **kwargs)
+        
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple((name, repr(value)) for name, value in bound.arguments.items() if name != 'self')
+        
+        return self.cache.get_or_compute(
+            self.db.db_path,
+            WarehouseMetadata(self.db).get_version_key(),
+            f"{type(self).__name__}.{method.__name__}",
+            arguments,
+            lambda: method(self, *args, **kwargs)
+        )
+    
+    return wrapper
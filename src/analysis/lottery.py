@@ -1,11 +1,53 @@
+import numpy as np
 import pandas as pd
+from typing import Dict, Optional
 from ..database.connection import DatabaseConnection
+from .cache import QueryCache, cached
 
 
 class LotteryAnalysis:
-    def __init__(self, db_connection: DatabaseConnection):
+    CUBE_SUFFIX_LENGTHS = (1, 2, 3)
+    
+    def __init__(self, db_connection: DatabaseConnection, cache: Optional[QueryCache] = None):
         self.db = db_connection
+        self.cache = cache
+    
+    def _suffix_source(self, digit_length: int, alias: str = 'l', keep_shorter: bool = False) -> Dict[str, str]:
+        # keep_shorter follows SUBSTR(result_number, -n), which returns a number shorter than n whole
+        if digit_length in self.CUBE_SUFFIX_LENGTHS:
+            source = {
+                'table': f"Agg_Lottery_Number_Count {alias}",
+                'key': f"{alias}.suffix",
+                'value': f"{alias}.suffix",
+                'label': f"printf('%0{digit_length}d', {alias}.suffix)",
+                'condition': f"{alias}.suffix_len = {digit_length}",
+                'count': f"SUM({alias}.frequency)",
+                'total': "(SELECT SUM(frequency) FROM Agg_Lottery_Number_Count WHERE suffix_len = 1)"
+            }
+            shorter = self.db.fetchall(
+                f"SELECT prize_id, digits FROM Dim_Prize WHERE digits < {digit_length}"
+            ) if keep_shorter else []
+            if shorter:
+                whole = [f"{alias}.prize_id = {row['prize_id']} AND {alias}.suffix_len = {row['digits']}" for row in shorter]
+                source.update({
+                    'key': f"{alias}.suffix_len, {alias}.suffix",
+                    'label': f"printf('%0*d', {alias}.suffix_len, {alias}.suffix)",
+                    'condition': "(" + " OR ".join([source['condition'], *whole]) + ")"
+                })
+            return source
+        
+        key = f"SUBSTR({alias}.result_number, -{digit_length})"
+        return {
+            'table': f"Fact_Lottery_Result {alias}",
+            'key': key,
+            'value': f"CAST({key} AS INTEGER)",
+            'label': key,
+            'condition': "1 = 1" if keep_shorter else f"LENGTH({alias}.result_number) >= {digit_length}",
+            'count': "COUNT(*)",
+            'total': "(SELECT COUNT(*) FROM Fact_Lottery_Result)"
+        }
     
+    @cached
     def get_daily_lottery_results(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
@@ -34,12 +76,9 @@ class LotteryAnalysis:
         
         query += " ORDER BY d.full_date DESC, s.station_name, p.prize_order, l.prize_sequence"
         
-        results = self.db.fetchall(query)
-        df = pd.DataFrame([dict(row) for row in results])
-        if not df.empty:
-            df['full_date'] = pd.to_datetime(df['full_date'])
-        return df
+        return self.db.fetch_df(query, dtypes={'full_date': 'datetime64[ns]'})
     
+    @cached
     def get_lottery_results_by_station(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
@@ -67,20 +106,35 @@ class LotteryAnalysis:
         ORDER BY draw_days DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
-    def get_number_frequency(self, digit_length: int = None, limit: int = 20) -> pd.DataFrame:
+    @cached
+    def get_number_frequency(
+        self,
+        digit_length: int = None,
+        limit: int = 20,
+        start_date: str = None,
+        end_date: str = None
+    ) -> pd.DataFrame:
+        conditions = []
+        if start_date:
+            conditions.append(f"d.full_date >= '{start_date}'")
+        if end_date:
+            conditions.append(f"d.full_date <= '{end_date}'")
+        date_join = "JOIN Dim_Date d ON l.date_id = d.date_id" if conditions else ""
+        
         if digit_length:
+            source = self._suffix_source(digit_length)
+            conditions.insert(0, source['condition'])
             query = f"""
             SELECT 
-                SUBSTR(l.result_number, -{digit_length}) as number_part,
-                COUNT(*) as frequency,
+                {source['label']} as number_part,
+                {source['count']} as frequency,
                 COUNT(DISTINCT l.date_id) as appeared_on_days
-            FROM Fact_Lottery_Result l
-            JOIN Dim_Prize p ON l.prize_id = p.prize_id
-            WHERE p.digits >= {digit_length}
-            GROUP BY number_part
+            FROM {source['table']}
+            {date_join}
+            WHERE {" AND ".join(conditions)}
+            GROUP BY {source['key']}
             ORDER BY frequency DESC
             LIMIT {limit}
             """
@@ -94,14 +148,51 @@ class LotteryAnalysis:
                 COUNT(DISTINCT l.station_id) as appeared_on_stations
             FROM Fact_Lottery_Result l
             JOIN Dim_Prize p ON l.prize_id = p.prize_id
+            {date_join}
+            """
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f"""
             GROUP BY l.result_number, p.prize_name
             ORDER BY frequency DESC
             LIMIT {limit}
             """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
+    
+    @cached
+    def get_number_frequency_by_station_prize(
+        self,
+        digit_length: int = 2,
+        start_date: str = None,
+        end_date: str = None
+    ) -> pd.DataFrame:
+        source = self._suffix_source(digit_length)
+        conditions = [source['condition']]
+        if start_date:
+            conditions.append(f"d.full_date >= '{start_date}'")
+        if end_date:
+            conditions.append(f"d.full_date <= '{end_date}'")
+        
+        query = f"""
+        SELECT 
+            s.station_name,
+            p.prize_name,
+            {source['label']} as number,
+            {source['count']} as frequency,
+            COUNT(DISTINCT l.date_id) as appeared_on_days
+        FROM {source['table']}
+        JOIN Dim_Date d ON l.date_id = d.date_id
+        JOIN Dim_Station s ON l.station_id = s.station_id
+        JOIN Dim_Prize p ON l.prize_id = p.prize_id
+        WHERE {" AND ".join(conditions)}
+        GROUP BY s.station_name, p.prize_name, {source['key']}
+        ORDER BY s.station_name, p.prize_name, frequency DESC
+        """
+        
+        return self.db.fetch_df(query)
     
+    @cached
     def get_prize_distribution(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
@@ -130,49 +221,64 @@ class LotteryAnalysis:
         ORDER BY p.prize_order
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
+    
+    def get_hot_cold_numbers(self, digit_length: int = 2, period_days: int = 30, anchor: str = 'latest') -> pd.DataFrame:
+        # Cached on the resolved date, so 'today' does not serve yesterday's window
+        end_date = self._resolve_anchor(anchor).strftime('%Y-%m-%d')
+        return self._get_hot_cold_numbers(digit_length, period_days, end_date)
     
-    def get_hot_cold_numbers(self, digit_length: int = 2, period_days: int = 30) -> pd.DataFrame:
+    @cached
+    def _get_hot_cold_numbers(self, digit_length: int, period_days: int, end_date: str) -> pd.DataFrame:
+        end = pd.Timestamp(end_date)
+        start = end - pd.Timedelta(days=period_days)
+        source = self._suffix_source(digit_length, keep_shorter=True)
+        
         query = f"""
         SELECT 
-            SUBSTR(l.result_number, -{digit_length}) as number,
-            COUNT(*) as frequency,
-            MAX(d.full_date) as last_appeared,
-            MIN(d.full_date) as first_appeared,
-            CASE 
-                WHEN COUNT(*) >= (
-                    SELECT AVG(cnt) * 1.2 
-                    FROM (
-                        SELECT SUBSTR(result_number, -{digit_length}) as num, COUNT(*) as cnt
-                        FROM Fact_Lottery_Result
-                        JOIN Dim_Date ON Fact_Lottery_Result.date_id = Dim_Date.date_id
-                        WHERE Dim_Date.full_date >= date('now', '-{period_days} days')
-                        GROUP BY num
-                    )
-                ) THEN 'Hot'
-                WHEN COUNT(*) <= (
-                    SELECT AVG(cnt) * 0.8
-                    FROM (
-                        SELECT SUBSTR(result_number, -{digit_length}) as num, COUNT(*) as cnt
-                        FROM Fact_Lottery_Result
-                        JOIN Dim_Date ON Fact_Lottery_Result.date_id = Dim_Date.date_id
-                        WHERE Dim_Date.full_date >= date('now', '-{period_days} days')
-                        GROUP BY num
-                    )
-                ) THEN 'Cold'
-                ELSE 'Normal'
-            END as status
-        FROM Fact_Lottery_Result l
-        JOIN Dim_Date d ON l.date_id = d.date_id
-        WHERE d.full_date >= date('now', '-{period_days} days')
-        GROUP BY number
-        ORDER BY frequency DESC
+            g.number,
+            g.frequency,
+            last_day.full_date as last_appeared,
+            first_day.full_date as first_appeared
+        FROM (
+            SELECT 
+                {source['label']} as number,
+                {source['count']} as frequency,
+                MAX(l.date_id) as last_date_id,
+                MIN(l.date_id) as first_date_id
+            FROM {source['table']}
+            WHERE {source['condition']}
+            AND l.date_id BETWEEN {start:%Y%m%d} AND {end:%Y%m%d}
+            GROUP BY {source['key']}
+        ) g
+        JOIN Dim_Date last_day ON last_day.date_id = g.last_date_id
+        JOIN Dim_Date first_day ON first_day.date_id = g.first_date_id
+        ORDER BY g.frequency DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        df = self.db.fetch_df(query)
+        if df.empty:
+            return df
+        
+        baseline = df['frequency'].mean()
+        df['status'] = np.select(
+            [df['frequency'] >= baseline * 1.2, df['frequency'] <= baseline * 0.8],
+            ['Hot', 'Cold'],
+            default='Normal'
+        )
+        return df
+    
+    def _resolve_anchor(self, anchor: str) -> pd.Timestamp:
+        if anchor == 'latest':
+            row = self.db.fetchone("SELECT MAX(date_id) as last_date_id FROM Agg_Lottery_Number_Count")
+            if row and row['last_date_id'] is not None:
+                return pd.to_datetime(str(row['last_date_id']), format='%Y%m%d')
+            anchor = 'today'
+        if anchor == 'today':
+            return pd.Timestamp.today().normalize()
+        return pd.Timestamp(anchor)
     
+    @cached
     def get_monthly_lottery_summary(self) -> pd.DataFrame:
         query = """
         SELECT 
@@ -189,50 +295,45 @@ class LotteryAnalysis:
         ORDER BY d.year, d.month
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_number_patterns(self, digit_length: int = 2) -> pd.DataFrame:
+        source = self._suffix_source(digit_length, keep_shorter=True)
         query = f"""
         SELECT 
-            SUBSTR(l.result_number, -{digit_length}) as number,
-            COUNT(*) as frequency,
-            ROUND(AVG(CAST(SUBSTR(l.result_number, -{digit_length}) AS INTEGER)), 2) as avg_value,
-            MIN(CAST(SUBSTR(l.result_number, -{digit_length}) AS INTEGER)) as min_value,
-            MAX(CAST(SUBSTR(l.result_number, -{digit_length}) AS INTEGER)) as max_value
-        FROM Fact_Lottery_Result l
-        GROUP BY number
-        HAVING frequency >= 10
+            {source['label']} as number,
+            {source['count']} as frequency,
+            ROUND(AVG({source['value']}), 2) as avg_value,
+            MIN({source['value']}) as min_value,
+            MAX({source['value']}) as max_value
+        FROM {source['table']}
+        WHERE {source['condition']}
+        GROUP BY {source['key']}
+        HAVING {source['count']} >= 10
         ORDER BY frequency DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_consecutive_numbers(self, digit_length: int = 2, limit: int = 20) -> pd.DataFrame:
+        source = self._suffix_source(digit_length, keep_shorter=True)
         query = f"""
-        WITH numbered_results AS (
-            SELECT 
-                l.result_number,
-                SUBSTR(l.result_number, -{digit_length}) as number,
-                d.full_date,
-                ROW_NUMBER() OVER (ORDER BY d.full_date) as rn
-            FROM Fact_Lottery_Result l
-            JOIN Dim_Date d ON l.date_id = d.date_id
-        )
         SELECT 
-            number,
-            COUNT(*) as appearance_count,
-            COUNT(*) * 100.0 / (SELECT COUNT(*) FROM numbered_results) as appearance_rate
-        FROM numbered_results
-        GROUP BY number
+            {source['label']} as number,
+            {source['count']} as appearance_count,
+            {source['count']} * 100.0 / {source['total']} as appearance_rate
+        FROM {source['table']}
+        WHERE {source['condition']}
+        GROUP BY {source['key']}
         ORDER BY appearance_count DESC
         LIMIT {limit}
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_results_by_day_of_week(self) -> pd.DataFrame:
         query = """
         SELECT 
@@ -256,9 +357,9 @@ class LotteryAnalysis:
             END
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_special_prize_history(self, start_date: str = None, end_date: str = None, limit: int = 50) -> pd.DataFrame:
         query = """
         SELECT 
@@ -284,27 +385,39 @@ class LotteryAnalysis:
         
         query += f" ORDER BY d.full_date DESC LIMIT {limit}"
         
-        results = self.db.fetchall(query)
-        df = pd.DataFrame([dict(row) for row in results])
-        if not df.empty:
-            df['full_date'] = pd.to_datetime(df['full_date'])
-        return df
+        return self.db.fetch_df(query, dtypes={'full_date': 'datetime64[ns]'})
     
+    @cached
     def get_digit_frequency_analysis(self, position: int = -1) -> pd.DataFrame:
+        if -position in self.CUBE_SUFFIX_LENGTHS:
+            source = self._suffix_source(-position)
+            digit = f"({source['value']} / {10 ** (-position - 1)}) % 10"
+            source['key'], source['label'] = digit, f"CAST({digit} AS TEXT)"
+        else:
+            key = f"SUBSTR(l.result_number, {position}, 1)"
+            source = {
+                'table': "Fact_Lottery_Result l",
+                'key': key,
+                'label': key,
+                'condition': f"LENGTH(l.result_number) >= ABS({position})",
+                'count': "COUNT(*)",
+                'total': "(SELECT COUNT(*) FROM Fact_Lottery_Result)"
+            }
+        
         query = f"""
         SELECT 
-            SUBSTR(l.result_number, {position}, 1) as digit,
-            COUNT(*) as frequency,
-            COUNT(*) * 100.0 / (SELECT COUNT(*) FROM Fact_Lottery_Result) as percentage
-        FROM Fact_Lottery_Result l
-        WHERE LENGTH(l.result_number) >= ABS({position})
-        GROUP BY digit
+            {source['label']} as digit,
+            {source['count']} as frequency,
+            {source['count']} * 100.0 / {source['total']} as percentage
+        FROM {source['table']}
+        WHERE {source['condition']}
+        GROUP BY {source['key']}
         ORDER BY frequency DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_station_prize_summary(self, station_name: str = None) -> pd.DataFrame:
         query = """
         SELECT 
@@ -325,5 +438,4 @@ class LotteryAnalysis:
         ORDER BY s.station_name, p.prize_name
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
@@ -1,26 +1,30 @@
 import pandas as pd
+from typing import Optional
 from ..database.connection import DatabaseConnection
+from .cache import QueryCache, cached
 
 
 class RevenueAnalysis:
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(self, db_connection: DatabaseConnection, cache: Optional[QueryCache] = None):
         self.db = db_connection
+        self.cache = cache
     
+    @cached
     def get_daily_revenue_trend(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
             d.full_date,
             d.day_of_week,
             d.is_weekend,
-            SUM(r.tickets_sold) as tickets_sold,
-            SUM(r.total_revenue) as total_revenue,
-            SUM(r.total_payout) as total_payout,
-            SUM(r.net_profit) as net_profit,
-            SUM(r.commission) as commission,
-            COUNT(DISTINCT r.station_id) as active_stations,
-            COUNT(DISTINCT r.agency_id) as active_agencies
-        FROM Fact_Revenue r
-        JOIN Dim_Date d ON r.date_id = d.date_id
+            a.tickets_sold,
+            a.total_revenue,
+            a.total_payout,
+            a.net_profit,
+            a.commission,
+            a.active_stations,
+            a.active_agencies
+        FROM Agg_Revenue_Daily a
+        JOIN Dim_Date d ON a.date_id = d.date_id
         """
         
         conditions = []
@@ -32,52 +36,83 @@ class RevenueAnalysis:
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
         
-        query += """
-        GROUP BY d.full_date, d.day_of_week, d.is_weekend
-        ORDER BY d.full_date
-        """
+        query += " ORDER BY d.full_date"
         
-        results = self.db.fetchall(query)
-        df = pd.DataFrame([dict(row) for row in results])
-        if not df.empty:
-            df['full_date'] = pd.to_datetime(df['full_date'])
-        return df
+        return self.db.fetch_df(query, dtypes={'full_date': 'datetime64[ns]'})
     
+    @cached
     def get_monthly_revenue_summary(self) -> pd.DataFrame:
         query = """
         SELECT 
             d.year,
             d.month,
             d.year || '-' || printf('%02d', d.month) as year_month,
-            SUM(r.tickets_sold) as tickets_sold,
-            SUM(r.total_revenue) as total_revenue,
-            SUM(r.total_payout) as total_payout,
-            SUM(r.net_profit) as net_profit,
-            SUM(r.commission) as commission,
-            AVG(r.total_revenue) as avg_daily_revenue
-        FROM Fact_Revenue r
-        JOIN Dim_Date d ON r.date_id = d.date_id
+            SUM(a.tickets_sold) as tickets_sold,
+            SUM(a.total_revenue) as total_revenue,
+            SUM(a.total_payout) as total_payout,
+            SUM(a.net_profit) as net_profit,
+            SUM(a.commission) as commission,
+            SUM(a.total_revenue) / SUM(a.transactions) as avg_daily_revenue
+        FROM Agg_Revenue_Daily a
+        JOIN Dim_Date d ON a.date_id = d.date_id
         GROUP BY d.year, d.month
         ORDER BY d.year, d.month
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
+    def get_monthly_revenue_by_station_agency(self) -> pd.DataFrame:
+        query = """
+        SELECT 
+            s.station_name,
+            ag.agency_name,
+            d.year || '-' || printf('%02d', d.month) as year_month,
+            SUM(f.tickets_sold) as tickets_sold,
+            SUM(f.total_revenue) as total_revenue
+        FROM Fact_Revenue f
+        JOIN Dim_Date d ON f.date_id = d.date_id
+        JOIN Dim_Station s ON f.station_id = s.station_id
+        JOIN Dim_Agency ag ON f.agency_id = ag.agency_id
+        GROUP BY f.station_id, f.agency_id, d.year, d.month
+        ORDER BY s.station_name, ag.agency_name, d.year, d.month
+        """
+        
+        return self.db.fetch_df(query)
+    
+    @cached
+    def get_daily_revenue_by_station_agency(self) -> pd.DataFrame:
+        query = """
+        SELECT 
+            s.station_name,
+            ag.agency_name,
+            d.full_date,
+            SUM(f.total_revenue) as total_revenue
+        FROM Fact_Revenue f
+        JOIN Dim_Date d ON f.date_id = d.date_id
+        JOIN Dim_Station s ON f.station_id = s.station_id
+        JOIN Dim_Agency ag ON f.agency_id = ag.agency_id
+        GROUP BY f.station_id, f.agency_id, f.date_id
+        ORDER BY s.station_name, ag.agency_name, d.full_date
+        """
+        
+        return self.db.fetch_df(query, dtypes={'full_date': 'datetime64[ns]'})
+    
+    @cached
     def get_revenue_by_station(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
             s.station_name,
             s.region,
-            COUNT(DISTINCT r.date_id) as active_days,
-            SUM(r.tickets_sold) as tickets_sold,
-            SUM(r.total_revenue) as total_revenue,
-            SUM(r.total_payout) as total_payout,
-            SUM(r.net_profit) as net_profit,
-            AVG(r.total_revenue) as avg_revenue_per_day
-        FROM Fact_Revenue r
-        JOIN Dim_Station s ON r.station_id = s.station_id
-        JOIN Dim_Date d ON r.date_id = d.date_id
+            COUNT(*) as active_days,
+            SUM(a.tickets_sold) as tickets_sold,
+            SUM(a.total_revenue) as total_revenue,
+            SUM(a.total_payout) as total_payout,
+            SUM(a.net_profit) as net_profit,
+            SUM(a.total_revenue) / SUM(a.transactions) as avg_revenue_per_day
+        FROM Agg_Revenue_Daily_Station a
+        JOIN Dim_Station s ON a.station_id = s.station_id
+        JOIN Dim_Date d ON a.date_id = d.date_id
         """
         
         conditions = []
@@ -94,9 +129,9 @@ class RevenueAnalysis:
         ORDER BY total_revenue DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_revenue_by_agency(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
@@ -126,20 +161,20 @@ class RevenueAnalysis:
         ORDER BY total_revenue DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_revenue_by_day_of_week(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         query = """
         SELECT 
             d.day_of_week,
             d.is_weekend,
-            COUNT(*) as transactions,
-            SUM(r.tickets_sold) as tickets_sold,
-            SUM(r.total_revenue) as total_revenue,
-            AVG(r.total_revenue) as avg_revenue
-        FROM Fact_Revenue r
-        JOIN Dim_Date d ON r.date_id = d.date_id
+            SUM(a.transactions) as transactions,
+            SUM(a.tickets_sold) as tickets_sold,
+            SUM(a.total_revenue) as total_revenue,
+            SUM(a.total_revenue) / SUM(a.transactions) as avg_revenue
+        FROM Agg_Revenue_Daily a
+        JOIN Dim_Date d ON a.date_id = d.date_id
         """
         
         conditions = []
@@ -165,29 +200,29 @@ class RevenueAnalysis:
             END
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_quarterly_performance(self) -> pd.DataFrame:
         query = """
         SELECT 
             d.year,
             d.quarter,
             d.year || '-Q' || d.quarter as year_quarter,
-            SUM(r.tickets_sold) as tickets_sold,
-            SUM(r.total_revenue) as total_revenue,
-            SUM(r.total_payout) as total_payout,
-            SUM(r.net_profit) as net_profit,
-            AVG(r.total_revenue) as avg_daily_revenue
-        FROM Fact_Revenue r
-        JOIN Dim_Date d ON r.date_id = d.date_id
+            SUM(a.tickets_sold) as tickets_sold,
+            SUM(a.total_revenue) as total_revenue,
+            SUM(a.total_payout) as total_payout,
+            SUM(a.net_profit) as net_profit,
+            SUM(a.total_revenue) / SUM(a.transactions) as avg_daily_revenue
+        FROM Agg_Revenue_Daily a
+        JOIN Dim_Date d ON a.date_id = d.date_id
         GROUP BY d.year, d.quarter
         ORDER BY d.year, d.quarter
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_top_performing_combinations(self, limit: int = 10) -> pd.DataFrame:
         query = f"""
         SELECT 
@@ -206,26 +241,26 @@ class RevenueAnalysis:
         LIMIT {limit}
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_weekend_vs_weekday_comparison(self) -> pd.DataFrame:
         query = """
         SELECT 
             CASE WHEN d.is_weekend = 1 THEN 'Weekend' ELSE 'Weekday' END as period_type,
-            COUNT(DISTINCT d.date_id) as days,
-            COUNT(*) as transactions,
-            SUM(r.tickets_sold) as tickets_sold,
-            SUM(r.total_revenue) as total_revenue,
-            AVG(r.total_revenue) as avg_revenue
-        FROM Fact_Revenue r
-        JOIN Dim_Date d ON r.date_id = d.date_id
+            COUNT(*) as days,
+            SUM(a.transactions) as transactions,
+            SUM(a.tickets_sold) as tickets_sold,
+            SUM(a.total_revenue) as total_revenue,
+            SUM(a.total_revenue) / SUM(a.transactions) as avg_revenue
+        FROM Agg_Revenue_Daily a
+        JOIN Dim_Date d ON a.date_id = d.date_id
         GROUP BY d.is_weekend
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_revenue_growth_rate(self, period: str = 'month') -> pd.DataFrame:
         if period == 'month':
             query = """
@@ -234,9 +269,9 @@ class RevenueAnalysis:
                     d.year,
                     d.month,
                     d.year || '-' || printf('%02d', d.month) as period,
-                    SUM(r.total_revenue) as total_revenue
-                FROM Fact_Revenue r
-                JOIN Dim_Date d ON r.date_id = d.date_id
+                    SUM(a.total_revenue) as total_revenue
+                FROM Agg_Revenue_Daily a
+                JOIN Dim_Date d ON a.date_id = d.date_id
                 GROUP BY d.year, d.month
                 ORDER BY d.year, d.month
             )
@@ -258,9 +293,9 @@ class RevenueAnalysis:
                     d.year,
                     d.quarter,
                     d.year || '-Q' || d.quarter as period,
-                    SUM(r.total_revenue) as total_revenue
-                FROM Fact_Revenue r
-                JOIN Dim_Date d ON r.date_id = d.date_id
+                    SUM(a.total_revenue) as total_revenue
+                FROM Agg_Revenue_Daily a
+                JOIN Dim_Date d ON a.date_id = d.date_id
                 GROUP BY d.year, d.quarter
                 ORDER BY d.year, d.quarter
             )
@@ -276,28 +311,30 @@ class RevenueAnalysis:
             ORDER BY period
             """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
     
+    @cached
     def get_lottery_number_revenue_impact(self) -> pd.DataFrame:
         query = """
+        WITH draws AS (
+            SELECT date_id, suffix, SUM(frequency) as draws
+            FROM Agg_Lottery_Number_Count
+            WHERE suffix_len = 2
+            GROUP BY date_id, suffix
+        )
         SELECT 
-            SUBSTR(lr.result_number, -2) as last_two_digits,
-            COUNT(DISTINCT d1.full_date) as occurrence_count,
-            AVG(r.total_revenue) as avg_next_day_revenue,
-            SUM(r.total_revenue) as total_next_day_revenue,
-            MIN(r.total_revenue) as min_next_day_revenue,
-            MAX(r.total_revenue) as max_next_day_revenue
-        FROM Fact_Lottery_Result lr
-        JOIN Dim_Date d1 ON lr.date_id = d1.date_id
-        JOIN Dim_Date d2 ON d2.full_date = DATE(d1.full_date, '+1 day')
-        JOIN Fact_Revenue r ON r.date_id = d2.date_id
-        WHERE lr.result_number IS NOT NULL 
-        AND LENGTH(lr.result_number) >= 2
-        GROUP BY last_two_digits
-        HAVING COUNT(DISTINCT d1.full_date) >= 3
+            printf('%02d', dr.suffix) as last_two_digits,
+            COUNT(*) as occurrence_count,
+            SUM(dr.draws * n.total_revenue) / SUM(dr.draws * n.transactions) as avg_next_day_revenue,
+            SUM(dr.draws * n.total_revenue) as total_next_day_revenue,
+            MIN(n.min_revenue) as min_next_day_revenue,
+            MAX(n.max_revenue) as max_next_day_revenue
+        FROM draws dr
+        JOIN Dim_Date d ON d.date_id = dr.date_id
+        JOIN Agg_Revenue_Daily n ON n.date_id = d.next_date_id
+        GROUP BY dr.suffix
+        HAVING COUNT(*) >= 3
         ORDER BY avg_next_day_revenue DESC
         """
         
-        results = self.db.fetchall(query)
-        return pd.DataFrame([dict(row) for row in results])
+        return self.db.fetch_df(query)
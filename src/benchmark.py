@@ -0,0 +1,254 @@
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from .warehouse_facade import WarehouseFacade
+from .analysis.revenue import RevenueAnalysis
+from .analysis.lottery import LotteryAnalysis
+
+
+class BenchmarkSuite:
+    # Each step is roughly 10x the rows of the previous one
+    SCALES = {
+        'sf1': {'years': 1, 'stations': 1, 'agencies': 1, 'draw_days_factor': 1},
+        'sf10': {'years': 2, 'stations': 5, 'agencies': 1, 'draw_days_factor': 1},
+        'sf100': {'years': 10, 'stations': 10, 'agencies': 1, 'draw_days_factor': 1}
+    }
+    START_DATE = '2015-01-01'
+    ETL_STAGES = ('extract', 'validate', 'transform', 'load', 'indexes', 'total')
+    
+    def __init__(
+        self,
+        work_dir: str,
+        seed: int = 42,
+        repeats: int = 10,
+        etl_repeats: int = 3,
+        staging: str = 'parquet'
+    ):
+        if staging not in ('csv', 'parquet'):
+            raise ValueError(f"Unknown staging format: {staging}. Choose from ['csv', 'parquet']")
+        
+        self.work_dir = Path(work_dir)
+        self.seed = seed
+        self.repeats = repeats
+        self.etl_repeats = etl_repeats
+        self.staging = staging
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+    
+    def run(self, scales: List[str], progress: Callable[[str], None] = print) -> Dict:
+        unknown = [scale for scale in scales if scale not in self.SCALES]
+        if unknown:
+            raise ValueError(f"Unknown scales: {unknown}. Choose from {list(self.SCALES)}")
+        
+        results = {'meta': self._meta(), 'scales': {}}
+        for scale in scales:
+            results['scales'][scale] = self.run_scale(scale, progress)
+        results['meta']['peak_rss_mb'] = self._peak_rss_mb()
+        return results
+    
+    def run_scale(self, scale: str, progress: Callable[[str], None] = print) -> Dict:
+        facade = WarehouseFacade(
+            db_path=str(self.work_dir / f"{scale}.db"),
+            lottery_csv=str(self.work_dir / f"{scale}_lottery.{self.staging}"),
+            revenue_csv=str(self.work_dir / f"{scale}_revenue.{self.staging}")
+        )
+        
+        progress(f"[{scale}] generating dataset")
+        started = time.perf_counter()
+        dataset = facade.generate_scaled_data(self.START_DATE, seed=self.seed, **self.SCALES[scale])
+        dataset['generate_seconds'] = round(time.perf_counter() - started, 4)
+        rows = dataset['lottery_records'] + dataset['revenue_records']
+        
+        progress(f"[{scale}] ETL x{self.etl_repeats}")
+        etl = self._bench_etl(facade, rows)
+        
+        try:
+            progress(f"[{scale}] analysis queries x{self.repeats}")
+            analysis = self._bench_analysis(facade.db_connection)
+            progress(f"[{scale}] forecasting x{self.repeats}")
+            forecasting = self._bench_forecasting(facade.db_connection)
+        finally:
+            facade.close()
+        
+        return {'dataset': dataset, 'etl': etl, 'analysis': analysis, 'forecasting': forecasting}
+    
+    def _bench_etl(self, facade: WarehouseFacade, rows: int) -> Dict:
+        samples = {stage: [] for stage in self.ETL_STAGES}
+        for _ in range(self.etl_repeats):
+            timings = self._load_fresh(facade)['timings']
+            for stage in self.ETL_STAGES:
+                samples[stage].append(timings[stage])
+        
+        tracemalloc.start()
+        try:
+            self._load_fresh(facade)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        return {
+            stage: self._summarize(seconds, rows=rows, peak_bytes=peak if stage == 'total' else None)
+            for stage, seconds in samples.items()
+        }
+    
+    def _load_fresh(self, facade: WarehouseFacade) -> Dict:
+        facade.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(f"{facade.db_path}{suffix}").unlink(missing_ok=True)
+        facade.initialize_database()
+        return facade.load_data_to_warehouse()
+    
+    def _bench_analysis(self, db_connection) -> Dict:
+        results = {}
+        for analysis in (RevenueAnalysis(db_connection), LotteryAnalysis(db_connection)):
+            for method_name, method in inspect.getmembers(analysis, inspect.ismethod):
+                if method_name.startswith('_'):
+                    continue
+                results[f"{type(analysis).__name__}.{method_name}"] = self._measure(method)
+        return results
+    
+    def _bench_forecasting(self, db_connection) -> Dict:
+        from .forecasting import (
+            BatchForecaster, ModelRegistry, RevenueForecasting, WalkForwardBacktester, train_revenue_model
+        )
+        
+        monthly = RevenueAnalysis(db_connection).get_monthly_revenue_summary()
+        trained, _ = train_revenue_model(db_connection)
+        features = trained.prepare_features(monthly)
+        X, y = features[trained.feature_names], features['total_revenue']
+        model_path = str(self.work_dir / "revenue_model.pkl")
+        trained.save_model(model_path)
+        registry_dir = str(self.work_dir / "models")
+        registry = ModelRegistry(registry_dir)
+        registry.get_or_train(db_connection)
+        
+        cases = {
+            'train_revenue_model': lambda: train_revenue_model(db_connection),
+            'RevenueForecasting.prepare_features': lambda: trained.prepare_features(monthly),
+            'RevenueForecasting.fit': lambda: RevenueForecasting().fit(X, y),
+            'RevenueForecasting.predict': lambda: trained.predict(X),
+            'RevenueForecasting.evaluate': lambda: trained.evaluate(X, y),
+            'RevenueForecasting.get_feature_importance': trained.get_feature_importance,
+            'RevenueForecasting.forecast_next_months': lambda: trained.forecast_next_months(monthly, months=12),
+            'RevenueForecasting.save_model': lambda: trained.save_model(model_path),
+            'RevenueForecasting.load_model': lambda: RevenueForecasting().load_model(model_path),
+            'ModelRegistry.get_or_train': lambda: registry.get_or_train(db_connection),
+            'ModelRegistry.load': lambda: ModelRegistry(registry_dir).get_or_train(db_connection),
+            'BatchForecaster.forecast': lambda: BatchForecaster(db_connection).forecast(months=12)
+        }
+        backtester = WalkForwardBacktester(horizon=12, min_train=12)
+        if backtester.origins(len(monthly)):
+            cases['WalkForwardBacktester.run'] = lambda: backtester.run(monthly)
+        return {name: self._measure(case) for name, case in cases.items()}
+    
+    def _measure(self, func: Callable) -> Dict:
+        func()
+        samples = []
+        for _ in range(self.repeats):
+            started = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - started)
+        
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        return self._summarize(samples, peak_bytes=peak)
+    
+    @staticmethod
+    def _summarize(seconds: List[float], rows: Optional[int] = None, peak_bytes: Optional[int] = None) -> Dict:
+        samples = np.array(seconds)
+        p50 = float(np.percentile(samples, 50))
+        if rows is None:
+            throughput, unit = 1 / p50 if p50 > 0 else None, 'calls/s'
+        else:
+            throughput, unit = rows / p50 if p50 > 0 else None, 'rows/s'
+        
+        return {
+            'samples': len(samples),
+            'p50_ms': round(p50 * 1000, 3),
+            'p95_ms': round(float(np.percentile(samples, 95)) * 1000, 3),
+            'mean_ms': round(float(samples.mean()) * 1000, 3),
+            'throughput': round(throughput, 1) if throughput is not None else None,
+            'throughput_unit': unit,
+            'peak_mb': round(peak_bytes / 1024 ** 2, 3) if peak_bytes is not None else None
+        }
+    
+    def _meta(self) -> Dict:
+        return {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': self.seed,
+            'repeats': self.repeats,
+            'etl_repeats': self.etl_repeats,
+            'staging': self.staging
+        }
+    
+    @staticmethod
+    def _peak_rss_mb() -> Optional[float]:
+        try:
+            import resource
+        except ImportError:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        bytes_per_unit = 1 if sys.platform == 'darwin' else 1024
+        return round(peak * bytes_per_unit / 1024 ** 2, 1)
+
+
+def save_results(results: Dict, path: str):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(
+    current: Dict,
+    baseline: Dict,
+    threshold: float = 0.25,
+    min_delta_ms: float = 1.0,
+    min_delta_mb: float = 1.0
+) -> List[Dict]:
+    comparisons = []
+    for scale, groups in current['scales'].items():
+        baseline_groups = baseline.get('scales', {}).get(scale)
+        if baseline_groups is None:
+            continue
+        
+        for group in ('etl', 'analysis', 'forecasting'):
+            for name, stats in groups.get(group, {}).items():
+                reference = baseline_groups.get(group, {}).get(name)
+                if reference is None:
+                    continue
+                
+                for metric, min_delta in (('p50_ms', min_delta_ms), ('p95_ms', min_delta_ms), ('peak_mb', min_delta_mb)):
+                    before, after = reference.get(metric), stats.get(metric)
+                    if before is None or after is None:
+                        continue
+                    change = (after - before) / before if before else 0.0
+                    comparisons.append({
+                        'scale': scale,
+                        'benchmark': f"{group}.{name}",
+                        'metric': metric,
+                        'baseline': before,
+                        'current': after,
+                        'change': round(change, 4),
+                        'regression': change > threshold and after - before > min_delta
+                    })
+    return comparisons
@@ -1,4 +1,7 @@
 from .connection import DatabaseConnection
+from .pool import ConnectionPool
 from .schema import SchemaManager
+from .metadata import WarehouseMetadata
+from .aggregates import AggregateManager
 
-__all__ = ['DatabaseConnection', 'SchemaManager']
+__all__ = ['DatabaseConnection', 'ConnectionPool', 'SchemaManager', 'WarehouseMetadata', 'AggregateManager']
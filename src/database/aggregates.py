@@ -0,0 +1,101 @@
+from typing import Dict, Iterable, Optional
+from .connection import DatabaseConnection
+
+
+class AggregateManager:
+    REVENUE_AGGREGATES = {
+        'Agg_Revenue_Daily': """
+            SELECT
+                date_id,
+                COUNT(*),
+                SUM(tickets_sold),
+                SUM(total_revenue),
+                SUM(total_payout),
+                SUM(net_profit),
+                SUM(commission),
+                COUNT(DISTINCT station_id),
+                COUNT(DISTINCT agency_id),
+                MIN(total_revenue),
+                MAX(total_revenue)
+            FROM Fact_Revenue
+            WHERE {date_filter}
+            GROUP BY date_id
+        """,
+        'Agg_Revenue_Daily_Station': """
+            SELECT
+                date_id,
+                station_id,
+                COUNT(*),
+                SUM(tickets_sold),
+                SUM(total_revenue),
+                SUM(total_payout),
+                SUM(net_profit),
+                SUM(commission)
+            FROM Fact_Revenue
+            WHERE {date_filter}
+            GROUP BY date_id, station_id
+        """
+    }
+    LOTTERY_AGGREGATES = {
+        'Agg_Lottery_Number_Count': """
+            SELECT date_id, station_id, prize_id, 1, last_digit, COUNT(*)
+            FROM Fact_Lottery_Result
+            WHERE {date_filter} AND last_digit IS NOT NULL
+            GROUP BY date_id, station_id, prize_id, last_digit
+            UNION ALL
+            SELECT date_id, station_id, prize_id, 2, last_two_digits, COUNT(*)
+            FROM Fact_Lottery_Result
+            WHERE {date_filter} AND last_two_digits IS NOT NULL
+            GROUP BY date_id, station_id, prize_id, last_two_digits
+            UNION ALL
+            SELECT date_id, station_id, prize_id, 3, last_three_digits, COUNT(*)
+            FROM Fact_Lottery_Result
+            WHERE {date_filter} AND last_three_digits IS NOT NULL
+            GROUP BY date_id, station_id, prize_id, last_three_digits
+        """
+    }
+    
+    def __init__(self, db_connection: DatabaseConnection):
+        self.db = db_connection
+    
+    def refresh(self, date_ids: Optional[Iterable[int]] = None):
+        self.refresh_revenue(date_ids)
+        self.refresh_lottery(date_ids)
+    
+    def refresh_revenue(self, date_ids: Optional[Iterable[int]] = None):
+        self._refresh(self.REVENUE_AGGREGATES, date_ids)
+    
+    def refresh_lottery(self, date_ids: Optional[Iterable[int]] = None):
+        self._refresh(self.LOTTERY_AGGREGATES, date_ids)
+    
+    def _refresh(self, aggregates: Dict[str, str], date_ids: Optional[Iterable[int]]):
+        date_filter = "1 = 1"
+        if date_ids is not None:
+            self._stage_dates(date_ids)
+            date_filter = "date_id IN (SELECT date_id FROM temp.Touched_Dates)"
+        
+        for table, select in aggregates.items():
+            self.db.execute(f"DELETE FROM {table} WHERE {date_filter}")
+            self.db.execute(f"INSERT INTO {table} {select.format(date_filter=date_filter)}")
+    
+    def ensure_populated(self):
+        sources = (
+            ('Agg_Revenue_Daily', 'Fact_Revenue', self.refresh_revenue),
+            ('Agg_Lottery_Number_Count', 'Fact_Lottery_Result', self.refresh_lottery)
+        )
+        for agg_table, fact_table, refresh in sources:
+            check = self.db.fetchone(f"""
+                SELECT
+                    (SELECT COUNT(*) FROM {agg_table}) as agg_cnt,
+                    (SELECT COUNT(*) FROM {fact_table}) as fact_cnt
+            """)
+            if check['agg_cnt'] == 0 and check['fact_cnt'] > 0:
+                refresh()
+    
+    def _stage_dates(self, date_ids: Iterable[int]):
+        self.db.execute("CREATE TEMP TABLE IF NOT EXISTS Touched_Dates (date_id INTEGER PRIMARY KEY)")
+        self.db.execute("DELETE FROM temp.Touched_Dates")
+        self.db.executemany(
+            "INSERT OR IGNORE INTO temp.Touched_Dates (date_id) VALUES (?)",
+            ((int(date_id),) for date_id in date_ids)
+        )
@@ -1,12 +1,59 @@
 import sqlite3
-from typing import Optional
+import pandas as pd
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 from pathlib import Path
 
 
 class DatabaseConnection:
-    def __init__(self, db_path: str = "database/lottery_warehouse.db"):
+    PRAGMA_PROFILES = {
+        'default': {
+            'synchronous': 'FULL',
+            'cache_size': -2000,
+            'temp_store': 'DEFAULT',
+            'locking_mode': 'NORMAL',
+            'mmap_size': 0,
+            'query_only': 'OFF'
+        },
+        'bulk-load': {
+            'journal_mode': 'WAL',
+            'synchronous': 'OFF',
+            'cache_size': -262144,
+            'temp_store': 'MEMORY',
+            'locking_mode': 'NORMAL',
+            'query_only': 'OFF'
+        },
+        'bulk-load-exclusive': {
+            'journal_mode': 'WAL',
+            'synchronous': 'OFF',
+            'cache_size': -262144,
+            'temp_store': 'MEMORY',
+            'locking_mode': 'EXCLUSIVE',
+            'query_only': 'OFF'
+        },
+        'read-serving': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -131072,
+            'temp_store': 'MEMORY',
+            'mmap_size': 268435456,
+            'query_only': 'ON'
+        }
+    }
+    
+    def __init__(
+        self,
+        db_path: str = "database/lottery_warehouse.db",
+        check_same_thread: bool = True,
+        read_only: bool = False,
+        profile: Optional[str] = None
+    ):
         self.db_path = db_path
+        self.check_same_thread = check_same_thread
+        self.read_only = read_only
+        self.profile = profile
         self.conn: Optional[sqlite3.Connection] = None
+        self._transaction_depth = 0
         self._ensure_db_directory()
     
     def _ensure_db_directory(self):
@@ -15,25 +62,91 @@ class DatabaseConnection:
     
     def connect(self) -> sqlite3.Connection:
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
+            if self.read_only:
+                self.conn = sqlite3.connect(
+                    f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=self.check_same_thread
+                )
+            else:
+                self.conn = sqlite3.connect(self.db_path, check_same_thread=self.check_same_thread)
             self.conn.row_factory = sqlite3.Row
+            if self.profile:
+                self.apply_profile(self.profile)
         return self.conn
     
+    def apply_profile(self, profile: str) -> Dict[str, object]:
+        if profile not in self.PRAGMA_PROFILES:
+            raise ValueError(f"Unknown pragma profile: {profile}. Choose from {list(self.PRAGMA_PROFILES)}")
+        
+        applied = {}
+        for pragma, value in self.PRAGMA_PROFILES[profile].items():
+            if pragma == 'journal_mode' and self.read_only:
+                continue
+            self.conn.execute(f"PRAGMA {pragma} = {value}")
+            applied[pragma] = self.conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+        self.profile = profile
+        return applied
+    
+    def is_healthy(self) -> bool:
+        if self.conn is None:
+            return False
+        try:
+            self.conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+    
     def close(self):
         if self.conn:
             self.conn.close()
             self.conn = None
+        self._transaction_depth = 0
+    
+    @property
+    def in_transaction(self) -> bool:
+        return self._transaction_depth > 0
+    
+    @contextmanager
+    def transaction(self) -> Iterator['DatabaseConnection']:
+        savepoint = None
+        if self._transaction_depth == 0:
+            self.conn.commit()
+            self.conn.execute("BEGIN IMMEDIATE")
+        else:
+            savepoint = f"sp_{self._transaction_depth}"
+            self.conn.execute(f"SAVEPOINT {savepoint}")
+        
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if savepoint is None:
+                self.conn.rollback()
+            elif self.conn.in_transaction:
+                self.conn.execute(f"ROLLBACK TO {savepoint}")
+                self.conn.execute(f"RELEASE {savepoint}")
+            raise
+        
+        self._transaction_depth -= 1
+        if savepoint is None:
+            self.conn.commit()
+        else:
+            self.conn.execute(f"RELEASE {savepoint}")
     
     def execute(self, query: str, params: tuple = ()):
         cursor = self.conn.cursor()
         cursor.execute(query, params)
-        self.conn.commit()
+        if not self.in_transaction:
+            self.conn.commit()
         return cursor
     
     def executemany(self, query: str, params: list):
         cursor = self.conn.cursor()
         cursor.executemany(query, params)
-        self.conn.commit()
+        if not self.in_transaction:
+            self.conn.commit()
         return cursor
     
     def fetchall(self, query: str, params: tuple = ()):
@@ -46,6 +159,20 @@ class DatabaseConnection:
         cursor.execute(query, params)
         return cursor.fetchone()
     
+    def fetch_df(self, query: str, params: tuple = (), dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        
+        names = [column[0] for column in cursor.description]
+        df = pd.DataFrame(cursor.fetchall(), columns=names)
+        for column, dtype in (dtypes or {}).items():
+            if dtype.startswith('datetime64'):
+                df[column] = pd.to_datetime(df[column], format='%Y-%m-%d').astype(dtype)
+            else:
+                df[column] = df[column].astype(dtype)
+        return df
+    
     def __enter__(self):
         self.connect()
         return self
@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from .connection import DatabaseConnection
+
+
+class WarehouseMetadata:
+    SOURCES = {
+        'lottery': 'Fact_Lottery_Result',
+        'revenue': 'Fact_Revenue'
+    }
+    
+    def __init__(self, db_connection: DatabaseConnection):
+        self.db = db_connection
+    
+    def get_high_water_mark(self, source: str) -> Optional[int]:
+        row = self.db.fetchone(
+            "SELECT last_date_id FROM Warehouse_Metadata WHERE source = ?",
+            (source,)
+        )
+        return row['last_date_id'] if row else None
+    
+    def get_high_water_marks(self) -> Dict[str, Optional[int]]:
+        return {source: self.get_high_water_mark(source) for source in self.SOURCES}
+    
+    def set_high_water_mark(self, source: str, last_date_id: int):
+        query = """
+        INSERT INTO Warehouse_Metadata (source, last_date_id, updated_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(source) DO UPDATE SET
+            last_date_id = excluded.last_date_id,
+            updated_at = excluded.updated_at
+        """
+        self.db.execute(query, (source, last_date_id, datetime.now().isoformat(timespec='seconds')))
+    
+    def refresh_high_water_marks(self) -> Dict[str, Optional[int]]:
+        for source, table in self.SOURCES.items():
+            row = self.db.fetchone(f"SELECT MAX(date_id) as last_date_id FROM {table}")
+            if row['last_date_id'] is not None:
+                self.set_high_water_mark(source, row['last_date_id'])
+        return self.get_high_water_marks()
+    
+    def get_data_version(self) -> int:
+        row = self.db.fetchone("SELECT data_version FROM Warehouse_Version WHERE id = 1")
+        return row['data_version'] if row else 0
+    
+    def get_build_version(self) -> Tuple[Optional[str], int]:
+        row = self.db.fetchone("SELECT build_id, data_version FROM Warehouse_Version WHERE id = 1")
+        return (row['build_id'], row['data_version']) if row else (None, 0)
+    
+    def get_version_key(self) -> str:
+        build_id, data_version = self.get_build_version()
+        return f"{build_id}-{data_version}" if build_id else '0'
+    
+    def bump_data_version(self) -> int:
+        query = """
+        INSERT INTO Warehouse_Version (id, data_version, build_id, updated_at)
+        VALUES (1, 1, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            data_version = data_version + 1,
+            updated_at = excluded.updated_at
+        """
+        self.db.execute(query, (uuid.uuid4().hex, datetime.now().isoformat(timespec='seconds')))
+        return self.get_data_version()
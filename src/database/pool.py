@@ -0,0 +1,135 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from .connection import DatabaseConnection
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        db_path: str = "database/lottery_warehouse.db",
+        size: int = 4,
+        timeout: float = 30.0,
+        read_profile: Optional[str] = 'read-serving'
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.read_profile = read_profile
+        
+        self._idle: List[DatabaseConnection] = []
+        self._open_readers = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._writer: Optional[DatabaseConnection] = None
+        self._writer_lock = threading.RLock()
+        self._metrics = {
+            'checkouts': 0,
+            'waits': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'health_check_failures': 0,
+            'writer_checkouts': 0
+        }
+    
+    @contextmanager
+    def reader(self) -> Iterator[DatabaseConnection]:
+        held = getattr(self._local, 'reader', None)
+        if held is not None:
+            yield held
+            return
+        
+        conn = self._acquire_reader()
+        self._local.reader = conn
+        try:
+            yield conn
+        finally:
+            self._local.reader = None
+            self._release_reader(conn)
+    
+    @contextmanager
+    def writer(self) -> Iterator[DatabaseConnection]:
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_healthy():
+                if self._writer is not None:
+                    self._writer.close()
+                    self._metrics['health_check_failures'] += 1
+                self._writer = DatabaseConnection(self.db_path, check_same_thread=False)
+                self._writer.connect()
+            self._metrics['writer_checkouts'] += 1
+            yield self._writer
+    
+    def _acquire_reader(self) -> DatabaseConnection:
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        
+        with self._cond:
+            while not self._idle and self._open_readers >= self.size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    raise TimeoutError(f"No database connection available after {self.timeout}s")
+            
+            waited = time.perf_counter() - started
+            self._metrics['checkouts'] += 1
+            if waited > 0.001:
+                self._metrics['waits'] += 1
+            self._metrics['total_wait_seconds'] += waited
+            self._metrics['max_wait_seconds'] = max(self._metrics['max_wait_seconds'], waited)
+            
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._open_readers += 1
+        
+        if conn is not None and conn.is_healthy():
+            return conn
+        if conn is not None:
+            conn.close()
+            with self._cond:
+                self._metrics['health_check_failures'] += 1
+        
+        try:
+            conn = DatabaseConnection(
+                self.db_path,
+                check_same_thread=False,
+                read_only=True,
+                profile=self.read_profile
+            )
+            conn.connect()
+        except Exception:
+            with self._cond:
+                self._open_readers -= 1
+                self._cond.notify()
+            raise
+        return conn
+    
+    def _release_reader(self, conn: DatabaseConnection):
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+    
+    def get_metrics(self) -> Dict:
+        with self._cond:
+            checkouts = self._metrics['checkouts']
+            return {
+                **self._metrics,
+                'avg_wait_ms': self._metrics['total_wait_seconds'] / checkouts * 1000 if checkouts else 0.0,
+                'size': self.size,
+                'open_connections': self._open_readers + (1 if self._writer is not None else 0),
+                'idle_connections': len(self._idle),
+                'readers_in_use': self._open_readers - len(self._idle)
+            }
+    
+    def close(self):
+        with self._cond:
+            for conn in self._idle:
+                conn.close()
+            self._open_readers -= len(self._idle)
+            self._idle.clear()
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
@@ -1,17 +1,55 @@
+import inspect
+import re
+import uuid
+from datetime import datetime
+import pandas as pd
+from typing import Dict, List, Optional
 from .connection import DatabaseConnection
 
 
 class SchemaManager:
+    MANAGED_INDEXES = {
+        'idx_fact_lottery_date_station': (
+            'Fact_Lottery_Result', 'date_id, station_id, prize_id, result_number'
+        ),
+        'idx_fact_lottery_last_digit': (
+            'Fact_Lottery_Result', 'last_digit, date_id'
+        ),
+        'idx_fact_lottery_last_two_digits': (
+            'Fact_Lottery_Result', 'last_two_digits, date_id'
+        ),
+        'idx_fact_lottery_last_three_digits': (
+            'Fact_Lottery_Result', 'last_three_digits, date_id'
+        ),
+        'idx_fact_revenue_date_station': (
+            'Fact_Revenue',
+            'date_id, station_id, agency_id, tickets_sold, total_revenue, total_payout, net_profit, commission'
+        ),
+        'idx_fact_revenue_station_agency': (
+            'Fact_Revenue', 'station_id, agency_id'
+        )
+    }
+    
     def __init__(self, db_connection: DatabaseConnection):
         self.db = db_connection
     
     def create_all_tables(self):
-        self._create_dim_date()
-        self._create_dim_station()
-        self._create_dim_prize()
-        self._create_dim_agency()
-        self._create_fact_lottery_result()
-        self._create_fact_revenue()
+        with self.db.transaction():
+            self._create_dim_date()
+            self._create_dim_station()
+            self._create_dim_prize()
+            self._create_dim_agency()
+            self._create_fact_lottery_result()
+            self._create_fact_revenue()
+            self._migrate_fact_lottery_suffixes()
+            self._migrate_result_number_padding()
+            self._migrate_dim_date_successor()
+            self._create_fact_unique_keys()
+            self._create_warehouse_metadata()
+            self._create_warehouse_version()
+            self._create_agg_revenue_daily()
+            self._create_agg_revenue_daily_station()
+            self._create_agg_lottery_number_count()
     
     def _create_dim_date(self):
         query = """
@@ -25,7 +63,8 @@ class SchemaManager:
             day_of_week TEXT NOT NULL,
             is_weekend INTEGER NOT NULL,
             is_month_start INTEGER NOT NULL,
-            is_month_end INTEGER NOT NULL
+            is_month_end INTEGER NOT NULL,
+            next_date_id INTEGER
         )
         """
         self.db.execute(query)
@@ -72,6 +111,10 @@ class SchemaManager:
             prize_id INTEGER NOT NULL,
             prize_sequence INTEGER NOT NULL,
             result_number TEXT NOT NULL,
+            last_digit INTEGER,
+            last_two_digits INTEGER,
+            last_three_digits INTEGER,
+            UNIQUE (date_id, station_id, prize_id, prize_sequence),
             FOREIGN KEY (date_id) REFERENCES Dim_Date(date_id),
             FOREIGN KEY (station_id) REFERENCES Dim_Station(station_id),
             FOREIGN KEY (prize_id) REFERENCES Dim_Prize(prize_id)
@@ -92,6 +135,7 @@ class SchemaManager:
             total_payout REAL NOT NULL,
             net_profit REAL NOT NULL,
             commission REAL NOT NULL,
+            UNIQUE (date_id, station_id, agency_id),
             FOREIGN KEY (date_id) REFERENCES Dim_Date(date_id),
             FOREIGN KEY (station_id) REFERENCES Dim_Station(station_id),
             FOREIGN KEY (agency_id) REFERENCES Dim_Agency(agency_id)
@@ -99,8 +143,232 @@ class SchemaManager:
         """
         self.db.execute(query)
     
+    def _migrate_fact_lottery_suffixes(self):
+        columns = {row['name'] for row in self.db.fetchall("PRAGMA table_info(Fact_Lottery_Result)")}
+        suffixes = {'last_digit': 1, 'last_two_digits': 2, 'last_three_digits': 3}
+        missing = [col for col in suffixes if col not in columns]
+        if not missing:
+            return
+        
+        for col in missing:
+            self.db.execute(f"ALTER TABLE Fact_Lottery_Result ADD COLUMN {col} INTEGER")
+        
+        # A correlated subquery rather than UPDATE ... FROM, which needs SQLite 3.33+
+        digits = "(SELECT p.digits FROM Dim_Prize p WHERE p.prize_id = Fact_Lottery_Result.prize_id)"
+        assignments = ", ".join(
+            f"{col} = CASE WHEN {digits} >= {length} THEN CAST(SUBSTR(result_number, -{length}) AS INTEGER) END"
+            for col, length in suffixes.items() if col in missing
+        )
+        self.db.execute(f"UPDATE Fact_Lottery_Result SET {assignments}")
+    
+    def _migrate_result_number_padding(self):
+        # Warehouses loaded before result numbers were read as text hold them without leading zeros
+        digits = "(SELECT p.digits FROM Dim_Prize p WHERE p.prize_id = Fact_Lottery_Result.prize_id)"
+        self.db.execute(f"""
+        UPDATE Fact_Lottery_Result
+        SET result_number = printf('%0*d', {digits}, CAST(result_number AS INTEGER))
+        WHERE LENGTH(result_number) < {digits}
+        """)
+    
+    def _migrate_dim_date_successor(self):
+        columns = {row['name'] for row in self.db.fetchall("PRAGMA table_info(Dim_Date)")}
+        if 'next_date_id' not in columns:
+            self.db.execute("ALTER TABLE Dim_Date ADD COLUMN next_date_id INTEGER")
+        
+        self.db.execute("""
+        UPDATE Dim_Date
+        SET next_date_id = CAST(strftime('%Y%m%d', full_date, '+1 day') AS INTEGER)
+        WHERE next_date_id IS NULL
+        """)
+    
+    def _create_fact_unique_keys(self):
+        # Warehouses created before the facts had a natural key may hold duplicated rows
+        # from repeated full loads; keep the first copy so the unique index can be built.
+        unique_keys = {
+            'ux_fact_lottery_grain': ('Fact_Lottery_Result', 'result_id',
+                                      'date_id, station_id, prize_id, prize_sequence'),
+            'ux_fact_revenue_grain': ('Fact_Revenue', 'revenue_id',
+                                      'date_id, station_id, agency_id')
+        }
+        for index_name, (table, row_id, columns) in unique_keys.items():
+            if self._has_unique_key(table, columns):
+                continue
+            self.db.execute(f"""
+            DELETE FROM {table}
+            WHERE {row_id} NOT IN (SELECT MIN({row_id}) FROM {table} GROUP BY {columns})
+            """)
+            self.db.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})")
+    
+    def _has_unique_key(self, table: str, columns: str) -> bool:
+        wanted = [col.strip() for col in columns.split(',')]
+        for index in self.db.fetchall(f"PRAGMA index_list({table})"):
+            if not index['unique']:
+                continue
+            index_columns = [col['name'] for col in self.db.fetchall(f"PRAGMA index_info('{index['name']}')")]
+            if index_columns == wanted:
+                return True
+        return False
+    
+    def _create_warehouse_metadata(self):
+        query = """
+        CREATE TABLE IF NOT EXISTS Warehouse_Metadata (
+            source TEXT PRIMARY KEY,
+            last_date_id INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+        self.db.execute(query)
+    
+    def _create_warehouse_version(self):
+        query = """
+        CREATE TABLE IF NOT EXISTS Warehouse_Version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            data_version INTEGER NOT NULL,
+            build_id TEXT,
+            updated_at TEXT NOT NULL
+        )
+        """
+        self.db.execute(query)
+        
+        columns = {row['name'] for row in self.db.fetchall("PRAGMA table_info(Warehouse_Version)")}
+        if 'build_id' not in columns:
+            self.db.execute("ALTER TABLE Warehouse_Version ADD COLUMN build_id TEXT")
+        
+        # data_version restarts at 1 on a rebuilt warehouse; the build id keeps the two builds apart in caches
+        build_id = uuid.uuid4().hex
+        self.db.execute(
+            "INSERT OR IGNORE INTO Warehouse_Version (id, data_version, build_id, updated_at) VALUES (1, 0, ?, ?)",
+            (build_id, datetime.now().isoformat(timespec='seconds'))
+        )
+        self.db.execute("UPDATE Warehouse_Version SET build_id = ? WHERE build_id IS NULL", (build_id,))
+    
+    def _create_agg_revenue_daily(self):
+        query = """
+        CREATE TABLE IF NOT EXISTS Agg_Revenue_Daily (
+            date_id INTEGER PRIMARY KEY,
+            transactions INTEGER NOT NULL,
+            tickets_sold INTEGER NOT NULL,
+            total_revenue REAL NOT NULL,
+            total_payout REAL NOT NULL,
+            net_profit REAL NOT NULL,
+            commission REAL NOT NULL,
+            active_stations INTEGER NOT NULL,
+            active_agencies INTEGER NOT NULL,
+            min_revenue REAL NOT NULL,
+            max_revenue REAL NOT NULL,
+            FOREIGN KEY (date_id) REFERENCES Dim_Date(date_id)
+        )
+        """
+        self.db.execute(query)
+    
+    def _create_agg_revenue_daily_station(self):
+        query = """
+        CREATE TABLE IF NOT EXISTS Agg_Revenue_Daily_Station (
+            date_id INTEGER NOT NULL,
+            station_id INTEGER NOT NULL,
+            transactions INTEGER NOT NULL,
+            tickets_sold INTEGER NOT NULL,
+            total_revenue REAL NOT NULL,
+            total_payout REAL NOT NULL,
+            net_profit REAL NOT NULL,
+            commission REAL NOT NULL,
+            PRIMARY KEY (date_id, station_id),
+            FOREIGN KEY (date_id) REFERENCES Dim_Date(date_id),
+            FOREIGN KEY (station_id) REFERENCES Dim_Station(station_id)
+        ) WITHOUT ROWID
+        """
+        self.db.execute(query)
+    
+    def _create_agg_lottery_number_count(self):
+        query = """
+        CREATE TABLE IF NOT EXISTS Agg_Lottery_Number_Count (
+            date_id INTEGER NOT NULL,
+            station_id INTEGER NOT NULL,
+            prize_id INTEGER NOT NULL,
+            suffix_len INTEGER NOT NULL,
+            suffix INTEGER NOT NULL,
+            frequency INTEGER NOT NULL,
+            PRIMARY KEY (date_id, station_id, prize_id, suffix_len, suffix),
+            FOREIGN KEY (date_id) REFERENCES Dim_Date(date_id),
+            FOREIGN KEY (station_id) REFERENCES Dim_Station(station_id),
+            FOREIGN KEY (prize_id) REFERENCES Dim_Prize(prize_id)
+        ) WITHOUT ROWID
+        """
+        self.db.execute(query)
+        self.db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agg_lottery_number_len_date
+        ON Agg_Lottery_Number_Count (suffix_len, date_id, suffix, frequency)
+        """)
+    
+    def create_indexes(self):
+        for index_name, (table, columns) in self.MANAGED_INDEXES.items():
+            self.db.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})")
+        self.db.execute("ANALYZE")
+    
+    def drop_indexes(self):
+        for index_name in self.MANAGED_INDEXES:
+            self.db.execute(f"DROP INDEX IF EXISTS {index_name}")
+    
+    def explain_analysis_queries(self) -> List[Dict]:
+        from ..analysis.revenue import RevenueAnalysis
+        from ..analysis.lottery import LotteryAnalysis
+        
+        recorder = _QueryRecorder()
+        window = self.db.fetchone(
+            """
+            SELECT date(MAX(full_date), '-30 days') as start_date, MAX(full_date) as end_date
+            FROM Dim_Date
+            WHERE date_id <= (SELECT MAX(last_date_id) FROM Warehouse_Metadata)
+            """
+        )
+        
+        for analysis in (RevenueAnalysis(recorder), LotteryAnalysis(recorder)):
+            for method_name, method in inspect.getmembers(analysis, inspect.ismethod):
+                if method_name.startswith('_'):
+                    continue
+                kwargs = {}
+                if 'start_date' in inspect.signature(method).parameters:
+                    kwargs = {'start_date': window['start_date'], 'end_date': window['end_date']}
+                recorder.current = f"{type(analysis).__name__}.{method_name}"
+                method(**kwargs)
+        
+        # EXPLAIN statements are not re-prepared on schema changes, so the schema version keeps
+        # sqlite3's statement cache from replaying a plan made before indexes were dropped or created
+        schema_version = self.db.fetchone("PRAGMA schema_version")[0]
+        report = []
+        for name, query, params in recorder.queries:
+            explain = f"EXPLAIN QUERY PLAN /* schema {schema_version} */ {query}"
+            plan = [row['detail'] for row in self.db.fetchall(explain, params)]
+            aliases = self._table_aliases(query)
+            fact_scans = [
+                detail for detail in plan
+                if detail.startswith('SCAN ')
+                and aliases.get(detail.split()[1], detail.split()[1]).startswith('Fact_')
+            ]
+            report.append({
+                'query': name,
+                'plan': plan,
+                'fact_scans': fact_scans,
+                'flagged': len(fact_scans) > 0
+            })
+        return report
+    
+    @staticmethod
+    def _table_aliases(query: str) -> Dict[str, str]:
+        aliases = {}
+        for table, alias in re.findall(r'(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', query, re.IGNORECASE):
+            aliases[table] = table
+            if alias and alias.upper() not in ('ON', 'WHERE', 'GROUP', 'ORDER', 'JOIN', 'LEFT', 'INNER', 'LIMIT'):
+                aliases[alias] = table
+        return aliases
+    
     def drop_all_tables(self):
         tables = [
+            'Agg_Lottery_Number_Count',
+            'Agg_Revenue_Daily_Station',
+            'Agg_Revenue_Daily',
+            'Warehouse_Version',
+            'Warehouse_Metadata',
             'Fact_Revenue',
             'Fact_Lottery_Result',
             'Dim_Agency',
@@ -112,8 +380,9 @@ class SchemaManager:
             self.db.execute(f"DROP TABLE IF EXISTS {table}")
     
     def initialize_reference_data(self):
-        self._populate_dim_prize()
-        self._populate_dim_station()
+        with self.db.transaction():
+            self._populate_dim_prize()
+            self._populate_dim_station()
     
     def _populate_dim_prize(self):
         prizes = [
@@ -153,3 +422,22 @@ class SchemaManager:
         if check['cnt'] == 0:
             query = "INSERT INTO Dim_Station (station_name, region) VALUES (?, ?)"
             self.db.executemany(query, stations)
+
+
+
+class _QueryRecorder:
+    def __init__(self):
+        self.queries = []
+        self.current = None
+    
+    def fetchall(self, query: str, params: tuple = ()):
+        self.queries.append((self.current, query, params))
+        return []
+    
+    def fetchone(self, query: str, params: tuple = ()):
+        self.queries.append((self.current, query, params))
+        return None
+    
+    def fetch_df(self, query: str, params: tuple = (), dtypes: Optional[Dict[str, str]] = None):
+        self.queries.append((self.current, query, params))
+        return pd.DataFrame()
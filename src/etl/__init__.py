@@ -1,5 +1,6 @@
 from .extractor import DataExtractor
 from .transformer import DataTransformer
 from .loader import DataLoader
+from ..utils.staging import ColumnarStaging
 
-__all__ = ['DataExtractor', 'DataTransformer', 'DataLoader']
+__all__ = ['DataExtractor', 'DataTransformer', 'DataLoader', 'ColumnarStaging']
@@ -1,11 +1,24 @@
 import pandas as pd
+from contextlib import closing
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from ..utils.staging import ColumnarStaging
 
 
 class DataExtractor:
-    def __init__(self, lottery_csv_path: str, revenue_csv_path: str):
+    LOTTERY_DTYPES = ColumnarStaging.LOTTERY_DTYPES
+    REVENUE_DTYPES = ColumnarStaging.REVENUE_DTYPES
+    DEFAULT_CHUNK_SIZE = 100_000
+    
+    def __init__(
+        self,
+        lottery_csv_path: str,
+        revenue_csv_path: str,
+        high_water_marks: Optional[Dict[str, Optional[int]]] = None
+    ):
         self.lottery_csv_path = lottery_csv_path
         self.revenue_csv_path = revenue_csv_path
+        self.high_water_marks = high_water_marks or {}
         self.lottery_data = None
         self.revenue_data = None
     
@@ -18,18 +31,91 @@ class DataExtractor:
         if not Path(self.lottery_csv_path).exists():
             raise FileNotFoundError(f"Lottery CSV not found: {self.lottery_csv_path}")
         
-        self.lottery_data = pd.read_csv(self.lottery_csv_path)
-        self.lottery_data['draw_date'] = pd.to_datetime(self.lottery_data['draw_date'])
+        if ColumnarStaging.is_staged(self.lottery_csv_path):
+            self.lottery_data = ColumnarStaging.read(self.lottery_csv_path, self.LOTTERY_DTYPES, 'draw_date',
+                                                     after=self._high_water_date('lottery'))
+        else:
+            self.lottery_data = pd.read_csv(self.lottery_csv_path, dtype=self.LOTTERY_DTYPES)
+            self.lottery_data['draw_date'] = pd.to_datetime(self.lottery_data['draw_date'])
+        self.lottery_data = self._filter_new_rows(self.lottery_data, 'draw_date', 'lottery')
         return self.lottery_data
     
     def _extract_revenue_data(self):
         if not Path(self.revenue_csv_path).exists():
             raise FileNotFoundError(f"Revenue CSV not found: {self.revenue_csv_path}")
         
-        self.revenue_data = pd.read_csv(self.revenue_csv_path)
-        self.revenue_data['sale_date'] = pd.to_datetime(self.revenue_data['sale_date'])
+        if ColumnarStaging.is_staged(self.revenue_csv_path):
+            self.revenue_data = ColumnarStaging.read(self.revenue_csv_path, self.REVENUE_DTYPES, 'sale_date',
+                                                     after=self._high_water_date('revenue'))
+        else:
+            self.revenue_data = pd.read_csv(self.revenue_csv_path, dtype=self.REVENUE_DTYPES)
+            self.revenue_data['sale_date'] = pd.to_datetime(self.revenue_data['sale_date'])
+        self.revenue_data = self._filter_new_rows(self.revenue_data, 'sale_date', 'revenue')
         return self.revenue_data
     
+    def _high_water_date(self, source: str) -> Optional[pd.Timestamp]:
+        last_date_id = self.high_water_marks.get(source)
+        if last_date_id is None:
+            return None
+        return pd.to_datetime(str(last_date_id), format='%Y%m%d')
+    
+    def _filter_new_rows(self, df: pd.DataFrame, date_column: str, source: str) -> pd.DataFrame:
+        last_date = self._high_water_date(source)
+        if last_date is None:
+            return df
+        return df[df[date_column] > last_date].reset_index(drop=True)
+    
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        empty_revenue = self._empty_frame(self.REVENUE_DTYPES, 'sale_date')
+        for chunk in self._read_csv_chunks(self.lottery_csv_path, 'Lottery', self.LOTTERY_DTYPES,
+                                           'draw_date', 'lottery', chunk_size):
+            yield 'lottery', chunk, empty_revenue
+        
+        empty_lottery = self._empty_frame(self.LOTTERY_DTYPES, 'draw_date')
+        for chunk in self._read_csv_chunks(self.revenue_csv_path, 'Revenue', self.REVENUE_DTYPES,
+                                           'sale_date', 'revenue', chunk_size):
+            yield 'revenue', empty_lottery, chunk
+    
+    def _read_csv_chunks(
+        self,
+        csv_path: str,
+        label: str,
+        dtypes: Dict[str, str],
+        date_column: str,
+        source: str,
+        chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        if not Path(csv_path).exists():
+            raise FileNotFoundError(f"{label} CSV not found: {csv_path}")
+        
+        if ColumnarStaging.is_staged(csv_path):
+            reader = ColumnarStaging.iter_batches(csv_path, dtypes, date_column, chunk_size,
+                                                  after=self._high_water_date(source))
+        else:
+            reader = pd.read_csv(
+                csv_path,
+                usecols=lambda column: column == date_column or column in dtypes,
+                dtype=dtypes,
+                parse_dates=[date_column],
+                date_format='%Y-%m-%d',
+                chunksize=chunk_size
+            )
+        
+        with closing(reader):
+            for chunk in reader:
+                if chunk.isnull().any().any():
+                    raise ValueError(f"{label} data contains null values")
+                
+                chunk = self._filter_new_rows(chunk, date_column, source)
+                if len(chunk) > 0:
+                    yield chunk
+    
+    @staticmethod
+    def _empty_frame(dtypes: Dict[str, str], date_column: str) -> pd.DataFrame:
+        columns = {date_column: pd.Series(dtype='datetime64[ns]')}
+        columns.update({col: pd.Series(dtype=dtype) for col, dtype in dtypes.items()})
+        return pd.DataFrame(columns)
+    
     def get_lottery_data(self):
         if self.lottery_data is None:
             self._extract_lottery_data()
@@ -1,40 +1,98 @@
+import os
+import sys
+import time
 import pandas as pd
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from .transformer import DataTransformer
 from ..database.connection import DatabaseConnection
+from ..database.aggregates import AggregateManager
+from ..database.metadata import WarehouseMetadata
 
 
 class DataLoader:
-    def __init__(self, db_connection: DatabaseConnection, transformer: DataTransformer):
+    DEFAULT_BATCH_SIZE = 50_000
+    UNKNOWN_REGION = 'Unknown'
+    
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        transformer: DataTransformer,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
         self.db = db_connection
         self.transformer = transformer
+        self.batch_size = batch_size
         self.loaded_counts = {}
+        self.chunk_stats = []
     
     def load_all(self):
-        self._load_dim_date()
-        self._load_dim_agency()
-        self._load_fact_lottery()
-        self._load_fact_revenue()
+        with self.db.transaction():
+            self._load_dim_date()
+            self._load_dim_station()
+            self._load_dim_agency()
+            self._load_fact_lottery()
+            self._load_fact_revenue()
+            self._refresh_aggregates()
+            # Dim_Date is prefilled ahead of the data, so new calendar rows alone do not change query results
+            if any(count for table, count in self.loaded_counts.items() if table != 'dim_date'):
+                WarehouseMetadata(self.db).bump_data_version()
+        return self
+    
+    def load_stream(self, chunks: Iterable[Tuple[str, DataTransformer]]):
+        totals = {}
+        started = time.perf_counter()
+        
+        for index, (source, transformer) in enumerate(chunks):
+            self.transformer = transformer
+            self.load_all()
+            for table, count in self.loaded_counts.items():
+                totals[table] = totals.get(table, 0) + count
+            
+            finished = time.perf_counter()
+            rows = len(transformer.get_fact_lottery()) + len(transformer.get_fact_revenue())
+            self.chunk_stats.append({
+                'source': source,
+                'chunk': index,
+                'rows': rows,
+                'seconds': round(finished - started, 4),
+                'rows_per_sec': round(rows / max(finished - started, 1e-9)),
+                'rss_mb': self._rss_mb()
+            })
+            started = finished
+        
+        self.loaded_counts = totals
         return self
     
     def _load_dim_date(self):
         dim_date = self.transformer.get_dim_date()
         
-        existing_dates = self.db.fetchall("SELECT date_id FROM Dim_Date")
-        existing_ids = {row['date_id'] for row in existing_dates}
+        inserted = 0
+        if len(dim_date) > 0:
+            query = """
+            INSERT OR IGNORE INTO Dim_Date (date_id, full_date, day, month, year, quarter, 
+                                             day_of_week, is_weekend, is_month_start, is_month_end,
+                                             next_date_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+            inserted = self.db.executemany(query, self._iter_records(dim_date)).rowcount
+        
+        self.loaded_counts['dim_date'] = inserted
+        return inserted
+    
+    def _load_dim_station(self):
+        dim_station = self.transformer.get_dim_station()
+        
+        existing_stations = self.db.fetchall("SELECT station_name FROM Dim_Station")
+        existing_names = {row['station_name'] for row in existing_stations}
         
-        new_records = dim_date[~dim_date['date_id'].isin(existing_ids)]
+        new_records = dim_station[~dim_station['station_name'].isin(existing_names)]
         
         if len(new_records) > 0:
-            query = """
-            INSERT INTO Dim_Date (date_id, full_date, day, month, year, quarter, 
-                                   day_of_week, is_weekend, is_month_start, is_month_end)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            records = [tuple(row) for row in new_records.values]
-            self.db.executemany(query, records)
+            query = "INSERT INTO Dim_Station (station_name, region) VALUES (?, ?)"
+            records = zip(new_records['station_name'], new_records['region'].fillna(self.UNKNOWN_REGION))
+            self.db.executemany(query, list(records))
         
-        self.loaded_counts['dim_date'] = len(new_records)
+        self.loaded_counts['dim_station'] = len(new_records)
         return len(new_records)
     
     def _load_dim_agency(self):
@@ -55,68 +113,96 @@ class DataLoader:
     
     def _load_fact_lottery(self):
         fact_lottery = self.transformer.get_fact_lottery()
-        
-        station_map = self._get_station_id_map()
-        prize_map = self._get_prize_id_map()
-        
-        records = []
-        for _, row in fact_lottery.iterrows():
-            station_id = station_map.get(row['station_name'])
-            prize_id = prize_map.get(row['prize_name'])
-            
-            if station_id and prize_id:
-                records.append((
-                    row['date_id'],
-                    station_id,
-                    prize_id,
-                    row['prize_sequence'],
-                    row['result_number']
-                ))
-        
+        result_numbers = fact_lottery['result_number'].astype(str)
+        
+        records = pd.DataFrame({
+            'date_id': fact_lottery['date_id'],
+            'station_id': fact_lottery['station_name'].map(self._get_station_id_map()),
+            'prize_id': fact_lottery['prize_name'].map(self._get_prize_id_map()),
+            'prize_sequence': fact_lottery['prize_sequence'],
+            'result_number': result_numbers,
+            **self._number_suffixes(result_numbers)
+        })
+        records = self._drop_unmatched(records, ['station_id', 'prize_id'])
+        
+        inserted = 0
         if len(records) > 0:
             query = """
-            INSERT INTO Fact_Lottery_Result (date_id, station_id, prize_id, prize_sequence, result_number)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT OR IGNORE INTO Fact_Lottery_Result (date_id, station_id, prize_id, prize_sequence, result_number,
+                                                       last_digit, last_two_digits, last_three_digits)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """
-            self.db.executemany(query, records)
+            inserted = self._insert_batches(query, records)
         
-        self.loaded_counts['fact_lottery'] = len(records)
-        return len(records)
+        self.loaded_counts['fact_lottery'] = inserted
+        return inserted
     
     def _load_fact_revenue(self):
         fact_revenue = self.transformer.get_fact_revenue()
         
-        station_map = self._get_station_id_map()
-        agency_map = self._get_agency_id_map()
-        
-        records = []
-        for _, row in fact_revenue.iterrows():
-            station_id = station_map.get(row['station_name'])
-            agency_id = agency_map.get(row['agency_name'])
-            
-            if station_id and agency_id:
-                records.append((
-                    row['date_id'],
-                    station_id,
-                    agency_id,
-                    row['tickets_sold'],
-                    row['ticket_price'],
-                    row['total_revenue'],
-                    row['total_payout'],
-                    row['net_profit'],
-                    row['commission']
-                ))
-        
+        records = pd.DataFrame({
+            'date_id': fact_revenue['date_id'],
+            'station_id': fact_revenue['station_name'].map(self._get_station_id_map()),
+            'agency_id': fact_revenue['agency_name'].map(self._get_agency_id_map()),
+            'tickets_sold': fact_revenue['tickets_sold'],
+            'ticket_price': fact_revenue['ticket_price'],
+            'total_revenue': fact_revenue['total_revenue'],
+            'total_payout': fact_revenue['total_payout'],
+            'net_profit': fact_revenue['net_profit'],
+            'commission': fact_revenue['commission']
+        })
+        records = self._drop_unmatched(records, ['station_id', 'agency_id'])
+        
+        inserted = 0
         if len(records) > 0:
             query = """
-            INSERT INTO Fact_Revenue (date_id, station_id, agency_id, tickets_sold, ticket_price,
+            INSERT OR IGNORE INTO Fact_Revenue (date_id, station_id, agency_id, tickets_sold, ticket_price,
                                        total_revenue, total_payout, net_profit, commission)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
-            self.db.executemany(query, records)
+            inserted = self._insert_batches(query, records)
         
-        self.loaded_counts['fact_revenue'] = len(records)
-        return len(records)
+        self.loaded_counts['fact_revenue'] = inserted
+        return inserted
+    
+    def _refresh_aggregates(self):
+        aggregates = AggregateManager(self.db)
+        
+        revenue_dates = self.transformer.get_fact_revenue()['date_id'].unique()
+        if len(revenue_dates) > 0:
+            aggregates.refresh_revenue(revenue_dates.tolist())
+        
+        lottery_dates = self.transformer.get_fact_lottery()['date_id'].unique()
+        if len(lottery_dates) > 0:
+            aggregates.refresh_lottery(lottery_dates.tolist())
+    
+    @staticmethod
+    def _number_suffixes(result_numbers: pd.Series) -> Dict[str, pd.Series]:
+        values = pd.to_numeric(result_numbers).astype('int64')
+        lengths = result_numbers.str.len()
+        
+        suffixes = {}
+        for column, length in (('last_digit', 1), ('last_two_digits', 2), ('last_three_digits', 3)):
+            suffix = (values % 10 ** length).astype(object)
+            suffixes[column] = suffix.where(lengths >= length, None)
+        return suffixes
+    
+    @staticmethod
+    def _drop_unmatched(records: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+        matched = records[key_columns].notna().all(axis=1)
+        records = records[matched]
+        return records.astype({col: 'int64' for col in key_columns})
+    
+    def _insert_batches(self, query: str, records: pd.DataFrame) -> int:
+        inserted = 0
+        for start in range(0, len(records), self.batch_size):
+            batch = records.iloc[start:start + self.batch_size]
+            inserted += self.db.executemany(query, self._iter_records(batch)).rowcount
+        return inserted
+    
+    @staticmethod
+    def _iter_records(records: pd.DataFrame) -> Iterator[tuple]:
+        return zip(*(records[col].tolist() for col in records.columns))
     
     def _get_station_id_map(self) -> Dict[str, int]:
         stations = self.db.fetchall("SELECT station_id, station_name FROM Dim_Station")
@@ -130,8 +216,32 @@ class DataLoader:
         agencies = self.db.fetchall("SELECT agency_id, agency_name FROM Dim_Agency")
         return {row['agency_name']: row['agency_id'] for row in agencies}
     
+    @staticmethod
+    def _rss_mb() -> Optional[float]:
+        # Current resident set, sampled while the chunk is still referenced; ru_maxrss never goes down
+        try:
+            with open('/proc/self/statm') as f:
+                resident_pages = int(f.read().split()[1])
+        except OSError:
+            return None
+        return round(resident_pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2, 1)
+    
+    @staticmethod
+    def _peak_rss_mb() -> Optional[float]:
+        try:
+            import resource
+        except ImportError:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        bytes_per_unit = 1 if sys.platform == 'darwin' else 1024
+        return round(peak * bytes_per_unit / 1024 ** 2, 1)
+    
     def get_load_summary(self) -> Dict:
-        return {
+        summary = {
             'loaded_counts': self.loaded_counts,
             'total_loaded': sum(self.loaded_counts.values())
         }
+        if self.chunk_stats:
+            summary['chunks'] = self.chunk_stats
+            summary['peak_rss_mb'] = self._peak_rss_mb()
+        return summary
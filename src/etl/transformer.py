@@ -1,51 +1,87 @@
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict
 
 
 class DataTransformer:
-    def __init__(self, lottery_df: pd.DataFrame, revenue_df: pd.DataFrame):
-        self.lottery_df = lottery_df.copy()
-        self.revenue_df = revenue_df.copy()
+    DEFAULT_FUTURE_DAYS = 366
+    
+    def __init__(self, lottery_df: pd.DataFrame, revenue_df: pd.DataFrame, future_days: int = DEFAULT_FUTURE_DAYS):
+        self.lottery_df = lottery_df
+        self.revenue_df = revenue_df
+        self.future_days = future_days
         
         self.dim_date = None
+        self.dim_station = None
         self.dim_agency = None
         self.fact_lottery = None
         self.fact_revenue = None
     
     def transform_all(self):
         self._transform_dim_date()
-        self._transform_dim_agency()
+        self.transform_lottery()
+        self.transform_revenue()
+        return self
+    
+    def transform_lottery(self):
         self._transform_fact_lottery()
+        return self
+    
+    def transform_revenue(self):
+        self._transform_dim_agency()
         self._transform_fact_revenue()
         return self
     
     def _transform_dim_date(self):
-        all_dates = pd.concat([
+        data_dates = self._data_dates()
+        if len(data_dates) == 0:
+            calendar = pd.DatetimeIndex([])
+        else:
+            calendar = pd.date_range(
+                data_dates.min(),
+                data_dates.max() + pd.Timedelta(days=self.future_days),
+                freq='D'
+            )
+        
+        self.dim_date = self.build_calendar(calendar)
+        return self.dim_date
+    
+    def _data_dates(self) -> pd.Series:
+        return pd.to_datetime(pd.concat([
             self.lottery_df['draw_date'],
             self.revenue_df['sale_date']
-        ]).unique()
+        ], ignore_index=True))
+    
+    @staticmethod
+    def build_calendar(dates: pd.DatetimeIndex) -> pd.DataFrame:
+        def to_date_id(index: pd.DatetimeIndex):
+            return (index.year * 10000 + index.month * 100 + index.day).astype('int64')
         
-        dates_list = []
-        for date in sorted(all_dates):
-            dt = pd.to_datetime(date)
-            date_id = int(dt.strftime('%Y%m%d'))
-            
-            dates_list.append({
-                'date_id': date_id,
-                'full_date': dt.strftime('%Y-%m-%d'),
-                'day': dt.day,
-                'month': dt.month,
-                'year': dt.year,
-                'quarter': (dt.month - 1) // 3 + 1,
-                'day_of_week': dt.strftime('%A'),
-                'is_weekend': 1 if dt.weekday() >= 5 else 0,
-                'is_month_start': 1 if dt.day == 1 else 0,
-                'is_month_end': 1 if dt.day == dt.days_in_month else 0
+        return pd.DataFrame({
+            'date_id': to_date_id(dates),
+            'full_date': dates.strftime('%Y-%m-%d'),
+            'day': dates.day.astype('int64'),
+            'month': dates.month.astype('int64'),
+            'year': dates.year.astype('int64'),
+            'quarter': dates.quarter.astype('int64'),
+            'day_of_week': dates.day_name(),
+            'is_weekend': (dates.dayofweek >= 5).astype('int64'),
+            'is_month_start': dates.is_month_start.astype('int64'),
+            'is_month_end': dates.is_month_end.astype('int64'),
+            'next_date_id': to_date_id(dates + pd.Timedelta(days=1))
+        })
+    
+    def _transform_dim_station(self):
+        # Sources without a region column leave it empty; the loader then keeps Dim_Station's region or a default
+        stations = pd.concat([
+            pd.DataFrame({
+                'station_name': df['station_name'].astype(str),
+                'region': df['region'].astype(str) if 'region' in df.columns else None
             })
-        
-        self.dim_date = pd.DataFrame(dates_list)
-        return self.dim_date
+            for df in (self.lottery_df, self.revenue_df)
+        ], ignore_index=True)
+        regions = stations.groupby('station_name', sort=True)['region'].first()
+        self.dim_station = regions.reset_index()
+        return self.dim_station
     
     def _transform_dim_agency(self):
         agencies = self.revenue_df[['agency_name', 'agency_type']].drop_duplicates()
@@ -54,46 +90,48 @@ class DataTransformer:
         return self.dim_agency
     
     def _transform_fact_lottery(self):
-        fact_data = self.lottery_df.copy()
-        
-        fact_data['date_id'] = pd.to_datetime(fact_data['draw_date']).dt.strftime('%Y%m%d').astype(int)
-        
-        fact_lottery = fact_data[[
-            'date_id',
-            'station_name',
-            'prize_name',
-            'prize_sequence',
-            'result_number'
-        ]].copy()
+        fact_lottery = pd.DataFrame({
+            'date_id': self._to_date_id(self.lottery_df['draw_date']),
+            'station_name': self.lottery_df['station_name'],
+            'prize_name': self.lottery_df['prize_name'],
+            'prize_sequence': self.lottery_df['prize_sequence'],
+            'result_number': self.lottery_df['result_number']
+        })
         
         self.fact_lottery = fact_lottery
         return self.fact_lottery
     
     def _transform_fact_revenue(self):
-        fact_data = self.revenue_df.copy()
-        
-        fact_data['date_id'] = pd.to_datetime(fact_data['sale_date']).dt.strftime('%Y%m%d').astype(int)
-        
-        fact_revenue = fact_data[[
-            'date_id',
-            'station_name',
-            'agency_name',
-            'tickets_sold',
-            'ticket_price',
-            'total_revenue',
-            'total_payout',
-            'net_profit',
-            'commission'
-        ]].copy()
+        fact_revenue = pd.DataFrame({
+            'date_id': self._to_date_id(self.revenue_df['sale_date']),
+            'station_name': self.revenue_df['station_name'],
+            'agency_name': self.revenue_df['agency_name'],
+            'tickets_sold': self.revenue_df['tickets_sold'],
+            'ticket_price': self.revenue_df['ticket_price'],
+            'total_revenue': self.revenue_df['total_revenue'],
+            'total_payout': self.revenue_df['total_payout'],
+            'net_profit': self.revenue_df['net_profit'],
+            'commission': self.revenue_df['commission']
+        })
         
         self.fact_revenue = fact_revenue
         return self.fact_revenue
     
+    @staticmethod
+    def _to_date_id(dates: pd.Series) -> pd.Series:
+        dates = pd.to_datetime(dates)
+        return (dates.dt.year * 10000 + dates.dt.month * 100 + dates.dt.day).astype('int64')
+    
     def get_dim_date(self) -> pd.DataFrame:
         if self.dim_date is None:
             self._transform_dim_date()
         return self.dim_date
     
+    def get_dim_station(self) -> pd.DataFrame:
+        if self.dim_station is None:
+            self._transform_dim_station()
+        return self.dim_station
+    
     def get_dim_agency(self) -> pd.DataFrame:
         if self.dim_agency is None:
             self._transform_dim_agency()
@@ -110,13 +148,15 @@ class DataTransformer:
         return self.fact_revenue
     
     def get_summary(self) -> Dict:
+        data_dates = self._data_dates()
+        has_dates = len(data_dates) > 0
         return {
             'dim_date_records': len(self.get_dim_date()),
             'dim_agency_records': len(self.get_dim_agency()),
             'fact_lottery_records': len(self.get_fact_lottery()),
             'fact_revenue_records': len(self.get_fact_revenue()),
             'date_range': {
-                'start': self.dim_date['full_date'].min(),
-                'end': self.dim_date['full_date'].max()
+                'start': data_dates.min().strftime('%Y-%m-%d') if has_dates else None,
+                'end': data_dates.max().strftime('%Y-%m-%d') if has_dates else None
             }
         }
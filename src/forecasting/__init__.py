@@ -1,4 +1,16 @@
-from .strategy import ForecastingStrategy
+from .strategy import ForecastingStrategy, mean_absolute_percentage_error, regression_metrics
 from .revenue_forecasting import RevenueForecasting, train_revenue_model
+from .ridge_forecasting import RidgeForecasting
+from .baselines import SeasonalNaiveForecasting, HoltWintersForecasting
+from .gradient_boosting import GradientBoostingForecasting
+from .batch import BatchForecaster
+from .registry import ModelRegistry
+from .backtest import WalkForwardBacktester
+from .selection import StrategySelector
 
-__all__ = ['ForecastingStrategy', 'RevenueForecasting', 'train_revenue_model']
+__all__ = [
+    'ForecastingStrategy', 'mean_absolute_percentage_error', 'regression_metrics',
+    'RevenueForecasting', 'train_revenue_model', 'RidgeForecasting',
+    'SeasonalNaiveForecasting', 'HoltWintersForecasting', 'GradientBoostingForecasting',
+    'BatchForecaster', 'ModelRegistry', 'WalkForwardBacktester', 'StrategySelector'
+]
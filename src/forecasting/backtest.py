@@ -0,0 +1,124 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from .strategy import ForecastingStrategy, mean_absolute_percentage_error
+from .revenue_forecasting import RevenueForecasting
+
+
+class WalkForwardBacktester:
+    METRIC_COLUMNS = ['MAE', 'RMSE', 'MAPE']
+    CHUNKS_PER_WORKER = 4
+    
+    def __init__(
+        self,
+        horizon: int = 12,
+        min_train: int = 24,
+        step: int = 1,
+        train_window: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
+        # Lag/MA features backfill the first 6 months; shorter training sets would see the future
+        if min_train < 7:
+            raise ValueError("min_train phải >= 7 tháng")
+        if horizon < 1 or step < 1:
+            raise ValueError("horizon và step phải >= 1")
+        if train_window is not None and train_window < min_train:
+            raise ValueError("train_window phải >= min_train")
+        
+        self.horizon = horizon
+        self.min_train = min_train
+        self.step = step
+        self.train_window = train_window
+        self.max_workers = max_workers or os.cpu_count() or 1
+    
+    def origins(self, n_months: int) -> List[int]:
+        return list(range(self.min_train, n_months, self.step))
+    
+    def run(
+        self,
+        history: pd.DataFrame,
+        strategy_factory: Callable[[], ForecastingStrategy] = RevenueForecasting
+    ) -> pd.DataFrame:
+        # Features only look backwards, so one pass serves every fold
+        features = strategy_factory().prepare_features(history).reset_index(drop=True)
+        origins = self.origins(len(features))
+        if not origins:
+            raise ValueError(f"Không đủ dữ liệu để backtest: cần hơn {self.min_train} tháng, có {len(features)}")
+        
+        chunks = self._chunk(origins)
+        run_folds = partial(_run_folds, features=features, strategy_factory=strategy_factory,
+                            horizon=self.horizon, train_window=self.train_window)
+        if self.max_workers == 1 or len(chunks) <= 1:
+            results = [run_folds(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(run_folds, chunks))
+        
+        predictions = pd.concat(results, ignore_index=True)
+        return predictions.sort_values(['origin', 'horizon'], kind='stable').reset_index(drop=True)
+    
+    @classmethod
+    def summarize(cls, predictions: pd.DataFrame) -> pd.DataFrame:
+        rows = []
+        for horizon, fold in predictions.groupby('horizon', sort=True):
+            errors = fold['predicted'] - fold['actual']
+            rows.append({
+                'horizon': horizon,
+                'folds': len(fold),
+                'MAE': float(errors.abs().mean()),
+                'RMSE': float(np.sqrt((errors ** 2).mean())),
+                'MAPE': mean_absolute_percentage_error(fold['actual'], fold['predicted'])
+            })
+        return pd.DataFrame(rows, columns=['horizon', 'folds', *cls.METRIC_COLUMNS])
+    
+    def compare(
+        self,
+        history: pd.DataFrame,
+        strategies: Dict[str, Callable[[], ForecastingStrategy]]
+    ) -> pd.DataFrame:
+        summaries = []
+        for name, strategy_factory in strategies.items():
+            summary = self.summarize(self.run(history, strategy_factory))
+            summary.insert(0, 'strategy', name)
+            summaries.append(summary)
+        return pd.concat(summaries, ignore_index=True)
+    
+    def _chunk(self, origins: List[int]) -> List[List[int]]:
+        n_chunks = min(len(origins), self.max_workers * self.CHUNKS_PER_WORKER)
+        return [origins[i::n_chunks] for i in range(n_chunks)]
+
+
+def _run_folds(
+    origins: List[int],
+    features: pd.DataFrame,
+    strategy_factory: Callable[[], ForecastingStrategy],
+    horizon: int,
+    train_window: Optional[int]
+) -> pd.DataFrame:
+    feature_columns = strategy_factory().FEATURE_COLUMNS
+    X, y = features[feature_columns], features['total_revenue']
+    year_months = features['year_month'].dt.strftime('%Y-%m').to_numpy()
+    actuals = y.to_numpy(dtype=float)
+    
+    folds = []
+    for origin in origins:
+        start = 0 if train_window is None else max(0, origin - train_window)
+        strategy = strategy_factory()
+        strategy.fit(X.iloc[start:origin], y.iloc[start:origin])
+        
+        steps = min(horizon, len(features) - origin)
+        forecast = strategy.forecast_from_features(features.iloc[:origin], steps)
+        folds.append(pd.DataFrame({
+            'origin': year_months[origin - 1],
+            'horizon': np.arange(1, steps + 1),
+            'year_month': year_months[origin:origin + steps],
+            'actual': actuals[origin:origin + steps],
+            'predicted': forecast['predicted_revenue'].to_numpy(),
+            'train_size': origin - start
+        }))
+    
+    return pd.concat(folds, ignore_index=True)
@@ -0,0 +1,223 @@
+from itertools import product
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from .strategy import ForecastingStrategy, regression_metrics
+
+
+class SeasonalNaiveForecasting(ForecastingStrategy):
+    FEATURE_COLUMNS = ['month_index']
+    ARRAY_STATE = True
+    
+    def __init__(self, season_length: int = 12):
+        if season_length < 1:
+            raise ValueError("season_length phải >= 1")
+        
+        super().__init__(f"Seasonal Naive (m={season_length})")
+        self.season_length = season_length
+        self.history = np.empty(0)
+        self.first_index = 0
+    
+    def prepare_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        df['year_month'] = pd.to_datetime(df['year_month'])
+        df = df.sort_values('year_month').reset_index(drop=True)
+        df['month_index'] = range(len(df))
+        return df
+    
+    def fit(self, X_train: pd.DataFrame, y_train: pd.Series) -> 'SeasonalNaiveForecasting':
+        history = np.asarray(y_train, dtype=float)
+        self._check_length(history.shape[-1])
+        
+        self.history = history
+        self.first_index = int(X_train['month_index'].iloc[0])
+        self.is_trained = True
+        return self
+    
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        
+        positions = X['month_index'].to_numpy() - self.first_index
+        steps_ahead = positions - len(self.history) + 1
+        forecast = self._forecast(self.history[np.newaxis, :], max(int(steps_ahead.max()), 1))[0]
+        fitted = self._fitted_values(self.history[np.newaxis, :])[0]
+        return np.where(steps_ahead > 0, forecast[np.clip(steps_ahead - 1, 0, None)],
+                        fitted[np.clip(positions, 0, len(fitted) - 1)])
+    
+    def evaluate(self, X_test: pd.DataFrame, y_test: pd.Series) -> Dict[str, float]:
+        self.metrics = regression_metrics(y_test, self.predict(X_test))
+        return self.metrics
+    
+    def forecast_from_features(self, df: pd.DataFrame, months: int = 12) -> pd.DataFrame:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        
+        future_dates = pd.date_range(
+            start=df['year_month'].max() + pd.DateOffset(months=1),
+            periods=months,
+            freq='MS'
+        )
+        history = df['total_revenue'].to_numpy(dtype=float)
+        self._check_length(len(history))
+        return pd.DataFrame({
+            'year_month': future_dates.strftime('%Y-%m'),
+            'predicted_revenue': self._forecast(history[np.newaxis, :], months)[0]
+        })
+    
+    def forecast_many(self, values: np.ndarray, horizon: int) -> np.ndarray:
+        # One row per series, one column per period; fits and forecasts every row at once
+        values = np.asarray(values, dtype=float)
+        self._check_length(values.shape[1])
+        return self._forecast(values, horizon, self._fit_parameters(values))
+    
+    def get_state(self) -> Dict[str, np.ndarray]:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        
+        return {
+            'season_length': np.asarray(self.season_length, dtype=np.int64),
+            'history': self.history,
+            'first_index': np.asarray(self.first_index, dtype=np.int64)
+        }
+    
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        self.season_length = int(state['season_length'])
+        self.history = state['history']
+        self.first_index = int(state['first_index'])
+        self.is_trained = True
+    
+    def _check_length(self, n_periods: int):
+        if n_periods < self.season_length:
+            raise ValueError(f"Cần ít nhất {self.season_length} kỳ dữ liệu, có {n_periods}")
+    
+    def _fit_parameters(self, values: np.ndarray) -> Optional[Tuple[np.ndarray, ...]]:
+        return None
+    
+    def _forecast(
+        self,
+        values: np.ndarray,
+        horizon: int,
+        parameters: Optional[Tuple[np.ndarray, ...]] = None
+    ) -> np.ndarray:
+        last_season = values[:, -self.season_length:]
+        steps = np.arange(horizon) % self.season_length
+        return last_season[:, steps]
+    
+    def _fitted_values(self, values: np.ndarray) -> np.ndarray:
+        fitted = np.full(values.shape, np.nan)
+        fitted[:, self.season_length:] = values[:, :-self.season_length]
+        fitted[:, :self.season_length] = values[:, :self.season_length]
+        return fitted
+
+
+class HoltWintersForecasting(SeasonalNaiveForecasting):
+    ALPHAS = (0.1, 0.3, 0.5, 0.8)
+    BETAS = (0.0, 0.05, 0.2)
+    GAMMAS = (0.05, 0.2, 0.5)
+    
+    def __init__(self, season_length: int = 12):
+        super().__init__(season_length)
+        self.name = f"Holt-Winters additive (m={season_length})"
+        self.alpha = self.beta = self.gamma = None
+    
+    def fit(self, X_train: pd.DataFrame, y_train: pd.Series) -> 'HoltWintersForecasting':
+        super().fit(X_train, y_train)
+        self.alpha, self.beta, self.gamma = self._fit_parameters(self.history[np.newaxis, :])
+        return self
+    
+    def _fit_parameters(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Grid search for every series at once: the recursion runs over time, vectorized over (series, grid)
+        grid = np.array(list(product(self.ALPHAS, self.BETAS, self.GAMMAS)))
+        n_series = values.shape[0]
+        alpha, beta, gamma = (np.broadcast_to(grid[:, i], (n_series, len(grid))) for i in range(3))
+        sse, _ = self._smooth(values, alpha, beta, gamma)
+        
+        best = np.argmin(sse, axis=1)
+        return grid[best, 0], grid[best, 1], grid[best, 2]
+    
+    def _initial_state(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        m = self.season_length
+        first = values[:, :m].mean(axis=1)
+        if values.shape[1] >= 2 * m:
+            trend = (values[:, m:2 * m].mean(axis=1) - first) / m
+        else:
+            trend = np.zeros(len(values))
+        return first, trend, values[:, :m] - first[:, np.newaxis]
+    
+    def _smooth(
+        self,
+        values: np.ndarray,
+        alpha: np.ndarray,
+        beta: np.ndarray,
+        gamma: np.ndarray,
+        keep_fitted: bool = False
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+        m = self.season_length
+        first, trend0, season0 = self._initial_state(values)
+        shape = alpha.shape
+        
+        level = np.broadcast_to(first[:, np.newaxis], shape).copy()
+        trend = np.broadcast_to(trend0[:, np.newaxis], shape).copy()
+        season = np.broadcast_to(season0[:, np.newaxis, :], (*shape, m)).copy()
+        sse = np.zeros(shape)
+        fitted = np.empty((*shape, values.shape[1])) if keep_fitted else None
+        
+        for t in range(values.shape[1]):
+            observed = values[:, t][:, np.newaxis]
+            seasonal = season[..., t % m]
+            one_step = level + trend + seasonal
+            if keep_fitted:
+                fitted[..., t] = one_step
+            # The first season initialises the state, so it is not scored
+            if t >= m:
+                sse += (observed - one_step) ** 2
+            
+            new_level = alpha * (observed - seasonal) + (1 - alpha) * (level + trend)
+            trend = beta * (new_level - level) + (1 - beta) * trend
+            season[..., t % m] = gamma * (observed - new_level) + (1 - gamma) * seasonal
+            level = new_level
+        
+        return sse, (level, trend, season, fitted)
+    
+    def _run_fitted(
+        self,
+        values: np.ndarray,
+        parameters: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+        keep_fitted: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        # Series fitted by forecast_many carry their own parameters; otherwise use the trained ones
+        parameters = parameters if parameters is not None else (self.alpha, self.beta, self.gamma)
+        params = (np.broadcast_to(np.asarray(p, dtype=float).reshape(-1, 1), (len(values), 1))
+                  for p in parameters)
+        _, state = self._smooth(values, *params, keep_fitted=keep_fitted)
+        return state
+    
+    def _forecast(
+        self,
+        values: np.ndarray,
+        horizon: int,
+        parameters: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    ) -> np.ndarray:
+        level, trend, season, _ = self._run_fitted(values, parameters)
+        steps = np.arange(1, horizon + 1)
+        positions = (values.shape[1] + steps - 1) % self.season_length
+        forecast = level + trend * steps + season[..., positions].reshape(len(values), horizon)
+        return np.clip(forecast, 0.0, None)
+    
+    def _fitted_values(self, values: np.ndarray) -> np.ndarray:
+        return self._run_fitted(values, keep_fitted=True)[3].reshape(values.shape)
+    
+    def get_state(self) -> Dict[str, np.ndarray]:
+        state = super().get_state()
+        state.update({
+            'alpha': np.atleast_1d(self.alpha).astype(float),
+            'beta': np.atleast_1d(self.beta).astype(float),
+            'gamma': np.atleast_1d(self.gamma).astype(float)
+        })
+        return state
+    
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        super().set_state(state)
+        self.alpha, self.beta, self.gamma = state['alpha'], state['beta'], state['gamma']
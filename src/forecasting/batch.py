@@ -0,0 +1,181 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from .strategy import ForecastingStrategy, regression_metrics
+from .revenue_forecasting import RevenueForecasting
+from .baselines import HoltWintersForecasting, SeasonalNaiveForecasting
+
+
+class BatchForecaster:
+    SERIES_KEYS = ['station_name', 'agency_name']
+    METRIC_COLUMNS = ['MAE', 'RMSE', 'R2', 'MAPE']
+    DEFAULT_MIN_HISTORY = 12
+    CHUNKS_PER_WORKER = 4
+    
+    def __init__(
+        self,
+        db_connection,
+        strategy_factory: Callable[[], ForecastingStrategy] = RevenueForecasting,
+        max_workers: Optional[int] = None,
+        min_history: int = DEFAULT_MIN_HISTORY,
+        train_ratio: float = 0.8
+    ):
+        if min_history < 3:
+            raise ValueError("min_history phải >= 3 để tách train/test")
+        
+        self.db = db_connection
+        self.strategy_factory = strategy_factory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_history = min_history
+        self.train_ratio = train_ratio
+        self.skipped_series = pd.DataFrame(columns=self.SERIES_KEYS)
+    
+    def load_series(self) -> pd.DataFrame:
+        from src.analysis.revenue import RevenueAnalysis
+        
+        df = RevenueAnalysis(self.db).get_monthly_revenue_by_station_agency()
+        if df.empty:
+            raise ValueError("Không có dữ liệu để train")
+        
+        # Each series runs from its first sale to the last loaded month; months without sales inside that span are zero
+        month_number = df['year_month'].str[:4].astype(int) * 12 + df['year_month'].str[5:7].astype(int) - 1
+        first = month_number.groupby([df[key] for key in self.SERIES_KEYS], sort=True).min()
+        lengths = (month_number.max() - first + 1).to_numpy()
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        months = np.repeat(first.to_numpy(), lengths) + offsets
+        
+        grid = first.index.to_frame(index=False).loc[np.repeat(np.arange(len(first)), lengths)].reset_index(drop=True)
+        grid['year_month'] = pd.Series(months // 12).astype(str) + '-' + pd.Series(months % 12 + 1).astype(str).str.zfill(2)
+        series = grid.merge(df[[*self.SERIES_KEYS, 'year_month', 'total_revenue']], how='left')
+        series['total_revenue'] = series['total_revenue'].fillna(0.0)
+        return series
+    
+    @classmethod
+    def prepare_batch_features(cls, series: pd.DataFrame) -> pd.DataFrame:
+        df = series.copy()
+        df['year_month'] = pd.to_datetime(df['year_month'])
+        df = df.sort_values([*cls.SERIES_KEYS, 'year_month'], kind='stable').reset_index(drop=True)
+        
+        df['month'] = df['year_month'].dt.month
+        df['year'] = df['year_month'].dt.year
+        df['quarter'] = df['year_month'].dt.quarter
+        df['month_index'] = df.groupby(cls.SERIES_KEYS, sort=False).cumcount()
+        
+        df['sin_month'] = np.sin(2 * np.pi * df['month'] / 12)
+        df['cos_month'] = np.cos(2 * np.pi * df['month'] / 12)
+        
+        revenue = df.groupby(cls.SERIES_KEYS, sort=False)['total_revenue']
+        for lag in (1, 3, 6):
+            df[f'revenue_lag{lag}'] = revenue.shift(lag)
+        
+        # Rolling means from one cumulative sum: window sum = cumsum - cumsum `window` rows back in the same series
+        position = df['month_index'].to_numpy()
+        cumulative = revenue.cumsum().to_numpy()
+        for window in (3, 6):
+            behind = np.where(position >= window, np.roll(cumulative, window), 0.0)
+            df[f'revenue_ma{window}'] = (cumulative - behind) / np.minimum(position + 1, window)
+        
+        lag_columns = ['revenue_lag1', 'revenue_lag3', 'revenue_lag6']
+        df[lag_columns] = df.groupby(cls.SERIES_KEYS, sort=False)[lag_columns].bfill().fillna(0)
+        return df
+    
+    def forecast(self, months: int = 12, series: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        features = self.prepare_batch_features(series if series is not None else self.load_series())
+        
+        # Zero-filled gaps are not history, so only months with sales count towards min_history
+        groups = [(key, frame, int((frame['total_revenue'] > 0).sum()))
+                  for key, frame in features.groupby(self.SERIES_KEYS, sort=True)]
+        eligible = [(key, frame) for key, frame, sales_months in groups if sales_months >= self.min_history]
+        self.skipped_series = pd.DataFrame(
+            [key for key, frame, sales_months in groups if sales_months < self.min_history],
+            columns=self.SERIES_KEYS
+        )
+        
+        chunks = self._chunk(eligible)
+        fit_forecast = partial(_fit_forecast_chunk, strategy_factory=self.strategy_factory, months=months,
+                               train_ratio=self.train_ratio)
+        if self.max_workers == 1 or len(chunks) <= 1:
+            results = [fit_forecast(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(fit_forecast, chunks))
+        
+        columns = [*self.SERIES_KEYS, 'year_month', 'predicted_revenue', 'train_size', 'test_size',
+                   *self.METRIC_COLUMNS]
+        if not results:
+            return pd.DataFrame(columns=columns)
+        result = pd.concat(results, ignore_index=True)[columns]
+        return result.sort_values([*self.SERIES_KEYS, 'year_month'], kind='stable').reset_index(drop=True)
+    
+    def load_daily_panel(self) -> Tuple[pd.DataFrame, pd.DatetimeIndex, np.ndarray]:
+        from src.analysis.revenue import RevenueAnalysis
+        
+        df = RevenueAnalysis(self.db).get_daily_revenue_by_station_agency()
+        if df.empty:
+            raise ValueError("Không có dữ liệu để train")
+        
+        # One row per series, one column per calendar day; days without sales stay zero
+        dates = pd.date_range(df['full_date'].min(), df['full_date'].max(), freq='D')
+        series_codes = df.groupby(self.SERIES_KEYS, sort=True).ngroup().to_numpy()
+        keys = df[self.SERIES_KEYS].drop_duplicates().sort_values(self.SERIES_KEYS).reset_index(drop=True)
+        values = np.zeros((len(keys), len(dates)))
+        values[series_codes, (df['full_date'] - dates[0]).dt.days.to_numpy()] = df['total_revenue'].to_numpy(dtype=float)
+        return keys, dates, values
+    
+    def forecast_daily(
+        self,
+        days: int = 28,
+        strategy: Optional[SeasonalNaiveForecasting] = None,
+        panel: Optional[Tuple[pd.DataFrame, pd.DatetimeIndex, np.ndarray]] = None
+    ) -> pd.DataFrame:
+        keys, dates, values = panel if panel is not None else self.load_daily_panel()
+        strategy = strategy or HoltWintersForecasting(season_length=7)
+        predictions = strategy.forecast_many(values, days)
+        
+        future_dates = pd.date_range(dates[-1] + pd.Timedelta(days=1), periods=days, freq='D')
+        result = keys.loc[keys.index.repeat(days)].reset_index(drop=True)
+        result['date'] = np.tile(future_dates, len(keys))
+        result['predicted_revenue'] = predictions.ravel()
+        return result
+    
+    def _chunk(self, series: List[Tuple]) -> List[List[Tuple]]:
+        if not series:
+            return []
+        n_chunks = min(len(series), self.max_workers * self.CHUNKS_PER_WORKER)
+        return [series[i::n_chunks] for i in range(n_chunks)]
+
+
+def _fit_forecast_chunk(
+    chunk: List[Tuple[Tuple[str, str], pd.DataFrame]],
+    strategy_factory: Callable[[], ForecastingStrategy],
+    months: int,
+    train_ratio: float
+) -> pd.DataFrame:
+    feature_columns = strategy_factory().FEATURE_COLUMNS
+    forecasts = []
+    
+    for (station_name, agency_name), features in chunk:
+        train_size = int(len(features) * train_ratio)
+        X, y = features[feature_columns], features['total_revenue']
+        
+        strategy = strategy_factory()
+        strategy.fit(X.iloc[:train_size], y.iloc[:train_size])
+        # Scored like a real forecast: lags and moving averages over the test span come from earlier predictions
+        holdout = strategy.forecast_from_features(features.iloc[:train_size], len(features) - train_size)
+        metrics = regression_metrics(y.iloc[train_size:], holdout['predicted_revenue'])
+        strategy.metrics = metrics
+        
+        forecast = strategy.forecast_from_features(features, months)
+        forecast.insert(0, 'agency_name', agency_name)
+        forecast.insert(0, 'station_name', station_name)
+        forecast['train_size'] = train_size
+        forecast['test_size'] = len(features) - train_size
+        for name in BatchForecaster.METRIC_COLUMNS:
+            forecast[name] = metrics.get(name, np.nan)
+        forecasts.append(forecast)
+    
+    return pd.concat(forecasts, ignore_index=True)
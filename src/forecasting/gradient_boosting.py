@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor
+
+from .revenue_forecasting import RevenueForecasting
+
+
+class GradientBoostingForecasting(RevenueForecasting):
+    ARRAY_STATE = False
+    
+    def __init__(
+        self,
+        n_estimators: int = 150,
+        learning_rate: float = 0.05,
+        max_depth: int = 2,
+        random_state: int = 0
+    ):
+        super().__init__()
+        self.name = "Revenue Forecasting - Gradient Boosting"
+        self.scaler = None
+        self.model = GradientBoostingRegressor(
+            n_estimators=n_estimators,
+            learning_rate=learning_rate,
+            max_depth=max_depth,
+            random_state=random_state
+        )
+    
+    def fit(self, X_train: pd.DataFrame, y_train: pd.Series) -> 'GradientBoostingForecasting':
+        self.feature_names = X_train.columns.tolist()
+        self.model.fit(X_train.to_numpy(dtype=float), np.asarray(y_train, dtype=float))
+        self.is_trained = True
+        return self
+    
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        return self.model.predict(X[self.feature_names].to_numpy(dtype=float))
+    
+    def get_feature_importance(self) -> pd.DataFrame:
+        if not self.is_trained:
+            return None
+        
+        importance = pd.DataFrame({
+            'feature': self.feature_names,
+            'importance': self.model.feature_importances_
+        })
+        return importance.sort_values('importance', ascending=False)
+    
+    def forecast_from_features(self, df: pd.DataFrame, months: int = 12) -> pd.DataFrame:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        
+        future_dates = pd.date_range(
+            start=df['year_month'].max() + pd.DateOffset(months=1),
+            periods=months,
+            freq='MS'
+        )
+        calendar = self._calendar_features(future_dates, df['month_index'].iloc[-1])
+        
+        # Trees are not linear in the lags, so each month is predicted from a row built off the previous ones
+        history = list(df['total_revenue'].to_numpy(dtype=float)[-6:])
+        columns = {name: i for i, name in enumerate(self.feature_names)}
+        row = np.zeros((1, len(self.feature_names)))
+        predictions = np.empty(months)
+        
+        for i in range(months):
+            recent = np.array(history)
+            lags = {
+                'revenue_lag1': recent[-1],
+                'revenue_lag3': recent[-3] if len(recent) >= 3 else recent[-1],
+                'revenue_lag6': recent[-6] if len(recent) >= 6 else recent[-1],
+                'revenue_ma3': recent[-3:].mean(),
+                'revenue_ma6': recent[-6:].mean()
+            }
+            for name, index in columns.items():
+                row[0, index] = calendar[name][i] if name in calendar else lags[name]
+            
+            predictions[i] = max(0.0, float(self.model.predict(row)[0]))
+            history = history[-5:] + [predictions[i]]
+        
+        return pd.DataFrame({
+            'year_month': future_dates.strftime('%Y-%m'),
+            'predicted_revenue': predictions
+        })
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
+import numpy as np
+
+from .strategy import ForecastingStrategy
+from .revenue_forecasting import RevenueForecasting, train_revenue_model
+from ..database.metadata import WarehouseMetadata
+
+
+class ModelRegistry:
+    META_KEY = '__meta__'
+    
+    def __init__(
+        self,
+        registry_dir: str = "database/models",
+        max_cached: int = 16,
+        keep_versions: int = 3
+    ):
+        if keep_versions < 1:
+            raise ValueError("keep_versions phải >= 1")
+        
+        self.registry_dir = Path(registry_dir)
+        self.max_cached = max_cached
+        self.keep_versions = keep_versions
+        
+        self._models: 'OrderedDict[Tuple, ForecastingStrategy]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._train_lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'disk_loads': 0,
+            'trainings': 0,
+            'evictions': 0
+        }
+        
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+    
+    def get_or_train(
+        self,
+        db_connection,
+        strategy_class: Type[ForecastingStrategy] = RevenueForecasting,
+        feature_names: Optional[Sequence[str]] = None,
+        trainer: Optional[Callable[[object], ForecastingStrategy]] = None,
+        force: bool = False
+    ) -> ForecastingStrategy:
+        # Artifacts are loaded without pickle, so the check runs before any training time is spent
+        if not strategy_class.ARRAY_STATE:
+            raise ValueError(f"{strategy_class.__name__} không lưu được dạng mảng, registry không hỗ trợ")
+        
+        feature_names = list(feature_names or getattr(strategy_class, 'FEATURE_COLUMNS', []))
+        build_id, data_version = WarehouseMetadata(db_connection).get_build_version()
+        key = self._key(db_connection.db_path, strategy_class, feature_names, build_id, data_version)
+        
+        if not force:
+            model = self._cached(key)
+            if model is not None:
+                return model
+        
+        with self._train_lock:
+            model = None if force else self._cached(key)
+            if model is None and not force:
+                model = self._load(key, strategy_class)
+                if model is not None:
+                    self._bump('disk_loads')
+            
+            if model is None:
+                model = trainer(db_connection) if trainer else train_revenue_model(db_connection, strategy_class)[0]
+                if not isinstance(model, strategy_class):
+                    raise ValueError(f"Trainer trả về {type(model).__name__}, registry cần {strategy_class.__name__}")
+                if list(getattr(model, 'feature_names', feature_names)) != feature_names:
+                    raise ValueError("Feature của model đã train không khớp với feature set của registry")
+                self._save(key, model)
+                self._bump('trainings')
+            
+            self._store(key, model)
+        return model
+    
+    def list_versions(
+        self,
+        db_connection,
+        strategy_class: Type[ForecastingStrategy] = RevenueForecasting,
+        feature_names: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        feature_names = list(feature_names or getattr(strategy_class, 'FEATURE_COLUMNS', []))
+        build_id, data_version = WarehouseMetadata(db_connection).get_build_version()
+        key = self._key(db_connection.db_path, strategy_class, feature_names, build_id, data_version)
+        versions = []
+        for path in self._artifacts(self._artifact_path(key).parent):
+            with np.load(path, allow_pickle=False) as artifact:
+                versions.append(json.loads(str(artifact[self.META_KEY])))
+        return versions
+    
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['disk_loads'] + self._stats['trainings']
+            return {
+                **self._stats,
+                'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+                'cached_models': len(self._models),
+                'max_cached': self.max_cached
+            }
+    
+    @staticmethod
+    def _key(
+        db_path: str,
+        strategy_class: Type[ForecastingStrategy],
+        feature_names: List[str],
+        build_id: Optional[str],
+        data_version: int
+    ) -> Tuple:
+        feature_set = hashlib.sha1(','.join(feature_names).encode()).hexdigest()[:12]
+        return db_path, strategy_class.__name__, feature_set, build_id, data_version
+    
+    def _cached(self, key: Tuple) -> Optional[ForecastingStrategy]:
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self._stats['hits'] += 1
+            return model
+    
+    def _store(self, key: Tuple, model: ForecastingStrategy):
+        with self._lock:
+            # A new build or data version makes older in-memory models of the same warehouse unreachable
+            stale = [cached for cached in self._models if cached[:3] == key[:3] and cached[3:] != key[3:]]
+            for cached in stale:
+                del self._models[cached]
+            
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_cached:
+                self._models.popitem(last=False)
+                self._stats['evictions'] += 1
+    
+    def _bump(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+    
+    def _model_dir(self, key: Tuple) -> Path:
+        db_path, strategy_name, feature_set = key[:3]
+        warehouse = hashlib.sha1(db_path.encode()).hexdigest()[:16]
+        return self.registry_dir / warehouse / f"{strategy_name}-{feature_set}"
+    
+    def _artifact_path(self, key: Tuple) -> Path:
+        build_id, data_version = key[3:]
+        return self._model_dir(key) / (build_id or 'unversioned') / f"v{data_version}.npz"
+    
+    @staticmethod
+    def _artifacts(model_dir: Path) -> List[Path]:
+        if not model_dir.exists():
+            return []
+        return sorted(model_dir.glob('v*.npz'), key=lambda path: int(path.stem[1:]))
+    
+    def _load(self, key: Tuple, strategy_class: Type[ForecastingStrategy]) -> Optional[ForecastingStrategy]:
+        path = self._artifact_path(key)
+        if not path.exists():
+            return None
+        
+        with np.load(path, allow_pickle=False) as artifact:
+            meta = json.loads(str(artifact[self.META_KEY]))
+            state = {name: artifact[name] for name in artifact.files if name != self.META_KEY}
+        
+        model = strategy_class()
+        model.set_state(state)
+        model.metrics = meta['metrics']
+        return model
+    
+    def _save(self, key: Tuple, model: ForecastingStrategy):
+        db_path, strategy_name, feature_set, build_id, data_version = key
+        meta = {
+            'strategy': strategy_name,
+            'feature_set': feature_set,
+            'feature_names': list(getattr(model, 'feature_names', [])),
+            'build_id': build_id,
+            'data_version': data_version,
+            'db_path': db_path,
+            'metrics': {name: float(value) for name, value in model.get_metrics().items()},
+            'trained_at': datetime.now().isoformat(timespec='seconds')
+        }
+        
+        state = model.get_state()
+        
+        path = self._artifact_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **state, **{self.META_KEY: np.array(json.dumps(meta))})
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        
+        # Other build directories belong to warehouses previously built at the same path
+        for build_dir in path.parent.parent.iterdir():
+            if build_dir.is_dir() and build_dir != path.parent:
+                shutil.rmtree(build_dir, ignore_errors=True)
+        for stale in self._artifacts(path.parent)[:-self.keep_versions]:
+            stale.unlink(missing_ok=True)
+
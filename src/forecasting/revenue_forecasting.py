@@ -1,14 +1,19 @@
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
 import pandas as pd
 import numpy as np
 from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.preprocessing import StandardScaler
 
-from .strategy import ForecastingStrategy
+from .strategy import ForecastingStrategy, regression_metrics
 
 
 class RevenueForecasting(ForecastingStrategy):
+    FEATURE_COLUMNS = [
+        'month', 'year', 'quarter', 'month_index',
+        'sin_month', 'cos_month', 'revenue_lag1',
+        'revenue_lag3', 'revenue_lag6', 'revenue_ma3', 'revenue_ma6'
+    ]
+    ARRAY_STATE = True
     
     def __init__(self):
         super().__init__("Revenue Forecasting - Linear Regression")
@@ -55,18 +60,7 @@ class RevenueForecasting(ForecastingStrategy):
     
     def evaluate(self, X_test: pd.DataFrame, y_test: pd.Series) -> Dict[str, float]:
         y_pred = self.predict(X_test)
-        
-        mae = mean_absolute_error(y_test, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-        r2 = r2_score(y_test, y_pred)
-        mape = np.mean(np.abs((y_test - y_pred) / y_test)) * 100
-        
-        self.metrics = {
-            'MAE': mae,
-            'RMSE': rmse,
-            'R2': r2,
-            'MAPE': mape
-        }
+        self.metrics = regression_metrics(y_test, y_pred)
         return self.metrics
     
     def get_feature_importance(self) -> pd.DataFrame:
@@ -81,74 +75,134 @@ class RevenueForecasting(ForecastingStrategy):
         importance = importance.sort_values('abs_coefficient', ascending=False)
         return importance
     
+    def get_state(self) -> Dict[str, np.ndarray]:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        
+        return {
+            'feature_names': np.array(self.feature_names, dtype=str),
+            'coef': np.asarray(self.model.coef_, dtype=float),
+            'intercept': np.asarray(self.model.intercept_, dtype=float),
+            'scaler_mean': np.asarray(self.scaler.mean_, dtype=float),
+            'scaler_scale': np.asarray(self.scaler.scale_, dtype=float),
+            'scaler_var': np.asarray(self.scaler.var_, dtype=float),
+            'scaler_samples': np.asarray(self.scaler.n_samples_seen_, dtype=np.int64)
+        }
+    
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        self.feature_names = [str(name) for name in state['feature_names']]
+        n_features = len(self.feature_names)
+        
+        # Restore the fitted attributes sklearn checks in transform/predict
+        self.scaler.mean_ = state['scaler_mean']
+        self.scaler.scale_ = state['scaler_scale']
+        self.scaler.var_ = state['scaler_var']
+        self.scaler.n_samples_seen_ = int(state['scaler_samples'])
+        self.scaler.n_features_in_ = n_features
+        self.scaler.feature_names_in_ = np.array(self.feature_names, dtype=object)
+        
+        self.model.coef_ = state['coef']
+        self.model.intercept_ = float(state['intercept'])
+        self.model.n_features_in_ = n_features
+        self.is_trained = True
+    
     def forecast_next_months(self, historical_data: pd.DataFrame, months: int = 12) -> pd.DataFrame:
         if not self.is_trained:
             raise ValueError("Model chưa được huấn luyện")
         
-        df = self.prepare_features(historical_data)
+        return self.forecast_from_features(self.prepare_features(historical_data), months)
+    
+    def forecast_from_features(self, df: pd.DataFrame, months: int = 12) -> pd.DataFrame:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
         
-        last_date = df['year_month'].max()
-        last_revenue = df['total_revenue'].iloc[-1]
-        last_index = df['month_index'].iloc[-1]
+        revenue = df['total_revenue'].to_numpy(dtype=float)
         
         future_dates = pd.date_range(
-            start=last_date + pd.DateOffset(months=1),
+            start=df['year_month'].max() + pd.DateOffset(months=1),
             periods=months,
             freq='MS'
         )
         
-        predictions = []
-        current_lags = {
-            'lag1': df['total_revenue'].iloc[-1],
-            'lag3': df['total_revenue'].iloc[-3] if len(df) >= 3 else last_revenue,
-            'lag6': df['total_revenue'].iloc[-6] if len(df) >= 6 else last_revenue,
-            'ma3': df['total_revenue'].iloc[-3:].mean() if len(df) >= 3 else last_revenue,
-            'ma6': df['total_revenue'].iloc[-6:].mean() if len(df) >= 6 else last_revenue
+        weights, intercept = self._linear_weights()
+        calendar_part = np.full(months, intercept)
+        for name, values in self._calendar_features(future_dates, df['month_index'].iloc[-1]).items():
+            if name in weights:
+                calendar_part += weights[name] * values
+        predictions = self._recursive_forecast(revenue, calendar_part, weights)
+        
+        return pd.DataFrame({
+            'year_month': future_dates.strftime('%Y-%m'),
+            'predicted_revenue': predictions
+        })
+    
+    def _linear_weights(self) -> Tuple[Dict[str, float], float]:
+        # Fold StandardScaler into the regression: coef * (x - mean) / scale == x * w + b
+        scale = self.scaler.scale_ if self.scaler.scale_ is not None else np.ones(len(self.feature_names))
+        mean = self.scaler.mean_ if self.scaler.mean_ is not None else np.zeros(len(self.feature_names))
+        coefficients = self.model.coef_ / scale
+        intercept = float(self.model.intercept_ - np.dot(coefficients, mean))
+        return dict(zip(self.feature_names, coefficients)), intercept
+    
+    @staticmethod
+    def _calendar_features(future_dates: pd.DatetimeIndex, last_index: int) -> Dict[str, np.ndarray]:
+        month = future_dates.month.to_numpy()
+        return {
+            'month': month,
+            'year': future_dates.year.to_numpy(),
+            'quarter': (month - 1) // 3 + 1,
+            'month_index': last_index + 1 + np.arange(len(future_dates)),
+            'sin_month': np.sin(2 * np.pi * month / 12),
+            'cos_month': np.cos(2 * np.pi * month / 12)
         }
+    
+    def _recursive_forecast(
+        self,
+        revenue: np.ndarray,
+        calendar_part: np.ndarray,
+        weights: Dict[str, float]
+    ) -> np.ndarray:
+        w_lag1, w_lag3, w_lag6, w_ma3, w_ma6 = (
+            weights.get(name, 0.0)
+            for name in ('revenue_lag1', 'revenue_lag3', 'revenue_lag6', 'revenue_ma3', 'revenue_ma6')
+        )
         
-        for i, date in enumerate(future_dates):
-            month_idx = last_index + i + 1
-            month = date.month
-            year = date.year
-            quarter = (month - 1) // 3 + 1
-            
-            features = {
-                'month': month,
-                'year': year,
-                'quarter': quarter,
-                'month_index': month_idx,
-                'sin_month': np.sin(2 * np.pi * month / 12),
-                'cos_month': np.cos(2 * np.pi * month / 12),
-                'revenue_lag1': current_lags['lag1'],
-                'revenue_lag3': current_lags['lag3'],
-                'revenue_lag6': current_lags['lag6'],
-                'revenue_ma3': current_lags['ma3'],
-                'revenue_ma6': current_lags['ma6']
-            }
-            
-            X_future = pd.DataFrame([features])[self.feature_names]
-            pred = self.predict(X_future)[0]
+        last_revenue = revenue[-1]
+        lag1 = last_revenue
+        lag3 = revenue[-3] if len(revenue) >= 3 else last_revenue
+        lag6 = revenue[-6] if len(revenue) >= 6 else last_revenue
+        ma3 = revenue[-3:].mean() if len(revenue) >= 3 else last_revenue
+        ma6 = revenue[-6:].mean() if len(revenue) >= 6 else last_revenue
+        
+        # Only the last six clipped predictions feed the lags and moving averages
+        window = np.zeros(6)
+        sum3 = sum6 = 0.0
+        predictions = np.empty(len(calendar_part))
+        
+        for i, base in enumerate(calendar_part):
+            pred = base + w_lag1 * lag1 + w_lag3 * lag3 + w_lag6 * lag6 + w_ma3 * ma3 + w_ma6 * ma6
+            value = max(0.0, pred)
+            predictions[i] = value
             
-            predictions.append({
-                'year_month': date.strftime('%Y-%m'),
-                'predicted_revenue': max(0, pred)
-            })
+            sum3 += value - (window[(i - 3) % 6] if i >= 3 else 0.0)
+            sum6 += value - (window[i % 6] if i >= 6 else 0.0)
+            window[i % 6] = value
             
-            current_lags['lag1'] = pred
+            lag1 = pred
             if i >= 2:
-                current_lags['lag3'] = predictions[i-2]['predicted_revenue']
+                lag3 = window[(i - 2) % 6]
             if i >= 5:
-                current_lags['lag6'] = predictions[i-5]['predicted_revenue']
-            
-            recent_preds = [p['predicted_revenue'] for p in predictions[-3:]]
-            current_lags['ma3'] = np.mean(recent_preds)
-            recent_preds_6 = [p['predicted_revenue'] for p in predictions[-6:]]
-            current_lags['ma6'] = np.mean(recent_preds_6)
+                lag6 = window[(i - 5) % 6]
+            ma3 = sum3 / min(i + 1, 3)
+            ma6 = sum6 / min(i + 1, 6)
         
-        return pd.DataFrame(predictions)
+        return predictions
 
 
-def train_revenue_model(db_connection) -> Tuple[RevenueForecasting, pd.DataFrame]:
+def train_revenue_model(
+    db_connection,
+    strategy_factory: Callable[[], ForecastingStrategy] = RevenueForecasting
+) -> Tuple[ForecastingStrategy, pd.DataFrame]:
     from src.analysis.revenue import RevenueAnalysis
     
     revenue_analysis = RevenueAnalysis(db_connection)
@@ -157,12 +211,10 @@ def train_revenue_model(db_connection) -> Tuple[RevenueForecasting, pd.DataFrame
     if df.empty:
         raise ValueError("Không có dữ liệu để train")
     
-    forecaster = RevenueForecasting()
+    forecaster = strategy_factory()
     df_features = forecaster.prepare_features(df)
     
-    feature_cols = ['month', 'year', 'quarter', 'month_index', 
-                   'sin_month', 'cos_month', 'revenue_lag1', 
-                   'revenue_lag3', 'revenue_lag6', 'revenue_ma3', 'revenue_ma6']
+    feature_cols = forecaster.FEATURE_COLUMNS
     
     train_size = int(len(df_features) * 0.8)
     train_data = df_features.iloc[:train_size]
@@ -176,6 +228,6 @@ def train_revenue_model(db_connection) -> Tuple[RevenueForecasting, pd.DataFrame
     forecaster.fit(X_train, y_train)
     metrics = forecaster.evaluate(X_test, y_test)
     
-    forecast_12m = forecaster.forecast_next_months(df, months=12)
+    forecast_12m = forecaster.forecast_from_features(df_features, months=12)
     
     return forecaster, forecast_12m
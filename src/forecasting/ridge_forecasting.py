@@ -0,0 +1,138 @@
+from typing import Dict, Tuple
+import numpy as np
+import pandas as pd
+
+from .revenue_forecasting import RevenueForecasting
+
+
+class RidgeForecasting(RevenueForecasting):
+    
+    def __init__(self, alpha: float = 1.0):
+        if alpha < 0:
+            raise ValueError("alpha phải >= 0")
+        
+        super().__init__()
+        self.name = "Revenue Forecasting - Ridge"
+        self.model = None
+        self.scaler = None
+        self.alpha = alpha
+        self.coef_ = None
+        self.intercept_ = 0.0
+        self.scale_ = None
+        self._reset()
+    
+    def _reset(self):
+        self.n_samples_ = 0
+        self._shift = None
+        self._y_shift = 0.0
+        self._sum_x = None
+        self._sum_y = 0.0
+        self._xtx = None
+        self._xty = None
+    
+    def fit(self, X_train: pd.DataFrame, y_train: pd.Series) -> 'RidgeForecasting':
+        self._reset()
+        return self.partial_fit(X_train, y_train)
+    
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series) -> 'RidgeForecasting':
+        values = X.to_numpy(dtype=float)
+        target = np.asarray(y, dtype=float)
+        
+        if self.n_samples_ == 0:
+            self.feature_names = X.columns.tolist()
+            # Accumulating around the first batch's mean keeps X'X well conditioned for large revenue values
+            self._shift = values.mean(axis=0)
+            self._y_shift = float(target.mean())
+            self._sum_x = np.zeros(len(self.feature_names))
+            self._sum_y = 0.0
+            self._xtx = np.zeros((len(self.feature_names), len(self.feature_names)))
+            self._xty = np.zeros(len(self.feature_names))
+        elif X.columns.tolist() != self.feature_names:
+            raise ValueError("Feature không khớp với lần fit trước")
+        
+        centered = values - self._shift
+        target = target - self._y_shift
+        self.n_samples_ += len(centered)
+        self._sum_x += centered.sum(axis=0)
+        self._sum_y += float(target.sum())
+        self._xtx += centered.T @ centered
+        self._xty += centered.T @ target
+        
+        self._solve()
+        self.is_trained = True
+        return self
+    
+    def _solve(self):
+        n = self.n_samples_
+        mean = self._sum_x / n
+        y_mean = self._sum_y / n
+        covariance = self._xtx / n - np.outer(mean, mean)
+        cross = self._xty / n - mean * y_mean
+        
+        # Same convention as StandardScaler: constant features keep unit scale
+        scale = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+        scale[scale <= np.finfo(float).eps * np.maximum(1.0, np.abs(mean + self._shift))] = 1.0
+        
+        # Ridge on standardized features, solved from the sufficient statistics: (Z'Z + alpha*I) beta = Z'y
+        gram = n * covariance / np.outer(scale, scale) + self.alpha * np.eye(len(scale))
+        beta = np.linalg.solve(gram, n * cross / scale)
+        
+        self.scale_ = scale
+        self.coef_ = beta / scale
+        self.intercept_ = y_mean + self._y_shift - float(np.dot(self.coef_, mean + self._shift))
+    
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        return X[self.feature_names].to_numpy(dtype=float) @ self.coef_ + self.intercept_
+    
+    def get_feature_importance(self) -> pd.DataFrame:
+        if not self.is_trained:
+            return None
+        
+        importance = pd.DataFrame({
+            'feature': self.feature_names,
+            'coefficient': self.coef_ * self.scale_
+        })
+        importance['abs_coefficient'] = importance['coefficient'].abs()
+        importance = importance.sort_values('abs_coefficient', ascending=False)
+        return importance
+    
+    def get_state(self) -> Dict[str, np.ndarray]:
+        if not self.is_trained:
+            raise ValueError("Model chưa được huấn luyện")
+        
+        return {
+            'feature_names': np.array(self.feature_names, dtype=str),
+            'alpha': np.asarray(self.alpha, dtype=float),
+            'coef': self.coef_,
+            'intercept': np.asarray(self.intercept_, dtype=float),
+            'scale': self.scale_,
+            'n_samples': np.asarray(self.n_samples_, dtype=np.int64),
+            'shift': self._shift,
+            'y_shift': np.asarray(self._y_shift, dtype=float),
+            'sum_x': self._sum_x,
+            'sum_y': np.asarray(self._sum_y, dtype=float),
+            'xtx': self._xtx,
+            'xty': self._xty
+        }
+    
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        self.feature_names = [str(name) for name in state['feature_names']]
+        self.alpha = float(state['alpha'])
+        self.coef_ = state['coef']
+        self.intercept_ = float(state['intercept'])
+        self.scale_ = state['scale']
+        
+        # The sufficient statistics let partial_fit continue after a reload
+        self.n_samples_ = int(state['n_samples'])
+        self._shift = state['shift']
+        self._y_shift = float(state['y_shift'])
+        self._sum_x = state['sum_x'].copy()
+        self._sum_y = float(state['sum_y'])
+        self._xtx = state['xtx'].copy()
+        self._xty = state['xty'].copy()
+        self.is_trained = True
+    
+    def _linear_weights(self) -> Tuple[Dict[str, float], float]:
+        return dict(zip(self.feature_names, self.coef_)), self.intercept_
@@ -0,0 +1,49 @@
+from typing import Callable, Dict, Optional
+import pandas as pd
+
+from .strategy import ForecastingStrategy
+from .revenue_forecasting import RevenueForecasting
+from .ridge_forecasting import RidgeForecasting
+from .baselines import SeasonalNaiveForecasting, HoltWintersForecasting
+from .gradient_boosting import GradientBoostingForecasting
+from .backtest import WalkForwardBacktester
+
+
+class StrategySelector:
+    DEFAULT_STRATEGIES = {
+        'linear': RevenueForecasting,
+        'ridge': RidgeForecasting,
+        'seasonal_naive': SeasonalNaiveForecasting,
+        'holt_winters': HoltWintersForecasting,
+        'gradient_boosting': GradientBoostingForecasting
+    }
+    
+    def __init__(
+        self,
+        strategies: Optional[Dict[str, Callable[[], ForecastingStrategy]]] = None,
+        backtester: Optional[WalkForwardBacktester] = None,
+        metric: str = 'MAPE'
+    ):
+        if metric not in WalkForwardBacktester.METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric}. Choose from {WalkForwardBacktester.METRIC_COLUMNS}")
+        
+        self.strategies = dict(strategies or self.DEFAULT_STRATEGIES)
+        self.backtester = backtester or WalkForwardBacktester()
+        self.metric = metric
+        self.scores = pd.DataFrame()
+        self.best_name: Optional[str] = None
+    
+    def select(self, history: pd.DataFrame) -> ForecastingStrategy:
+        per_horizon = self.backtester.compare(history, self.strategies)
+        
+        # Every horizon weighs the same; strategies without a score (e.g. all-zero MAPE) rank last
+        self.scores = (
+            per_horizon.groupby('strategy', sort=False)[WalkForwardBacktester.METRIC_COLUMNS].mean()
+            .sort_values(self.metric, na_position='last', kind='stable')
+        )
+        self.best_name = self.scores.index[0]
+        
+        strategy = self.strategies[self.best_name]()
+        features = strategy.prepare_features(history)
+        strategy.fit(features[strategy.FEATURE_COLUMNS], features['total_revenue'])
+        return strategy
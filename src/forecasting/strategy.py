@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
 
 class ForecastingStrategy(ABC):
+    FEATURE_COLUMNS: List[str] = []
+    # Strategies that set this implement get_state()/set_state() to round-trip the model through plain arrays
+    ARRAY_STATE = False
     
     def __init__(self, name: str):
         self.name = name
@@ -24,6 +28,14 @@ class ForecastingStrategy(ABC):
     def evaluate(self, X_test: pd.DataFrame, y_test: pd.Series) -> Dict[str, float]:
         pass
     
+    @abstractmethod
+    def prepare_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        pass
+    
+    @abstractmethod
+    def forecast_from_features(self, df: pd.DataFrame, months: int = 12) -> pd.DataFrame:
+        pass
+    
     def get_feature_importance(self) -> Optional[pd.DataFrame]:
         return None
     
@@ -51,3 +63,22 @@ class ForecastingStrategy(ABC):
     
     def __repr__(self) -> str:
         return f"ForecastingStrategy(name='{self.name}', is_trained={self.is_trained})"
+
+
+def mean_absolute_percentage_error(y_true, y_pred) -> float:
+    # Months with zero actual revenue have no defined percentage error, so they are left out
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    nonzero = y_true != 0
+    if not nonzero.any():
+        return float('nan')
+    return float(np.mean(np.abs((y_true[nonzero] - y_pred[nonzero]) / y_true[nonzero])) * 100)
+
+
+def regression_metrics(y_true, y_pred) -> Dict[str, float]:
+    return {
+        'MAE': mean_absolute_error(y_true, y_pred),
+        'RMSE': np.sqrt(mean_squared_error(y_true, y_pred)),
+        'R2': r2_score(y_true, y_pred),
+        'MAPE': mean_absolute_percentage_error(y_true, y_pred)
+    }
@@ -5,9 +5,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.database.connection import DatabaseConnection
+from src.database.pool import ConnectionPool
 from src.analysis.revenue import RevenueAnalysis
 from src.analysis.lottery import LotteryAnalysis
+from src.analysis.cache import QueryCache
+from src.forecasting import ModelRegistry
 from src.ui.revenue_tab import render_revenue_analysis
 from src.ui.lottery_tab import render_lottery_analysis
 from src.ui.insights_tab import render_combined_insights
@@ -20,20 +22,32 @@ st.set_page_config(
     layout="wide"
 )
 
-def get_database_connection():
+@st.cache_resource
+def get_connection_pool():
     db_path = project_root / "database" / "lottery_warehouse.db"
-    db = DatabaseConnection(str(db_path))
-    db.connect()
-    return db
+    return ConnectionPool(str(db_path), size=4)
+
+@st.cache_resource
+def get_query_cache():
+    return QueryCache()
+
+@st.cache_resource
+def get_model_registry():
+    return ModelRegistry(str(project_root / "database" / "models"))
 
 def get_revenue_analysis(db):
-    return RevenueAnalysis(db)
+    return RevenueAnalysis(db, cache=get_query_cache())
 
 def get_lottery_analysis(db):
-    return LotteryAnalysis(db)
+    return LotteryAnalysis(db, cache=get_query_cache())
 
 
 def main():
+    with get_connection_pool().reader() as db:
+        render_dashboard(db)
+
+
+def render_dashboard(db):
     st.title("Kho Dữ liệu - Phân tích Xổ số và Doanh thu")
     
     # Sidebar filters
@@ -41,11 +55,14 @@ def main():
         st.header("Bộ lọc")
         
         # Get date range from database
-        db = get_database_connection()
-        date_query = "SELECT MIN(full_date) as min_date, MAX(full_date) as max_date FROM Dim_Date"
+        date_query = """
+        SELECT MIN(full_date) as min_date, MAX(full_date) as max_date
+        FROM Dim_Date
+        WHERE date_id <= (SELECT MAX(last_date_id) FROM Warehouse_Metadata)
+        """
         date_range = db.fetchone(date_query)
         
-        if date_range:
+        if date_range and date_range['max_date']:
             import datetime
             min_date = datetime.datetime.strptime(date_range['min_date'], '%Y-%m-%d').date()
             max_date = datetime.datetime.strptime(date_range['max_date'], '%Y-%m-%d').date()
@@ -97,7 +114,26 @@ def main():
         render_combined_insights(revenue_analysis, lottery_analysis, start_date, end_date)
     
     with tab4:
-        render_forecasting(db)
+        render_forecasting(db, get_model_registry())
+    
+    with st.sidebar:
+        with st.expander("Query cache"):
+            stats = get_query_cache().get_stats()
+            st.write(f"Hits: {stats['hits']:,} / Misses: {stats['misses']:,} ({stats['hit_rate']:.0%})")
+            st.write(f"Entries: {stats['entries']:,} / {stats['max_entries']:,}")
+            st.write(f"Size: {stats['size_bytes'] / 1024 / 1024:,.1f} MB")
+            st.write(f"Evictions: {stats['evictions']:,} / Invalidations: {stats['invalidations']:,}")
+        
+        with st.expander("Model registry"):
+            stats = get_model_registry().get_stats()
+            st.write(f"Hits: {stats['hits']:,} / Disk loads: {stats['disk_loads']:,} / Trainings: {stats['trainings']:,}")
+            st.write(f"Cached models: {stats['cached_models']:,} / {stats['max_cached']:,}")
+        
+        with st.expander("Connection pool"):
+            metrics = get_connection_pool().get_metrics()
+            st.write(f"Open: {metrics['open_connections']} (idle {metrics['idle_connections']}, size {metrics['size']})")
+            st.write(f"Checkouts: {metrics['checkouts']:,} / Waits: {metrics['waits']:,}")
+            st.write(f"Wait: avg {metrics['avg_wait_ms']:.1f} ms, max {metrics['max_wait_seconds'] * 1000:.1f} ms")
 
 
 
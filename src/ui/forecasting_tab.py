@@ -4,7 +4,7 @@ import pandas as pd
 from datetime import datetime
 
 
-def render_forecasting(db):
+def render_forecasting(db, registry):
     st.header("Dự đoán Doanh thu")
     
     col1, col2 = st.columns([1, 3])
@@ -31,24 +31,12 @@ def render_forecasting(db):
         
         if st.session_state.get('run_forecast', False):
             with st.spinner("Đang xử lý..."):
-                from src.forecasting import train_revenue_model, RevenueForecasting
                 from src.analysis.revenue import RevenueAnalysis
-                from pathlib import Path
-                
-                project_root = Path(__file__).parent.parent.parent
-                model_path = project_root / "database" / "revenue_model.pkl"
                 
                 try:
-                    if st.session_state.get('retrain', False) or not model_path.exists():
-                        st.info("🤖 Đang train model...")
-                        forecaster, _ = train_revenue_model(db)
-                        forecaster.save_model(str(model_path))
-                        st.success("✅ Model đã train và lưu thành công")
-                    else:
-                        st.info("📥 Đang load model có sẵn...")
-                        forecaster = RevenueForecasting()
-                        forecaster.load_model(str(model_path))
-                        st.success("✅ Model đã load thành công")
+                    # The registry retrains only when the warehouse data version changed
+                    forecaster = registry.get_or_train(db, force=st.session_state.get('retrain', False))
+                    st.success("✅ Model sẵn sàng cho phiên bản dữ liệu hiện tại")
                     
                     revenue_analysis = RevenueAnalysis(db)
                     historical_data = revenue_analysis.get_monthly_revenue_summary()
@@ -1,3 +1,4 @@
 from .generator import DataGenerator
+from .staging import ColumnarStaging
 
-__all__ = ['DataGenerator']
+__all__ = ['DataGenerator', 'ColumnarStaging']
@@ -1,13 +1,31 @@
+import numpy as np
 import pandas as pd
 import random
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from .staging import ColumnarStaging
 
 
 class DataGenerator:
-    def __init__(self, lottery_csv_path: str, revenue_csv_path: str):
+    ENGINES = ('python', 'numpy')
+    DEFAULT_PARTITION_DAYS = 30
+    
+    def __init__(
+        self,
+        lottery_csv_path: str,
+        revenue_csv_path: str,
+        engine: str = 'python',
+        seed: Optional[int] = None
+    ):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown generator engine: {engine}. Choose from {list(self.ENGINES)}")
+        
         self.lottery_csv_path = lottery_csv_path
         self.revenue_csv_path = revenue_csv_path
+        self.engine = engine
+        self.seed = seed
         self._ensure_directories()
         
         self.station_schedule = {
@@ -23,6 +41,19 @@ class DataGenerator:
             'Vũng Tàu': [1]  # Thứ 3
         }
         
+        self.station_regions = {
+            'Hà Nội': 'North',
+            'TP Hồ Chí Minh': 'South',
+            'Đà Nẵng': 'Central',
+            'Cần Thơ': 'South',
+            'An Giang': 'South',
+            'Bình Dương': 'South',
+            'Đồng Nai': 'South',
+            'Kiên Giang': 'South',
+            'Tây Ninh': 'South',
+            'Vũng Tàu': 'South'
+        }
+        
         self.prizes_south = [
             {'name': 'Đặc biệt', 'quantity': 1, 'digits': 6},
             {'name': 'Nhất', 'quantity': 1, 'digits': 5},
@@ -51,20 +82,44 @@ class DataGenerator:
         Path(self.revenue_csv_path).parent.mkdir(parents=True, exist_ok=True)
     
     def generate(self, start_date: str, end_date: str):
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
+        lottery_df, revenue_df = self.build(start_date, end_date)
         
-        lottery_data = self._generate_lottery_results(start, end)
-        revenue_data = self._generate_revenue(start, end)
+        self._write(lottery_df, self.lottery_csv_path, ColumnarStaging.LOTTERY_DTYPES, 'draw_date')
+        self._write(revenue_df, self.revenue_csv_path, ColumnarStaging.REVENUE_DTYPES, 'sale_date')
         
-        lottery_df = pd.DataFrame(lottery_data)
-        revenue_df = pd.DataFrame(revenue_data)
+        return lottery_df, revenue_df
+    
+    def build(self, start_date: str, end_date: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
         
-        lottery_df.to_csv(self.lottery_csv_path, index=False)
-        revenue_df.to_csv(self.revenue_csv_path, index=False)
+        if self.engine == 'numpy':
+            rng = np.random.default_rng(self.seed)
+            dates = pd.date_range(start, end, freq='D')
+            lottery_df = self._generate_lottery_results_numpy(dates, rng, self.station_schedule, self.station_regions)
+            revenue_df = self._generate_revenue_numpy(dates, rng, self.station_schedule, self.station_regions,
+                                                      self.agencies)
+        else:
+            if self.seed is not None:
+                random.seed(self.seed)
+            lottery_df = pd.DataFrame(self._generate_lottery_results(start, end))
+            revenue_df = pd.DataFrame(self._generate_revenue(start, end))
         
         return lottery_df, revenue_df
     
+    @staticmethod
+    def _read(path: str, dtypes: dict, date_column: str) -> pd.DataFrame:
+        if ColumnarStaging.is_staged(path):
+            return ColumnarStaging.read(path, dtypes, date_column)
+        return pd.read_csv(path, dtype=dtypes, parse_dates=[date_column])
+    
+    @staticmethod
+    def _write(df: pd.DataFrame, path: str, dtypes: dict, date_column: str):
+        if ColumnarStaging.is_staged(path):
+            ColumnarStaging.write(df, path, dtypes, date_column)
+        else:
+            df.to_csv(path, index=False)
+    
     def _generate_lottery_results(self, start_date: datetime, end_date: datetime):
         data = []
         current_date = start_date
@@ -83,6 +138,7 @@ class DataGenerator:
                             data.append({
                                 'draw_date': date_str,
                                 'station_name': station_name,
+                                'region': self.station_regions[station_name],
                                 'prize_name': prize_info['name'],
                                 'prize_sequence': seq,
                                 'result_number': result_number
@@ -151,6 +207,7 @@ class DataGenerator:
                     data.append({
                         'sale_date': date_str,
                         'station_name': station_name,
+                        'region': self.station_regions[station_name],
                         'agency_name': agency['name'],
                         'agency_type': agency['type'],
                         'tickets_sold': tickets_sold,
@@ -165,10 +222,225 @@ class DataGenerator:
         
         return data
     
+    @staticmethod
+    def _schedule_mask(dates: pd.DatetimeIndex, station_schedule: Dict[str, List[int]]) -> np.ndarray:
+        weekdays = dates.dayofweek.to_numpy()
+        return np.stack([np.isin(weekdays, days) for days in station_schedule.values()], axis=1)
+    
+    def _generate_lottery_results_numpy(
+        self,
+        dates: pd.DatetimeIndex,
+        rng: np.random.Generator,
+        station_schedule: Dict[str, List[int]],
+        station_regions: Dict[str, str]
+    ) -> pd.DataFrame:
+        date_idx, station_idx = np.nonzero(self._schedule_mask(dates, station_schedule))
+        
+        prize_names = [p['name'] for p in self.prizes_south]
+        prize_codes = np.repeat(np.arange(len(self.prizes_south)), [p['quantity'] for p in self.prizes_south])
+        prize_sequences = np.concatenate([np.arange(1, p['quantity'] + 1) for p in self.prizes_south])
+        prize_digits = np.array([p['digits'] for p in self.prizes_south])[prize_codes]
+        
+        draws, slots = len(date_idx), len(prize_codes)
+        numbers = rng.integers(0, 10 ** np.tile(prize_digits, (draws, 1)))
+        
+        # Zero-padded digits are written straight as UCS4 code points; int-to-str casts plus zfill took most of the time
+        result_numbers = np.empty((draws, slots), dtype=object)
+        for width in np.unique(prize_digits):
+            columns = prize_digits == width
+            powers = 10 ** np.arange(width - 1, -1, -1)
+            digits = (numbers[:, columns, np.newaxis] // powers % 10).astype(np.uint32) + ord('0')
+            result_numbers[:, columns] = digits.view(f'U{width}')[..., 0]
+        
+        return pd.DataFrame({
+            'draw_date': self._categorical_dates(dates, np.repeat(date_idx, slots)),
+            'station_name': pd.Categorical.from_codes(np.repeat(station_idx, slots), list(station_schedule)),
+            'region': self._region_column(station_schedule, station_regions, np.repeat(station_idx, slots)),
+            'prize_name': pd.Categorical.from_codes(np.tile(prize_codes, draws), prize_names),
+            'prize_sequence': np.tile(prize_sequences, draws),
+            'result_number': result_numbers.ravel()
+        })
+    
+    @staticmethod
+    def _region_column(
+        station_schedule: Dict[str, List[int]],
+        station_regions: Dict[str, str],
+        station_codes: np.ndarray
+    ) -> pd.Categorical:
+        regions = sorted(set(station_regions.values()))
+        region_codes = np.array([regions.index(station_regions[name]) for name in station_schedule])
+        return pd.Categorical.from_codes(region_codes[station_codes], regions)
+    
+    @staticmethod
+    def _categorical_dates(dates: pd.DatetimeIndex, codes: np.ndarray) -> pd.Categorical:
+        return pd.Categorical.from_codes(codes, np.datetime_as_string(dates.to_numpy(), unit='D'))
+    
+    def _generate_revenue_numpy(
+        self,
+        dates: pd.DatetimeIndex,
+        rng: np.random.Generator,
+        station_schedule: Dict[str, List[int]],
+        station_regions: Dict[str, str],
+        agencies: List[Dict[str, str]],
+        agency_factor: int = 1,
+        first_day: int = 0
+    ) -> pd.DataFrame:
+        n_dates, n_stations, n_agencies = len(dates), len(station_schedule), len(agencies)
+        base_tickets = 15000
+        days_from_start = np.arange(first_day, first_day + n_dates)
+        
+        scheduled = self._schedule_mask(dates, station_schedule)
+        has_lottery_today = scheduled.any(axis=1)
+        
+        # Days without any draw sell at 3-5 random stations, as in the row-wise generator
+        station_rank = rng.random((n_dates, n_stations)).argsort(axis=1).argsort(axis=1)
+        fallback_count = rng.integers(3, 6, size=n_dates)
+        fallback = station_rank < fallback_count[:, None]
+        active = np.where(has_lottery_today[:, None], scheduled, fallback)
+        
+        day_factor = (
+            np.where(dates.dayofweek >= 5, 1.4, 1.0) *
+            (1 + 0.2 * rng.random(n_dates)) *
+            (1 + 0.001 * (days_from_start + 1)) *
+            (1 + 0.15 * (1 + (days_from_start % 30) / 30)) *
+            np.where(has_lottery_today, 1.3, 1.0)
+        )
+        
+        date_idx, station_idx = np.nonzero(active)
+        pairs = len(date_idx)
+        station_factor = rng.uniform(0.8, 1.2, size=pairs) * np.where(scheduled[date_idx, station_idx], 1.5, 1.0)
+        
+        # Each station-day sells through a distinct window of that day's shuffled agency list
+        agency_order = rng.permuted(np.tile(np.arange(n_agencies), (n_dates, 1)), axis=1)
+        agency_count = np.minimum(rng.integers(2, 5, size=pairs) * agency_factor, n_agencies)
+        agency_start = rng.integers(0, n_agencies, size=pairs)
+        pair_idx = np.repeat(np.arange(pairs), agency_count)
+        agency_pos = np.arange(len(pair_idx)) - np.repeat(np.cumsum(agency_count) - agency_count, agency_count)
+        agency_idx = agency_order[date_idx[pair_idx], (agency_start[pair_idx] + agency_pos) % n_agencies]
+        rows = len(pair_idx)
+        
+        tickets_sold = (
+            base_tickets *
+            day_factor[date_idx[pair_idx]] *
+            station_factor[pair_idx] *
+            rng.uniform(0.85, 1.15, size=rows)
+        ).astype('int64')
+        
+        ticket_price = 10000
+        total_revenue = tickets_sold * ticket_price
+        total_payout = total_revenue * rng.uniform(0.45, 0.55, size=rows)
+        
+        agency_types = sorted({a['type'] for a in agencies})
+        agency_type_codes = np.array([agency_types.index(a['type']) for a in agencies])[agency_idx]
+        commission = total_revenue * np.where(agency_type_codes == agency_types.index('Cấp 1'), 0.08, 0.06)
+        net_profit = total_revenue - total_payout - commission
+        
+        return pd.DataFrame({
+            'sale_date': self._categorical_dates(dates, date_idx[pair_idx]),
+            'station_name': pd.Categorical.from_codes(station_idx[pair_idx], list(station_schedule)),
+            'region': self._region_column(station_schedule, station_regions, station_idx[pair_idx]),
+            'agency_name': pd.Categorical.from_codes(agency_idx, [a['name'] for a in agencies]),
+            'agency_type': pd.Categorical.from_codes(agency_type_codes, agency_types),
+            'tickets_sold': tickets_sold,
+            'ticket_price': ticket_price,
+            'total_revenue': total_revenue,
+            'total_payout': np.round(total_payout, 2),
+            'commission': np.round(commission, 2),
+            'net_profit': np.round(net_profit, 2)
+        })
+    
+    def generate_scaled(
+        self,
+        start_date: str,
+        years: int = 1,
+        stations: int = 1,
+        agencies: int = 1,
+        draw_days_factor: int = 1,
+        partition_days: int = DEFAULT_PARTITION_DAYS
+    ) -> Dict:
+        if min(years, stations, agencies, draw_days_factor, partition_days) < 1:
+            raise ValueError("Scale factors and partition_days must be at least 1")
+        
+        start = pd.Timestamp(start_date)
+        dates = pd.date_range(start, start + pd.DateOffset(years=years) - pd.Timedelta(days=1), freq='D')
+        station_schedule = self.scale_stations(stations, draw_days_factor)
+        station_regions = self.scale_station_regions(stations)
+        agency_pool = self.scale_agencies(agencies)
+        
+        offsets = range(0, len(dates), partition_days)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(offsets))
+        counts = {'lottery_records': 0, 'revenue_records': 0}
+        
+        with self._partition_writer(self.lottery_csv_path, ColumnarStaging.LOTTERY_DTYPES, 'draw_date') as write_lottery, \
+                self._partition_writer(self.revenue_csv_path, ColumnarStaging.REVENUE_DTYPES, 'sale_date') as write_revenue:
+            for offset, seed in zip(offsets, seeds):
+                rng = np.random.default_rng(seed)
+                partition = dates[offset:offset + partition_days]
+                
+                lottery_df = self._generate_lottery_results_numpy(partition, rng, station_schedule, station_regions)
+                revenue_df = self._generate_revenue_numpy(partition, rng, station_schedule, station_regions,
+                                                          agency_pool, agency_factor=agencies, first_day=offset)
+                write_lottery(lottery_df)
+                write_revenue(revenue_df)
+                counts['lottery_records'] += len(lottery_df)
+                counts['revenue_records'] += len(revenue_df)
+        
+        return {
+            **counts,
+            'partitions': len(offsets),
+            'stations': len(station_schedule),
+            'agencies': len(agency_pool),
+            'date_range': {'start': dates[0].strftime('%Y-%m-%d'), 'end': dates[-1].strftime('%Y-%m-%d')}
+        }
+    
+    def scale_stations(self, stations: int = 1, draw_days_factor: int = 1) -> Dict[str, List[int]]:
+        # Each base draw day is extended to draw_days_factor consecutive weekdays, so stations saturate at 7 days a week
+        schedule = {}
+        for replica in range(stations):
+            for name, days in self.station_schedule.items():
+                schedule[self._replica_name(name, replica)] = sorted({
+                    (day + replica + extra) % 7 for day in days for extra in range(draw_days_factor)
+                })
+        return schedule
+    
+    def scale_station_regions(self, stations: int = 1) -> Dict[str, str]:
+        return {
+            self._replica_name(name, replica): self.station_regions[name]
+            for replica in range(stations)
+            for name in self.station_schedule
+        }
+    
+    def scale_agencies(self, agencies: int = 1) -> List[Dict[str, str]]:
+        return [
+            {'name': self._replica_name(agency['name'], replica), 'type': agency['type']}
+            for replica in range(agencies)
+            for agency in self.agencies
+        ]
+    
+    @staticmethod
+    def _replica_name(name: str, replica: int) -> str:
+        return name if replica == 0 else f"{name} {replica + 1}"
+    
+    @staticmethod
+    @contextmanager
+    def _partition_writer(path: str, dtypes: dict, date_column: str) -> Iterator[Callable[[pd.DataFrame], None]]:
+        if ColumnarStaging.is_staged(path):
+            with ColumnarStaging.writer(path, dtypes, date_column) as write_partition:
+                yield write_partition
+            return
+        
+        state = {'header': True}
+        
+        def write_partition(df: pd.DataFrame):
+            df.to_csv(path, mode='w' if state['header'] else 'a', header=state['header'], index=False)
+            state['header'] = False
+        
+        yield write_partition
+    
     def get_summary(self):
         try:
-            lottery_df = pd.read_csv(self.lottery_csv_path)
-            revenue_df = pd.read_csv(self.revenue_csv_path)
+            lottery_df = self._read(self.lottery_csv_path, ColumnarStaging.LOTTERY_DTYPES, 'draw_date')
+            revenue_df = self._read(self.revenue_csv_path, ColumnarStaging.REVENUE_DTYPES, 'sale_date')
             
             return {
                 'lottery_records': len(lottery_df),
@@ -0,0 +1,154 @@
+import pandas as pd
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class ColumnarStaging:
+    SUFFIXES = ('.parquet', '.pq')
+    DEFAULT_ROW_GROUP_SIZE = 100_000
+    # Columns listed here but absent from a file (e.g. region in older exports) are simply not read
+    LOTTERY_DTYPES = {
+        'station_name': 'category',
+        'region': 'category',
+        'prize_name': 'category',
+        'prize_sequence': 'int16',
+        'result_number': 'str'
+    }
+    REVENUE_DTYPES = {
+        'station_name': 'category',
+        'region': 'category',
+        'agency_name': 'category',
+        'agency_type': 'category',
+        'tickets_sold': 'int64',
+        'ticket_price': 'float64',
+        'total_revenue': 'float64',
+        'total_payout': 'float64',
+        'commission': 'float64',
+        'net_profit': 'float64'
+    }
+    
+    @classmethod
+    def is_staged(cls, path: str) -> bool:
+        return Path(path).suffix.lower() in cls.SUFFIXES
+    
+    @staticmethod
+    def _require_pyarrow():
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet staging requires pyarrow (pip install pyarrow)") from e
+        return pq
+    
+    @classmethod
+    def write(
+        cls,
+        df: pd.DataFrame,
+        path: str,
+        dtypes: Dict[str, str],
+        date_column: str,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ):
+        cls._require_pyarrow()
+        typed = cls._prepare(df, dtypes, date_column)
+        typed.to_parquet(path, engine='pyarrow', index=False, row_group_size=row_group_size, compression='zstd')
+    
+    @classmethod
+    @contextmanager
+    def writer(
+        cls,
+        path: str,
+        dtypes: Dict[str, str],
+        date_column: str,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ) -> Iterator[Callable[[pd.DataFrame], None]]:
+        pq = cls._require_pyarrow()
+        import pyarrow as pa
+        
+        state = {'writer': None, 'schema': None}
+        
+        def write_partition(df: pd.DataFrame):
+            table = pa.Table.from_pandas(cls._prepare(df, dtypes, date_column), preserve_index=False)
+            if state['writer'] is None:
+                # Category codes widen as partitions add values, so pin plain string columns instead
+                state['schema'] = pa.schema([
+                    field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+                    for field in table.schema
+                ])
+                state['writer'] = pq.ParquetWriter(path, state['schema'], compression='zstd')
+            state['writer'].write_table(table.cast(state['schema']), row_group_size=row_group_size)
+        
+        try:
+            yield write_partition
+        finally:
+            if state['writer'] is not None:
+                state['writer'].close()
+    
+    @classmethod
+    def read(
+        cls,
+        path: str,
+        dtypes: Dict[str, str],
+        date_column: str,
+        after: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        pq = cls._require_pyarrow()
+        filters = [(date_column, '>', after)] if after is not None else None
+        columns = cls._columns(pq.read_schema(path).names, dtypes, date_column)
+        df = pd.read_parquet(path, engine='pyarrow', columns=columns, filters=filters)
+        return cls._normalize(df, dtypes, date_column)
+    
+    @classmethod
+    def iter_batches(
+        cls,
+        path: str,
+        dtypes: Dict[str, str],
+        date_column: str,
+        batch_size: int,
+        after: Optional[pd.Timestamp] = None
+    ) -> Iterator[pd.DataFrame]:
+        pq = cls._require_pyarrow()
+        parquet_file = pq.ParquetFile(path)
+        row_groups = cls._row_groups_after(parquet_file, date_column, after)
+        if not row_groups:
+            return
+        
+        for batch in parquet_file.iter_batches(batch_size=batch_size, row_groups=row_groups,
+                                               columns=cls._columns(parquet_file.schema_arrow.names, dtypes,
+                                                                    date_column)):
+            yield cls._normalize(batch.to_pandas(), dtypes, date_column)
+    
+    @staticmethod
+    def _row_groups_after(parquet_file, date_column: str, after: Optional[pd.Timestamp]) -> List[int]:
+        metadata = parquet_file.metadata
+        row_groups = list(range(metadata.num_row_groups))
+        if after is None:
+            return row_groups
+        
+        column_index = parquet_file.schema_arrow.get_field_index(date_column)
+        selected = []
+        for index in row_groups:
+            statistics = metadata.row_group(index).column(column_index).statistics
+            if statistics is None or not statistics.has_min_max or pd.Timestamp(statistics.max) > after:
+                selected.append(index)
+        return selected
+    
+    @staticmethod
+    def _columns(available: List[str], dtypes: Dict[str, str], date_column: str) -> List[str]:
+        return [date_column, *(column for column in dtypes if column in available)]
+    
+    @staticmethod
+    def _present(df: pd.DataFrame, dtypes: Dict[str, str]) -> Dict[str, str]:
+        return {column: dtype for column, dtype in dtypes.items() if column in df.columns}
+    
+    @classmethod
+    def _prepare(cls, df: pd.DataFrame, dtypes: Dict[str, str], date_column: str) -> pd.DataFrame:
+        typed = df.astype(cls._present(df, dtypes))
+        typed[date_column] = pd.to_datetime(typed[date_column], format='%Y-%m-%d')
+        return typed.sort_values(date_column, kind='stable').reset_index(drop=True)
+    
+    @classmethod
+    def _normalize(cls, df: pd.DataFrame, dtypes: Dict[str, str], date_column: str) -> pd.DataFrame:
+        df = df.astype(cls._present(df, dtypes))
+        df[date_column] = df[date_column].astype('datetime64[ns]')
+        return df
@@ -1,10 +1,15 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, Optional
 from .utils.generator import DataGenerator
 from .etl.extractor import DataExtractor
 from .etl.transformer import DataTransformer
 from .etl.loader import DataLoader
 from .database.connection import DatabaseConnection
 from .database.schema import SchemaManager
+from .database.metadata import WarehouseMetadata
+from .database.aggregates import AggregateManager
 
 
 class WarehouseFacade:
@@ -28,11 +33,16 @@ class WarehouseFacade:
         self.schema_manager = SchemaManager(self.db_connection)
         self.schema_manager.create_all_tables()
         self.schema_manager.initialize_reference_data()
+        AggregateManager(self.db_connection).ensure_populated()
+        
+        metadata = WarehouseMetadata(self.db_connection)
+        if None in metadata.get_high_water_marks().values():
+            metadata.refresh_high_water_marks()
         
         return self
     
-    def generate_raw_data(self, start_date: str, end_date: str):
-        generator = DataGenerator(self.lottery_csv, self.revenue_csv)
+    def generate_raw_data(self, start_date: str, end_date: str, engine: str = 'python', seed: Optional[int] = None):
+        generator = DataGenerator(self.lottery_csv, self.revenue_csv, engine=engine, seed=seed)
         lottery_df, revenue_df = generator.generate(start_date, end_date)
         
         return {
@@ -41,25 +51,82 @@ class WarehouseFacade:
             'date_range': {'start': start_date, 'end': end_date}
         }
     
-    def load_data_to_warehouse(self):
+    def generate_scaled_data(
+        self,
+        start_date: str,
+        years: int = 1,
+        stations: int = 1,
+        agencies: int = 1,
+        draw_days_factor: int = 1,
+        seed: Optional[int] = None
+    ):
+        generator = DataGenerator(self.lottery_csv, self.revenue_csv, engine='numpy', seed=seed)
+        return generator.generate_scaled(start_date, years=years, stations=stations, agencies=agencies,
+                                         draw_days_factor=draw_days_factor)
+    
+    def load_data_to_warehouse(
+        self,
+        incremental: bool = False,
+        chunk_size: Optional[int] = None,
+        load_profile: str = 'bulk-load',
+        parallel: bool = False
+    ):
         if self.db_connection is None:
             raise RuntimeError("Database not initialized. Call initialize_database() first.")
         
-        extractor = DataExtractor(self.lottery_csv, self.revenue_csv)
-        extractor.extract()
+        self.db_connection.apply_profile(load_profile)
+        try:
+            return self._load_data_to_warehouse(incremental, chunk_size, parallel)
+        finally:
+            self.db_connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.db_connection.apply_profile('default')
+    
+    def _load_data_to_warehouse(self, incremental: bool, chunk_size: Optional[int], parallel: bool):
+        started = time.perf_counter()
+        timings = {}
+        metadata = WarehouseMetadata(self.db_connection)
+        high_water_marks = metadata.get_high_water_marks() if incremental else None
+        extractor = DataExtractor(self.lottery_csv, self.revenue_csv, high_water_marks)
+        
+        if not incremental:
+            self.schema_manager.drop_indexes()
+        try:
+            if chunk_size:
+                result = self._stream_data_to_warehouse(extractor, chunk_size)
+                timings['stream'] = time.perf_counter() - started
+            else:
+                result = self._batch_load_data(extractor, parallel, timings)
+        finally:
+            # A failed full load must not leave the warehouse without its indexes
+            self._timed(timings, 'indexes', self.schema_manager.create_indexes)
+        timings['total'] = time.perf_counter() - started
         
-        validation = extractor.validate_data()
+        return {
+            'mode': 'incremental' if incremental else 'full',
+            'high_water_marks': metadata.refresh_high_water_marks(),
+            **result,
+            'timings': self._round_timings(timings)
+        }
+    
+    def _batch_load_data(self, extractor: DataExtractor, parallel: bool, timings: Dict[str, float]) -> Dict:
+        if parallel:
+            transformer = self._extract_transform_parallel(extractor, timings)
+        else:
+            self._timed(timings, 'extract', extractor.extract)
+        
+        validation = self._timed(timings, 'validate', extractor.validate_data)
         if not validation['valid']:
             raise ValueError(f"Data validation failed: {validation['errors']}")
         
         lottery_data = extractor.get_lottery_data()
         revenue_data = extractor.get_revenue_data()
         
-        transformer = DataTransformer(lottery_data, revenue_data)
-        transformer.transform_all()
+        if not parallel:
+            transformer = DataTransformer(lottery_data, revenue_data)
+            self._timed(timings, 'transform', transformer.transform_all)
         
         loader = DataLoader(self.db_connection, transformer)
-        loader.load_all()
+        self._timed(timings, 'load', loader.load_all)
         
         return {
             'extract': {
@@ -70,7 +137,77 @@ class WarehouseFacade:
             'load': loader.get_load_summary()
         }
     
-    def full_etl_pipeline(self, start_date: str, end_date: str):
+    def _extract_transform_parallel(self, extractor: DataExtractor, timings: Dict[str, float]) -> DataTransformer:
+        transformer = DataTransformer(None, None)
+        
+        def lottery_branch() -> Dict[str, float]:
+            branch = {}
+            transformer.lottery_df = self._timed(branch, 'extract_lottery', extractor.get_lottery_data)
+            self._timed(branch, 'transform_lottery', transformer.transform_lottery)
+            return branch
+        
+        def revenue_branch() -> Dict[str, float]:
+            branch = {}
+            transformer.revenue_df = self._timed(branch, 'extract_revenue', extractor.get_revenue_data)
+            self._timed(branch, 'transform_revenue', transformer.transform_revenue)
+            return branch
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='etl') as executor:
+            futures = [executor.submit(lottery_branch), executor.submit(revenue_branch)]
+            for future in futures:
+                timings.update(future.result())
+        timings['extract_transform'] = time.perf_counter() - started
+        
+        self._timed(timings, 'merge_dim_date', transformer.get_dim_date)
+        return transformer
+    
+    @staticmethod
+    def _timed(timings: Dict[str, float], stage: str, func):
+        started = time.perf_counter()
+        result = func()
+        timings[stage] = time.perf_counter() - started
+        return result
+    
+    @staticmethod
+    def _round_timings(timings: Dict[str, float]) -> Dict[str, float]:
+        return {stage: round(seconds, 4) for stage, seconds in timings.items()}
+    
+    def _stream_data_to_warehouse(self, extractor: DataExtractor, chunk_size: int):
+        chunks = (
+            (source, DataTransformer(lottery_chunk, revenue_chunk))
+            for source, lottery_chunk, revenue_chunk in extractor.iter_chunks(chunk_size)
+        )
+        loader = DataLoader(self.db_connection, None)
+        loader.load_stream(chunks)
+        
+        load_summary = loader.get_load_summary()
+        chunk_stats = load_summary.get('chunks', [])
+        lottery_rows = sum(c['rows'] for c in chunk_stats if c['source'] == 'lottery')
+        revenue_rows = sum(c['rows'] for c in chunk_stats if c['source'] == 'revenue')
+        
+        return {
+            'extract': {
+                'lottery_records': lottery_rows,
+                'revenue_records': revenue_rows,
+                'chunk_size': chunk_size
+            },
+            'transform': {
+                'chunks': len(chunk_stats),
+                'fact_lottery_records': lottery_rows,
+                'fact_revenue_records': revenue_rows
+            },
+            'load': load_summary
+        }
+    
+    def full_etl_pipeline(
+        self,
+        start_date: str,
+        end_date: str,
+        incremental: bool = False,
+        chunk_size: Optional[int] = None,
+        parallel: bool = False
+    ):
         print("=" * 70)
         print("FULL ETL PIPELINE")
         print("=" * 70)
@@ -89,15 +226,23 @@ class WarehouseFacade:
         
         print("\n🔄 Step 3: ETL Process")
         print("-" * 70)
-        etl_result = self.load_data_to_warehouse()
+        etl_result = self.load_data_to_warehouse(
+            incremental=incremental,
+            chunk_size=chunk_size,
+            parallel=parallel
+        )
+        print(f"Mode: {etl_result['mode']}{' (parallel extract/transform)' if parallel else ''}")
         
         print(f"\n📥 Extract:")
         print(f"   - Lottery: {etl_result['extract']['lottery_records']:,} records")
         print(f"   - Revenue: {etl_result['extract']['revenue_records']:,} records")
         
         print(f"\n🔧 Transform:")
-        print(f"   - Dim_Date: {etl_result['transform']['dim_date_records']:,} records")
-        print(f"   - Dim_Agency: {etl_result['transform']['dim_agency_records']:,} records")
+        if 'chunks' in etl_result['transform']:
+            print(f"   - Chunks: {etl_result['transform']['chunks']:,}")
+        else:
+            print(f"   - Dim_Date: {etl_result['transform']['dim_date_records']:,} records")
+            print(f"   - Dim_Agency: {etl_result['transform']['dim_agency_records']:,} records")
         print(f"   - Fact_Lottery: {etl_result['transform']['fact_lottery_records']:,} records")
         print(f"   - Fact_Revenue: {etl_result['transform']['fact_revenue_records']:,} records")
         
@@ -105,6 +250,14 @@ class WarehouseFacade:
         for table, count in etl_result['load']['loaded_counts'].items():
             print(f"   - {table}: {count:,} records loaded")
         print(f"   - Total: {etl_result['load']['total_loaded']:,} records")
+        for source, last_date_id in etl_result['high_water_marks'].items():
+            print(f"   - High-water mark ({source}): {last_date_id}")
+        if 'peak_rss_mb' in etl_result['load']:
+            print(f"   - Peak RSS: {etl_result['load']['peak_rss_mb']:,.1f} MB")
+        
+        print(f"\n⏱️  Timings:")
+        for stage, seconds in etl_result['timings'].items():
+            print(f"   - {stage}: {seconds:,.3f}s")
         
         print("\n" + "=" * 70)
         print("✅ ETL PIPELINE COMPLETED SUCCESSFULLY")
@@ -120,7 +273,8 @@ class WarehouseFacade:
         
         tables = [
             'Dim_Date', 'Dim_Station', 'Dim_Prize', 'Dim_Agency',
-            'Fact_Lottery_Result', 'Fact_Revenue'
+            'Fact_Lottery_Result', 'Fact_Revenue', 'Warehouse_Metadata',
+            'Agg_Revenue_Daily', 'Agg_Revenue_Daily_Station', 'Agg_Lottery_Number_Count'
         ]
         
         for table in tables:
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from src.analysis.revenue import RevenueAnalysis
+from src.forecasting import RevenueForecasting, WalkForwardBacktester
+from warehouse_fixtures import temp_warehouse
+
+
+def naive_walk_forward(history: pd.DataFrame, origin: int, horizon: int) -> np.ndarray:
+    strategy = RevenueForecasting()
+    features = strategy.prepare_features(history.iloc[:origin])
+    strategy.fit(features[RevenueForecasting.FEATURE_COLUMNS], features['total_revenue'])
+    return strategy.forecast_from_features(features, horizon)['predicted_revenue'].to_numpy()
+
+
+def test_backtest():
+    print("\n" + "=" * 70)
+    print("TEST WALK-FORWARD BACKTEST")
+    print("=" * 70)
+
+    with temp_warehouse('2021-01-01', '2024-12-31', engine='numpy', seed=11) as facade:
+        history = RevenueAnalysis(facade.db_connection).get_monthly_revenue_summary()
+
+    backtester = WalkForwardBacktester(horizon=6, min_train=24, max_workers=1)
+    predictions = backtester.run(history)
+    n_folds = len(history) - 24
+    print(f"\n1. {n_folds} folds over {len(history)} months -> {len(predictions)} predictions")
+    assert predictions['origin'].nunique() == n_folds
+    assert len(predictions) == sum(min(6, len(history) - origin) for origin in range(24, len(history)))
+
+    for origin in (24, 30, len(history) - 1):
+        fold = predictions[predictions['train_size'] == origin]
+        expected = naive_walk_forward(history, origin, len(fold))
+        assert np.allclose(fold['predicted'].to_numpy(), expected)
+    print("2. Shared features give the same forecasts as re-preparing each fold")
+
+    pooled = WalkForwardBacktester(horizon=6, min_train=24, max_workers=2).run(history)
+    print("3. Process pool returns the same folds as the inline run")
+    assert pooled.equals(predictions)
+
+    summary = WalkForwardBacktester.summarize(predictions)
+    print("4. Metrics per horizon:")
+    print(summary.to_string(index=False))
+    assert summary['horizon'].tolist() == list(range(1, 7))
+    assert summary['folds'].is_monotonic_decreasing
+    assert summary[WalkForwardBacktester.METRIC_COLUMNS].notna().all().all()
+
+    rolling = WalkForwardBacktester(horizon=3, min_train=12, train_window=12, max_workers=1).run(history)
+    print("5. Rolling window trains on a fixed number of months")
+    assert (rolling['train_size'] == 12).all()
+
+    zeroed = history.copy()
+    zeroed.loc[zeroed.index[-3:], 'total_revenue'] = 0
+    zero_summary = WalkForwardBacktester.summarize(WalkForwardBacktester(horizon=3, max_workers=1).run(zeroed))
+    print("6. Zero-revenue months are left out of MAPE instead of producing inf")
+    assert np.isfinite(zero_summary['MAPE']).all()
+
+    comparison = backtester.compare(history, {'linear': RevenueForecasting})
+    print("7. compare() labels each strategy's horizon table")
+    assert comparison.drop(columns='strategy').equals(summary)
+
+    try:
+        WalkForwardBacktester(min_train=60).run(history)
+        assert False, "expected ValueError"
+    except ValueError as e:
+        print(f"8. Short history rejected: {e}")
+
+    print("\n✅ Walk-forward backtest aggregates errors per horizon across folds")
+
+
+if __name__ == "__main__":
+    test_backtest()
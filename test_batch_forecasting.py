@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from src.forecasting import BatchForecaster, RevenueForecasting
+from warehouse_fixtures import temp_warehouse
+
+
+def test_batch_forecasting():
+    print("\n" + "=" * 70)
+    print("TEST BATCH FORECASTING")
+    print("=" * 70)
+
+    with temp_warehouse('2023-01-01', '2024-12-31', engine='numpy', seed=5) as facade:
+        batch = BatchForecaster(facade.db_connection, max_workers=1)
+        series = batch.load_series()
+        n_series = len(series.groupby(BatchForecaster.SERIES_KEYS))
+        print(f"\n1. Loaded {n_series} station x agency series in one query ({len(series)} rows)")
+        sold = series[series['total_revenue'] > 0].groupby(BatchForecaster.SERIES_KEYS)['year_month'].min()
+        spans = series.groupby(BatchForecaster.SERIES_KEYS)['year_month'].agg(['min', 'max', 'size'])
+        assert spans['min'].equals(sold.rename('min'))
+        assert (spans['max'] == '2024-12').all()
+        months = pd.PeriodIndex(spans['max'], freq='M') - pd.PeriodIndex(spans['min'], freq='M')
+        assert (spans['size'].to_numpy() == np.array([offset.n for offset in months]) + 1).all()
+
+        features = BatchForecaster.prepare_batch_features(series)
+        station, agency = series.iloc[0][BatchForecaster.SERIES_KEYS]
+        single = series[(series['station_name'] == station) & (series['agency_name'] == agency)]
+        expected = RevenueForecasting().prepare_features(single.reset_index(drop=True))
+        batched = features[(features['station_name'] == station) & (features['agency_name'] == agency)]
+        columns = RevenueForecasting.FEATURE_COLUMNS
+        print(f"2. Batch features match prepare_features for {station} / {agency}")
+        assert np.allclose(batched[columns].to_numpy(float), expected[columns].to_numpy(float))
+
+        result = batch.forecast(months=6, series=series)
+        print(f"3. Forecast: {len(result)} rows, columns {list(result.columns)}")
+        assert len(result) == n_series * 6
+        assert result[BatchForecaster.METRIC_COLUMNS].notna().all().all()
+        assert (result['predicted_revenue'] >= 0).all()
+
+        train_size = int(len(batched) * 0.8)
+        train, test = batched.iloc[:train_size], batched.iloc[train_size:]
+        model = RevenueForecasting().fit(train[columns], train['total_revenue'])
+        holdout = model.forecast_from_features(train, len(test))
+        expected_mae = np.abs(holdout['predicted_revenue'].to_numpy() - test['total_revenue'].to_numpy()).mean()
+        row = result[(result['station_name'] == station) & (result['agency_name'] == agency)].iloc[0]
+        print("   Per-series metrics score a recursive forecast over the test span")
+        assert np.isclose(row['MAE'], expected_mae)
+
+        pooled = BatchForecaster(facade.db_connection, max_workers=2).forecast(months=6, series=series)
+        print("4. Process pool returns the same frame as the inline run")
+        assert pooled.equals(result)
+
+        strict = BatchForecaster(facade.db_connection, max_workers=1, min_history=36)
+        print("5. Series shorter than min_history are skipped")
+        assert strict.forecast(months=6, series=series).empty
+        assert len(strict.skipped_series) == n_series
+
+        sparse = series.copy()
+        in_series = (sparse['station_name'] == station) & (sparse['agency_name'] == agency)
+        later = sparse['year_month'] > sparse.loc[in_series, 'year_month'].min()
+        sparse.loc[in_series & later, 'total_revenue'] = 0.0
+        sparse_batch = BatchForecaster(facade.db_connection, max_workers=1)
+        print("6. Zero-filled months do not count towards min_history")
+        assert len(sparse_batch.forecast(months=6, series=sparse)) == (n_series - 1) * 6
+        assert sparse_batch.skipped_series.values.tolist() == [[station, agency]]
+
+    print("\n✅ Batch forecasts cover every series with per-series metrics")
+
+
+if __name__ == "__main__":
+    test_batch_forecasting()
@@ -0,0 +1,52 @@
+import tempfile
+from pathlib import Path
+
+from bench_suite import main
+from src.benchmark import BenchmarkSuite, compare_results, load_results, save_results
+
+
+def test_benchmark_suite():
+    print("\n" + "=" * 70)
+    print("TEST BENCHMARK SUITE")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = BenchmarkSuite(tmp_dir, repeats=2, etl_repeats=1).run(['sf1'], progress=lambda message: None)
+        sf1 = results['scales']['sf1']
+
+        print(f"\n1. Dataset: {sf1['dataset']}")
+        assert set(sf1['etl']) == set(BenchmarkSuite.ETL_STAGES)
+        assert sf1['etl']['total']['peak_mb'] is not None
+        assert sf1['etl']['load']['throughput_unit'] == 'rows/s'
+
+        print(f"2. Timed {len(sf1['analysis'])} analysis and {len(sf1['forecasting'])} forecasting methods")
+        assert 'RevenueAnalysis.get_daily_revenue_trend' in sf1['analysis']
+        assert 'LotteryAnalysis.get_hot_cold_numbers' in sf1['analysis']
+        assert 'RevenueForecasting.forecast_next_months' in sf1['forecasting']
+        for stats in sf1['analysis'].values():
+            assert stats['samples'] == 2 and stats['p95_ms'] >= stats['p50_ms'] > 0
+
+        current_path = str(Path(tmp_dir) / "current.json")
+        baseline_path = str(Path(tmp_dir) / "baseline.json")
+        save_results(results, current_path)
+        assert load_results(current_path) == results
+
+        print("3. Unchanged results compare clean")
+        assert not any(c['regression'] for c in compare_results(results, results))
+        save_results(results, baseline_path)
+        assert main(['--compare', current_path, '--baseline', baseline_path]) == 0
+
+        print("4. A 10x slower query against the baseline is flagged")
+        baseline = load_results(baseline_path)
+        slow = baseline['scales']['sf1']['analysis']['LotteryAnalysis.get_number_frequency']
+        slow['p50_ms'] = slow['p95_ms'] = slow['p50_ms'] / 10
+        save_results(baseline, baseline_path)
+        flagged = [c for c in compare_results(results, baseline) if c['regression']]
+        assert [c['benchmark'] for c in flagged] == ['analysis.LotteryAnalysis.get_number_frequency'] * 2
+        assert main(['--compare', current_path, '--baseline', baseline_path]) == 1
+
+        print("\n✅ Benchmark results round-trip through JSON and regressions are flagged")
+
+
+if __name__ == "__main__":
+    test_benchmark_suite()
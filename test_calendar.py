@@ -0,0 +1,45 @@
+import pandas as pd
+
+from src.etl.transformer import DataTransformer
+from warehouse_fixtures import temp_warehouse
+
+
+def test_calendar():
+    print("\n" + "=" * 70)
+    print("TEST DIM_DATE CALENDAR")
+    print("=" * 70)
+
+    lottery = pd.DataFrame({'draw_date': pd.to_datetime(['2024-02-27', '2024-03-03'])})
+    revenue = pd.DataFrame({'sale_date': pd.to_datetime(['2024-02-29'])})
+
+    for future_days in (0, 5, DataTransformer.DEFAULT_FUTURE_DAYS):
+        dim_date = DataTransformer(lottery, revenue, future_days=future_days).get_dim_date()
+        dates = pd.to_datetime(dim_date['full_date'])
+        print(f"\n{future_days} future days: {dim_date['full_date'].iloc[0]} .. {dim_date['full_date'].iloc[-1]}")
+        assert dates.iloc[0] == pd.Timestamp('2024-02-27')
+        assert dates.iloc[-1] == pd.Timestamp('2024-03-03') + pd.Timedelta(days=future_days)
+        assert (dates.diff().dropna() == pd.Timedelta(days=1)).all()
+        assert dim_date['next_date_id'].iloc[:-1].tolist() == dim_date['date_id'].iloc[1:].tolist()
+        assert dim_date['next_date_id'].iloc[-1] == int((dates.iloc[-1] + pd.Timedelta(days=1)).strftime('%Y%m%d'))
+
+    leap = DataTransformer(lottery, revenue, future_days=0).get_dim_date().set_index('full_date')
+    print("\nLeap day and month ends chain through next_date_id")
+    assert leap.loc['2024-02-28', 'next_date_id'] == 20240229
+    assert leap.loc['2024-02-29', 'next_date_id'] == 20240301
+    assert leap.loc['2024-02-29', 'is_month_end'] == 1
+
+    empty = DataTransformer(lottery.iloc[:0], revenue.iloc[:0]).get_dim_date()
+    assert empty.empty and 'next_date_id' in empty
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        rows = facade.db_connection.fetchall("SELECT date_id, full_date, next_date_id FROM Dim_Date ORDER BY date_id")
+        print(f"\nWarehouse calendar: {rows[0]['full_date']} .. {rows[-1]['full_date']} ({len(rows)} days)")
+        assert len(rows) == 31 + DataTransformer.DEFAULT_FUTURE_DAYS
+        assert [row['next_date_id'] for row in rows[:-1]] == [row['date_id'] for row in rows[1:]]
+        assert rows[-1]['full_date'] == (pd.Timestamp('2024-01-31') + pd.Timedelta(days=366)).strftime('%Y-%m-%d')
+
+    print("\n✅ Dim_Date covers every day through the future horizon with a linked successor")
+
+
+if __name__ == "__main__":
+    test_calendar()
@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+import time
+
+from src.database import ConnectionPool
+from warehouse_fixtures import temp_warehouse
+
+
+def test_connection_pool():
+    print("\n" + "=" * 70)
+    print("TEST CONNECTION POOL")
+    print("=" * 70)
+
+    with temp_warehouse() as facade:
+        pool = ConnectionPool(facade.db_path, size=2, timeout=5)
+
+        try:
+            with pool.writer() as db:
+                db.execute("CREATE TABLE Numbers (value INTEGER)")
+                db.executemany("INSERT INTO Numbers (value) VALUES (?)", [(i,) for i in range(100)])
+
+            totals = []
+            def read():
+                with pool.reader() as db:
+                    with pool.reader() as nested:
+                        assert nested is db
+                    time.sleep(0.05)
+                    totals.append(db.fetchone("SELECT SUM(value) as total FROM Numbers")['total'])
+
+            threads = [threading.Thread(target=read) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            metrics = pool.get_metrics()
+            print(f"\n1. Concurrent reads: {metrics}")
+            assert totals == [4950] * 6
+            assert metrics['checkouts'] == 6
+            assert metrics['waits'] > 0
+            assert metrics['open_connections'] == 3
+            assert metrics['readers_in_use'] == 0
+
+            with pool.reader() as db:
+                try:
+                    db.execute("DELETE FROM Numbers")
+                    raise AssertionError("Reader connection accepted a write")
+                except sqlite3.OperationalError:
+                    pass
+                db.conn.close()
+
+            with pool.reader() as db:
+                assert db.fetchone("SELECT COUNT(*) as cnt FROM Numbers")['cnt'] == 100
+            print(f"\n2. After broken reader: {pool.get_metrics()}")
+            assert pool.get_metrics()['health_check_failures'] == 1
+
+            print("\n✅ Connection pool shares, limits and heals connections")
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    test_connection_pool()
@@ -0,0 +1,30 @@
+import numpy as np
+
+from bench_forecast import legacy_forecast_next_months, monthly_history
+from src.forecasting import RevenueForecasting
+
+
+def test_forecast_vectorized():
+    print("\n" + "=" * 70)
+    print("TEST VECTORIZED RECURSIVE FORECAST")
+    print("=" * 70)
+
+    for years, months in ((1, 72), (3, 24), (10, 72)):
+        history = monthly_history(years, seed=years)
+        forecaster = RevenueForecasting()
+        features = forecaster.prepare_features(history)
+        forecaster.fit(features[RevenueForecasting.FEATURE_COLUMNS], features['total_revenue'])
+
+        expected = legacy_forecast_next_months(forecaster, history, months)
+        result = forecaster.forecast_next_months(history, months)
+
+        print(f"\n{years} year(s) of history, {months} months ahead: {len(result)} rows")
+        assert list(result.columns) == ['year_month', 'predicted_revenue']
+        assert (result['year_month'] == expected['year_month']).all()
+        assert np.allclose(result['predicted_revenue'], expected['predicted_revenue'], rtol=1e-9, atol=1e-3)
+
+    print("\n✅ NumPy recursion matches the per-step DataFrame forecast")
+
+
+if __name__ == "__main__":
+    test_forecast_vectorized()
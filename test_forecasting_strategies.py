@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+
+from src.forecasting import (
+    BatchForecaster, GradientBoostingForecasting, HoltWintersForecasting, ModelRegistry, RidgeForecasting,
+    SeasonalNaiveForecasting, StrategySelector, WalkForwardBacktester, train_revenue_model
+)
+from warehouse_fixtures import temp_warehouse
+
+
+def synthetic_history(months: int = 72, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    t = np.arange(months)
+    revenue = 1e11 + 1e9 * t + 8e9 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1e9, months)
+    return pd.DataFrame({
+        'year_month': pd.period_range('2018-01', periods=months, freq='M').strftime('%Y-%m'),
+        'total_revenue': revenue
+    })
+
+
+def test_forecasting_strategies():
+    print("\n" + "=" * 70)
+    print("TEST FORECASTING STRATEGIES")
+    print("=" * 70)
+
+    history = synthetic_history()
+    ridge = RidgeForecasting(alpha=1.0)
+    features = ridge.prepare_features(history)
+    X, y = features[ridge.FEATURE_COLUMNS], features['total_revenue']
+
+    ridge.fit(X, y)
+    scaled = StandardScaler().fit_transform(X)
+    reference = Ridge(alpha=1.0).fit(scaled, y).predict(scaled)
+    print("\n1. Closed-form ridge matches sklearn Ridge on standardized features")
+    assert np.allclose(ridge.predict(X), reference, rtol=1e-9)
+
+    incremental = RidgeForecasting(alpha=1.0).fit(X.iloc[:40], y.iloc[:40]).partial_fit(X.iloc[40:], y.iloc[40:])
+    print("2. partial_fit on two batches equals one fit on all rows")
+    assert np.allclose(incremental.predict(X), ridge.predict(X), rtol=1e-9)
+
+    naive = SeasonalNaiveForecasting().fit(X, y)
+    forecast = naive.forecast_from_features(features, 24)['predicted_revenue'].to_numpy()
+    print("3. Seasonal naive repeats the last season")
+    assert np.array_equal(forecast, np.tile(y.to_numpy()[-12:], 2))
+
+    train, test = features.iloc[:60], features.iloc[60:]
+    holt_winters = HoltWintersForecasting().fit(train[['month_index']], train['total_revenue'])
+    naive_mape = SeasonalNaiveForecasting().fit(train[['month_index']], train['total_revenue']).evaluate(
+        test[['month_index']], test['total_revenue'])['MAPE']
+    hw_mape = holt_winters.evaluate(test[['month_index']], test['total_revenue'])['MAPE']
+    print(f"4. Holt-Winters tracks the trend: MAPE {hw_mape:.2f}% vs seasonal naive {naive_mape:.2f}%")
+    assert hw_mape < naive_mape
+
+    boosting = GradientBoostingForecasting().fit(X.iloc[:60], y.iloc[:60])
+    boosted = boosting.forecast_from_features(features.iloc[:60], 12)
+    print(f"5. Gradient boosting forecasts recursively: {len(boosted)} months")
+    assert len(boosted) == 12 and (boosted['predicted_revenue'] >= 0).all()
+
+    rng = np.random.default_rng(1)
+    days = np.arange(364)
+    panel = rng.uniform(1e6, 1e7, (500, 1)) * ((days % 7) < 3) * (1 + 0.001 * days) + rng.normal(0, 1e4, (500, 364))
+    daily = HoltWintersForecasting(season_length=7).forecast_many(panel, 14)
+    single = HoltWintersForecasting(season_length=7).forecast_many(panel[:1], 14)
+    print(f"6. Daily panel: {daily.shape[0]} series x {daily.shape[1]} days fitted in one pass")
+    assert daily.shape == (500, 14)
+    assert np.allclose(daily[0], single[0])
+
+    parameters = (holt_winters.alpha, holt_winters.beta, holt_winters.gamma)
+    before = holt_winters.forecast_from_features(train, 6)
+    holt_winters.forecast_many(panel[:, :60], 6)
+    print("   forecast_many leaves a trained model's parameters untouched")
+    assert (holt_winters.alpha, holt_winters.beta, holt_winters.gamma) == parameters
+    assert holt_winters.forecast_from_features(train, 6).equals(before)
+
+    selector = StrategySelector(
+        strategies={'seasonal_naive': SeasonalNaiveForecasting, 'holt_winters': HoltWintersForecasting,
+                    'ridge': RidgeForecasting},
+        backtester=WalkForwardBacktester(horizon=6, min_train=36, step=3, max_workers=1)
+    )
+    best = selector.select(history)
+    print("7. Selector ranks strategies by mean backtest MAPE:")
+    print(selector.scores.to_string())
+    assert selector.best_name == selector.scores['MAPE'].idxmin()
+    assert isinstance(best, selector.strategies[selector.best_name]) and best.is_trained
+
+    with temp_warehouse('2024-01-01', '2024-12-31', engine='numpy', seed=4) as facade:
+        db = facade.db_connection
+
+        trained, _ = train_revenue_model(db, RidgeForecasting)
+        registry = ModelRegistry(str(Path(facade.db_path).parent / "models"))
+        registry.get_or_train(db, RidgeForecasting)
+        reloaded = ModelRegistry(str(Path(facade.db_path).parent / "models")).get_or_train(db, RidgeForecasting)
+        print("8. Ridge trains through train_revenue_model and round-trips through the registry")
+        assert isinstance(reloaded, RidgeForecasting)
+        assert np.allclose(reloaded.coef_, trained.coef_)
+
+        batch = BatchForecaster(db, max_workers=1)
+        keys, dates, values = batch.load_daily_panel()
+        result = batch.forecast_daily(days=14, panel=(keys, dates, values))
+        print(f"9. Daily station x agency forecast: {len(keys)} series, {len(result)} rows")
+        assert values.shape == (len(keys), len(dates))
+        assert len(result) == len(keys) * 14
+        assert result['date'].min() == dates[-1] + pd.Timedelta(days=1)
+
+        weekly = HoltWintersForecasting(season_length=7)
+        batch.forecast_daily(days=14, strategy=weekly, panel=(keys, dates, values))
+        print("   A caller-supplied strategy is not refitted by forecast_daily")
+        assert weekly.alpha is None and not weekly.is_trained
+
+    print("\n✅ Ridge, baselines, gradient boosting and the selector share the ForecastingStrategy interface")
+
+
+if __name__ == "__main__":
+    test_forecasting_strategies()
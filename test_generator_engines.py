@@ -0,0 +1,93 @@
+import tempfile
+from pathlib import Path
+
+from src.utils.generator import DataGenerator
+from warehouse_fixtures import make_facade
+
+
+def build(tmp_dir: str, engine: str, seed: int):
+    generator = DataGenerator(
+        str(Path(tmp_dir) / "lottery_results.csv"),
+        str(Path(tmp_dir) / "revenue_data.csv"),
+        engine=engine,
+        seed=seed
+    )
+    return generator.build('2024-01-01', '2024-03-31')
+
+
+def test_generator_engines():
+    print("\n" + "=" * 70)
+    print("TEST GENERATOR ENGINES")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        python_lottery, python_revenue = build(tmp_dir, 'python', 1)
+        numpy_lottery, numpy_revenue = build(tmp_dir, 'numpy', 1)
+        again_lottery, again_revenue = build(tmp_dir, 'numpy', 1)
+        other_lottery, _ = build(tmp_dir, 'numpy', 2)
+
+        print(f"\n1. Lottery rows: python {len(python_lottery):,}, numpy {len(numpy_lottery):,}")
+        assert list(numpy_lottery.columns) == list(python_lottery.columns)
+        assert list(numpy_revenue.columns) == list(python_revenue.columns)
+        assert len(numpy_lottery) == len(python_lottery)
+        slots = ['draw_date', 'station_name', 'prize_name', 'prize_sequence']
+        assert (numpy_lottery[slots].astype(str).values == python_lottery[slots].astype(str).values).all()
+        assert (numpy_lottery['result_number'].str.len() == python_lottery['result_number'].str.len()).all()
+
+        print(f"2. Revenue rows: python {len(python_revenue):,}, numpy {len(numpy_revenue):,}")
+        station_days = numpy_revenue.groupby(['sale_date', 'station_name'], observed=True).size()
+        assert station_days.between(2, 4).all()
+        assert abs(numpy_revenue['tickets_sold'].mean() / python_revenue['tickets_sold'].mean() - 1) < 0.1
+
+        print("3. Same seed reproduces the output, a different seed does not")
+        assert numpy_lottery.equals(again_lottery) and numpy_revenue.equals(again_revenue)
+        assert not numpy_lottery['result_number'].equals(other_lottery['result_number'])
+
+        print("\n✅ NumPy engine matches the python generator's shape")
+
+
+def test_scaled_generator():
+    print("\n" + "=" * 70)
+    print("TEST SCALE-FACTOR GENERATOR")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        contents = []
+        for run in range(2):
+            facade = make_facade(tmp_dir, db_name=f"scaled_{run}", raw_prefix=f"{run}_")
+            try:
+                generated = facade.generate_scaled_data('2024-01-01', years=1, stations=3, agencies=2,
+                                                        draw_days_factor=2, seed=11)
+                facade.initialize_database()
+                loaded = facade.load_data_to_warehouse()
+                regions = facade.db_connection.fetchall(
+                    "SELECT region, COUNT(*) AS stations FROM Dim_Station GROUP BY region ORDER BY region"
+                )
+                replicas = facade.db_connection.fetchall(
+                    "SELECT station_name, region FROM Dim_Station WHERE station_name IN ('Đà Nẵng 3', 'Hà Nội 2')"
+                )
+            finally:
+                facade.close()
+            contents.append((Path(facade.lottery_csv).read_bytes(), Path(facade.revenue_csv).read_bytes()))
+
+        print(f"\n1. Generated: {generated}")
+        assert generated['stations'] == 30 and generated['agencies'] == 16
+        assert generated['partitions'] == 13
+        assert generated['date_range'] == {'start': '2024-01-01', 'end': '2024-12-31'}
+
+        print(f"2. Loaded: {loaded['load']['loaded_counts']}")
+        assert loaded['load']['loaded_counts']['dim_station'] == 20
+        assert loaded['load']['loaded_counts']['fact_revenue'] == generated['revenue_records']
+        print(f"   Stations per region: {[tuple(row) for row in regions]}")
+        assert 'Unknown' not in {row['region'] for row in regions}
+        assert {row['station_name']: row['region'] for row in replicas} == {'Đà Nẵng 3': 'Central', 'Hà Nội 2': 'North'}
+
+        print("3. Same seed writes identical partitions")
+        assert contents[0] == contents[1]
+
+        print("\n✅ Scaled datasets load with the expected cardinality")
+
+
+if __name__ == "__main__":
+    test_generator_engines()
+    test_scaled_generator()
@@ -0,0 +1,76 @@
+from src.analysis.lottery import LotteryAnalysis
+from src.analysis.revenue import RevenueAnalysis
+from src.database.schema import SchemaManager
+from warehouse_fixtures import temp_warehouse
+
+
+def managed_indexes(facade) -> set:
+    rows = facade.db_connection.fetchall("SELECT name FROM sqlite_master WHERE type = 'index'")
+    return {row['name'] for row in rows} & set(SchemaManager.MANAGED_INDEXES)
+
+
+def test_index_management():
+    print("\n" + "=" * 70)
+    print("TEST MANAGED INDEXES AND QUERY PLAN ADVISOR")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        schema = facade.schema_manager
+        print(f"\n1. Full load leaves {len(managed_indexes(facade))} managed indexes")
+        assert managed_indexes(facade) == set(SchemaManager.MANAGED_INDEXES)
+
+        schema.drop_indexes()
+        assert managed_indexes(facade) == set()
+        schema.create_indexes()
+        schema.create_indexes()
+        print("2. drop_indexes() removes them and create_indexes() is idempotent")
+        assert managed_indexes(facade) == set(SchemaManager.MANAGED_INDEXES)
+
+        facade.generate_raw_data('2024-01-01', '2024-02-15')
+        facade.load_data_to_warehouse(incremental=True)
+        print("3. Incremental load keeps every managed index")
+        assert managed_indexes(facade) == set(SchemaManager.MANAGED_INDEXES)
+
+        with open(facade.lottery_csv, 'a', encoding='utf-8') as f:
+            f.write("2024-02-16,Hà Nội,North,Đặc biệt,1,\n")
+        try:
+            facade.load_data_to_warehouse()
+            raise AssertionError("Load of a lottery file with a missing result did not fail")
+        except ValueError as e:
+            print(f"4. Failed full load ({e}) still restores the indexes")
+        assert managed_indexes(facade) == set(SchemaManager.MANAGED_INDEXES)
+
+        report = schema.explain_analysis_queries()
+        methods = {
+            f"{type(analysis).__name__}.{name}"
+            for analysis in (RevenueAnalysis(None), LotteryAnalysis(None))
+            for name in dir(analysis) if name.startswith('get_')
+        }
+        flagged = [entry['query'] for entry in report if entry['flagged']]
+        print(f"5. Advisor explained {len(report)} queries, flagged: {flagged}")
+        assert {entry['query'] for entry in report} == methods
+        for entry in report:
+            assert set(entry) == {'query', 'plan', 'fact_scans', 'flagged'}
+            assert entry['plan'] and all(isinstance(detail, str) for detail in entry['plan'])
+            assert entry['flagged'] == bool(entry['fact_scans'])
+            assert all(detail.startswith('SCAN ') and detail in entry['plan'] for detail in entry['fact_scans'])
+        assert 'RevenueAnalysis.get_daily_revenue_trend' not in flagged
+
+        def plans_using_managed_indexes(entries) -> set:
+            return {
+                index for entry in entries for detail in entry['plan']
+                for index in SchemaManager.MANAGED_INDEXES if index in detail
+            }
+
+        used = plans_using_managed_indexes(report)
+        schema.drop_indexes()
+        print(f"6. Plans use {sorted(used)}; dropping them changes the plans")
+        assert used
+        assert not plans_using_managed_indexes(schema.explain_analysis_queries())
+        schema.create_indexes()
+
+    print("\n✅ Managed indexes survive every load path and the advisor reports fact scans")
+
+
+if __name__ == "__main__":
+    test_index_management()
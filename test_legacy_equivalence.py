@@ -0,0 +1,331 @@
+import pandas as pd
+
+from bench_hot_cold import LEGACY_QUERY as LEGACY_HOT_COLD_QUERY
+from src.analysis import QueryCache
+from src.analysis.lottery import LotteryAnalysis
+from src.analysis.revenue import RevenueAnalysis
+from warehouse_fixtures import assert_same_rows, legacy_df, temp_warehouse
+
+ALL_ROWS = 100_000
+WINDOW = ('2024-02-01', '2024-04-30')
+
+LEGACY_GROWTH_QUERY = """
+    WITH periodic_revenue AS (
+        SELECT {period} as period, SUM(r.total_revenue) as total_revenue
+        FROM Fact_Revenue r
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        GROUP BY {period}
+    )
+    SELECT
+        period,
+        total_revenue,
+        LAG(total_revenue) OVER (ORDER BY period) as prev_revenue,
+        ROUND(
+            (total_revenue - LAG(total_revenue) OVER (ORDER BY period)) * 100.0 /
+            LAG(total_revenue) OVER (ORDER BY period), 2
+        ) as growth_rate_percent
+    FROM periodic_revenue
+"""
+
+# Fact-table queries the aggregate-backed RevenueAnalysis methods replaced
+LEGACY_REVENUE_QUERIES = {
+    'get_daily_revenue_trend': (WINDOW, f"""
+        SELECT
+            d.full_date,
+            d.day_of_week,
+            d.is_weekend,
+            SUM(r.tickets_sold) as tickets_sold,
+            SUM(r.total_revenue) as total_revenue,
+            SUM(r.total_payout) as total_payout,
+            SUM(r.net_profit) as net_profit,
+            SUM(r.commission) as commission,
+            COUNT(DISTINCT r.station_id) as active_stations,
+            COUNT(DISTINCT r.agency_id) as active_agencies
+        FROM Fact_Revenue r
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        WHERE d.full_date >= '{WINDOW[0]}' AND d.full_date <= '{WINDOW[1]}'
+        GROUP BY d.full_date, d.day_of_week, d.is_weekend
+    """),
+    'get_monthly_revenue_summary': ((), """
+        SELECT
+            d.year,
+            d.month,
+            d.year || '-' || printf('%02d', d.month) as year_month,
+            SUM(r.tickets_sold) as tickets_sold,
+            SUM(r.total_revenue) as total_revenue,
+            SUM(r.total_payout) as total_payout,
+            SUM(r.net_profit) as net_profit,
+            SUM(r.commission) as commission,
+            AVG(r.total_revenue) as avg_daily_revenue
+        FROM Fact_Revenue r
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        GROUP BY d.year, d.month
+    """),
+    'get_revenue_by_station': (WINDOW, f"""
+        SELECT
+            s.station_name,
+            s.region,
+            COUNT(DISTINCT r.date_id) as active_days,
+            SUM(r.tickets_sold) as tickets_sold,
+            SUM(r.total_revenue) as total_revenue,
+            SUM(r.total_payout) as total_payout,
+            SUM(r.net_profit) as net_profit,
+            AVG(r.total_revenue) as avg_revenue_per_day
+        FROM Fact_Revenue r
+        JOIN Dim_Station s ON r.station_id = s.station_id
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        WHERE d.full_date >= '{WINDOW[0]}' AND d.full_date <= '{WINDOW[1]}'
+        GROUP BY s.station_name, s.region
+    """),
+    'get_revenue_by_day_of_week': (WINDOW, f"""
+        SELECT
+            d.day_of_week,
+            d.is_weekend,
+            COUNT(*) as transactions,
+            SUM(r.tickets_sold) as tickets_sold,
+            SUM(r.total_revenue) as total_revenue,
+            AVG(r.total_revenue) as avg_revenue
+        FROM Fact_Revenue r
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        WHERE d.full_date >= '{WINDOW[0]}' AND d.full_date <= '{WINDOW[1]}'
+        GROUP BY d.day_of_week, d.is_weekend
+    """),
+    'get_quarterly_performance': ((), """
+        SELECT
+            d.year,
+            d.quarter,
+            d.year || '-Q' || d.quarter as year_quarter,
+            SUM(r.tickets_sold) as tickets_sold,
+            SUM(r.total_revenue) as total_revenue,
+            SUM(r.total_payout) as total_payout,
+            SUM(r.net_profit) as net_profit,
+            AVG(r.total_revenue) as avg_daily_revenue
+        FROM Fact_Revenue r
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        GROUP BY d.year, d.quarter
+    """),
+    'get_weekend_vs_weekday_comparison': ((), """
+        SELECT
+            CASE WHEN d.is_weekend = 1 THEN 'Weekend' ELSE 'Weekday' END as period_type,
+            COUNT(DISTINCT d.date_id) as days,
+            COUNT(*) as transactions,
+            SUM(r.tickets_sold) as tickets_sold,
+            SUM(r.total_revenue) as total_revenue,
+            AVG(r.total_revenue) as avg_revenue
+        FROM Fact_Revenue r
+        JOIN Dim_Date d ON r.date_id = d.date_id
+        GROUP BY d.is_weekend
+    """),
+    'get_revenue_growth_rate': (('month',), LEGACY_GROWTH_QUERY.format(period="d.year || '-' || printf('%02d', d.month)"))
+}
+
+
+def test_number_suffix_queries():
+    print("\n" + "=" * 70)
+    print("TEST NUMBER SUFFIX QUERIES AGAINST LEGACY SQL")
+    print("=" * 70)
+
+    with temp_warehouse('2023-01-01', '2024-06-30', engine='numpy', seed=6) as facade:
+        lottery = LotteryAnalysis(facade.db_connection)
+
+        for length in (1, 2, 3, 4):
+            assert_same_rows(lottery.get_number_patterns(length), legacy_df(facade, f"""
+                SELECT
+                    SUBSTR(l.result_number, -{length}) as number,
+                    COUNT(*) as frequency,
+                    ROUND(AVG(CAST(SUBSTR(l.result_number, -{length}) AS INTEGER)), 2) as avg_value,
+                    MIN(CAST(SUBSTR(l.result_number, -{length}) AS INTEGER)) as min_value,
+                    MAX(CAST(SUBSTR(l.result_number, -{length}) AS INTEGER)) as max_value
+                FROM Fact_Lottery_Result l
+                GROUP BY number
+                HAVING frequency >= 10
+            """))
+
+            assert_same_rows(lottery.get_consecutive_numbers(length, limit=ALL_ROWS), legacy_df(facade, f"""
+                SELECT
+                    SUBSTR(l.result_number, -{length}) as number,
+                    COUNT(*) as appearance_count,
+                    COUNT(*) * 100.0 / (SELECT COUNT(*) FROM Fact_Lottery_Result) as appearance_rate
+                FROM Fact_Lottery_Result l
+                GROUP BY number
+            """))
+
+            assert_same_rows(lottery.get_number_frequency(length, limit=ALL_ROWS), legacy_df(facade, f"""
+                SELECT
+                    SUBSTR(l.result_number, -{length}) as number_part,
+                    COUNT(*) as frequency,
+                    COUNT(DISTINCT l.date_id) as appeared_on_days
+                FROM Fact_Lottery_Result l
+                JOIN Dim_Prize p ON l.prize_id = p.prize_id
+                WHERE p.digits >= {length}
+                GROUP BY number_part
+            """))
+
+            assert_same_rows(lottery.get_digit_frequency_analysis(-length), legacy_df(facade, f"""
+                SELECT
+                    SUBSTR(l.result_number, -{length}, 1) as digit,
+                    COUNT(*) as frequency,
+                    COUNT(*) * 100.0 / (SELECT COUNT(*) FROM Fact_Lottery_Result) as percentage
+                FROM Fact_Lottery_Result l
+                WHERE LENGTH(l.result_number) >= {length}
+                GROUP BY digit
+            """))
+            print(f"\n{length}. {length}-digit patterns, consecutive, frequency and digit queries match")
+
+        print("\n   Two-digit prizes keep their own groups among three-digit patterns")
+        patterns = lottery.get_number_patterns(3)
+        assert (patterns['number'].str.len() == 2).any()
+
+    print("\n✅ Suffix-column queries return the legacy SUBSTR results")
+
+
+def test_number_cube_windows():
+    print("\n" + "=" * 70)
+    print("TEST NUMBER CUBE WINDOWS AGAINST FACT SQL")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-05-31', engine='numpy', seed=7) as facade:
+        lottery = LotteryAnalysis(facade.db_connection)
+        start, end = WINDOW
+
+        for length in (1, 2, 3):
+            assert_same_rows(lottery.get_number_frequency(length, ALL_ROWS, start, end), legacy_df(facade, f"""
+                SELECT
+                    SUBSTR(l.result_number, -{length}) as number_part,
+                    COUNT(*) as frequency,
+                    COUNT(DISTINCT l.date_id) as appeared_on_days
+                FROM Fact_Lottery_Result l
+                JOIN Dim_Prize p ON l.prize_id = p.prize_id
+                JOIN Dim_Date d ON l.date_id = d.date_id
+                WHERE p.digits >= {length} AND d.full_date >= '{start}' AND d.full_date <= '{end}'
+                GROUP BY number_part
+            """))
+
+            assert_same_rows(lottery.get_number_frequency_by_station_prize(length, start, end), legacy_df(facade, f"""
+                SELECT
+                    s.station_name,
+                    p.prize_name,
+                    SUBSTR(l.result_number, -{length}) as number,
+                    COUNT(*) as frequency,
+                    COUNT(DISTINCT l.date_id) as appeared_on_days
+                FROM Fact_Lottery_Result l
+                JOIN Dim_Date d ON l.date_id = d.date_id
+                JOIN Dim_Station s ON l.station_id = s.station_id
+                JOIN Dim_Prize p ON l.prize_id = p.prize_id
+                WHERE LENGTH(l.result_number) >= {length} AND d.full_date >= '{start}' AND d.full_date <= '{end}'
+                GROUP BY s.station_name, p.prize_name, number
+            """))
+            print(f"\n{length}. {length}-digit windowed and per station/prize counts match the fact table")
+
+        print("\n   Unwindowed frequency counts every loaded date")
+        total = lottery.get_number_frequency(1, ALL_ROWS)['frequency'].sum()
+        assert total == facade.get_warehouse_stats()['Fact_Lottery_Result']
+
+    print("\n✅ Number cube windows match counting the fact table")
+
+
+def test_revenue_aggregates():
+    print("\n" + "=" * 70)
+    print("TEST REVENUE AGGREGATES AGAINST LEGACY SQL")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-03-31') as facade:
+        facade.generate_raw_data('2024-01-01', '2024-05-15')
+        incremental = facade.load_data_to_warehouse(incremental=True)
+        print(f"\nIncremental load: {incremental['load']['loaded_counts']}")
+        assert incremental['load']['loaded_counts']['fact_revenue'] > 0
+
+        revenue = RevenueAnalysis(facade.db_connection)
+        queries = dict(LEGACY_REVENUE_QUERIES)
+        queries['get_revenue_growth_rate (quarter)'] = (
+            ('quarter',), LEGACY_GROWTH_QUERY.format(period="d.year || '-Q' || d.quarter")
+        )
+        for name, (args, query) in queries.items():
+            expected = legacy_df(facade, query)
+            if 'full_date' in expected:
+                expected['full_date'] = pd.to_datetime(expected['full_date'])
+            assert_same_rows(getattr(revenue, name.split()[0])(*args), expected)
+            print(f"   {name} matches the fact table")
+
+    print("\n✅ Aggregate-backed revenue queries match the fact table after an incremental load")
+
+
+def test_hot_cold_numbers():
+    print("\n" + "=" * 70)
+    print("TEST HOT/COLD NUMBERS AGAINST LEGACY SQL")
+    print("=" * 70)
+
+    with temp_warehouse('2023-07-01', '2024-06-30', engine='numpy', seed=8) as facade:
+        cache = QueryCache()
+        lottery = LotteryAnalysis(facade.db_connection, cache=cache)
+
+        # The legacy query anchored on date('now'); a fixed date past which nothing is loaded stands in for it
+        anchor = '2024-06-30'
+        for digit_length in (1, 2, 3):
+            for period_days in (7, 30, 365):
+                legacy = LEGACY_HOT_COLD_QUERY.format(digit_length=digit_length, period_days=period_days, anchor=anchor)
+                result = lottery.get_hot_cold_numbers(digit_length, period_days, anchor=anchor)
+                assert_same_rows(result, legacy_df(facade, legacy))
+        print(f"\n1. Lengths 1-3 over 7, 30 and 365 days anchored on {anchor} match the legacy SQL")
+
+        stats = cache.get_stats()
+        lottery.get_hot_cold_numbers(2, 30, anchor='latest')
+        print("2. 'latest' resolves to the same date before the cache lookup")
+        assert cache.get_stats()['hits'] == stats['hits'] + 1
+
+        lottery.get_hot_cold_numbers(2, 30, anchor='today')
+        today = pd.Timestamp.today().strftime('%Y-%m-%d')
+        end_dates = {dict(arguments)['end_date'] for _, _, arguments in cache._entries}
+        print(f"3. 'today' is cached under its date: {sorted(end_dates)}")
+        assert end_dates == {repr(anchor), repr(today)}
+
+    print("\n✅ Hot/cold numbers match the legacy SQL and are cached on the resolved window")
+
+
+def test_next_day_revenue_impact():
+    print("\n" + "=" * 70)
+    print("TEST NEXT-DAY REVENUE IMPACT AGAINST LEGACY SQL")
+    print("=" * 70)
+
+    with temp_warehouse('2023-12-01', '2024-03-31', engine='numpy', seed=12) as facade:
+        facade.generate_raw_data('2023-12-01', '2024-04-30', engine='numpy', seed=13)
+        facade.load_data_to_warehouse(incremental=True)
+
+        chained = facade.db_connection.fetchone("""
+        SELECT COUNT(*) AS cnt FROM Dim_Date
+        WHERE next_date_id != CAST(strftime('%Y%m%d', full_date, '+1 day') AS INTEGER)
+        """)['cnt']
+        print(f"\n1. Dim_Date rows with a wrong next_date_id: {chained}")
+        assert chained == 0
+
+        result = RevenueAnalysis(facade.db_connection).get_lottery_number_revenue_impact()
+        legacy = legacy_df(facade, """
+            SELECT
+                SUBSTR(lr.result_number, -2) as last_two_digits,
+                COUNT(DISTINCT d1.full_date) as occurrence_count,
+                AVG(r.total_revenue) as avg_next_day_revenue,
+                SUM(r.total_revenue) as total_next_day_revenue,
+                MIN(r.total_revenue) as min_next_day_revenue,
+                MAX(r.total_revenue) as max_next_day_revenue
+            FROM Fact_Lottery_Result lr
+            JOIN Dim_Date d1 ON lr.date_id = d1.date_id
+            JOIN Dim_Date d2 ON d2.full_date = DATE(d1.full_date, '+1 day')
+            JOIN Fact_Revenue r ON r.date_id = d2.date_id
+            WHERE lr.result_number IS NOT NULL
+            AND LENGTH(lr.result_number) >= 2
+            GROUP BY last_two_digits
+            HAVING COUNT(DISTINCT d1.full_date) >= 3
+        """)
+        print(f"2. {len(result)} two-digit suffixes match the legacy fact x fact join")
+        assert len(result) > 0
+        assert_same_rows(result, legacy)
+
+    print("\n✅ The next_date_id join reproduces the legacy next-day revenue impact")
+
+
+if __name__ == "__main__":
+    test_number_suffix_queries()
+    test_number_cube_windows()
+    test_revenue_aggregates()
+    test_hot_cold_numbers()
+    test_next_day_revenue_impact()
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import numpy as np
+
+from src.analysis.revenue import RevenueAnalysis
+from src.database.metadata import WarehouseMetadata
+from src.forecasting import GradientBoostingForecasting, ModelRegistry, RevenueForecasting, train_revenue_model
+from warehouse_fixtures import rebuild_warehouse, temp_warehouse
+
+
+def test_model_registry():
+    print("\n" + "=" * 70)
+    print("TEST MODEL REGISTRY")
+    print("=" * 70)
+
+    with temp_warehouse('2023-01-01', '2024-12-31', engine='numpy', seed=9) as facade:
+        db = facade.db_connection
+        registry_dir = Path(facade.db_path).parent / "models"
+
+        registry = ModelRegistry(str(registry_dir), keep_versions=2)
+        model = registry.get_or_train(db)
+        print(f"\n1. First lookup trains: {registry.get_stats()}")
+        assert registry.get_stats()['trainings'] == 1
+        assert registry.get_or_train(db) is model
+        assert registry.get_stats()['hits'] == 1
+
+        artifacts = list(registry_dir.rglob('*.npz'))
+        print(f"2. Artifact: {artifacts[0].relative_to(registry_dir)} ({artifacts[0].stat().st_size} bytes)")
+        assert len(artifacts) == 1
+
+        fresh = ModelRegistry(str(registry_dir))
+        loaded = fresh.get_or_train(db)
+        print("3. A new process loads the artifact instead of retraining")
+        assert fresh.get_stats()['disk_loads'] == 1 and fresh.get_stats()['trainings'] == 0
+        assert loaded.get_metrics() == model.get_metrics()
+
+        reference, _ = train_revenue_model(db)
+        features = reference.prepare_features(RevenueAnalysis(db).get_monthly_revenue_summary())
+        X = features[RevenueForecasting.FEATURE_COLUMNS]
+        print("4. Loaded model predicts and forecasts like the trained one")
+        assert np.allclose(loaded.predict(X), model.predict(X))
+        assert loaded.forecast_from_features(features, 6).equals(model.forecast_from_features(features, 6))
+
+        for _ in range(3):
+            WarehouseMetadata(db).bump_data_version()
+            registry.get_or_train(db)
+        versions = [meta['data_version'] for meta in registry.list_versions(db)]
+        print(f"5. Each data version retrains once, keeping versions {versions}")
+        assert registry.get_stats()['trainings'] == 4
+        assert versions == [3, 4]
+        assert registry.get_stats()['cached_models'] == 1
+
+        registry.get_or_train(db, force=True)
+        print("6. force=True retrains the current version")
+        assert registry.get_stats()['trainings'] == 5
+
+        stale = registry.get_or_train(db)
+        version = WarehouseMetadata(db).get_data_version()
+        rebuild_warehouse(facade, '2022-01-01', '2024-12-31', engine='numpy', seed=10)
+        db = facade.db_connection
+        while WarehouseMetadata(db).get_data_version() < version:
+            WarehouseMetadata(db).bump_data_version()
+        rebuilt = registry.get_or_train(db)
+        build_dirs = {path.parent for path in registry_dir.rglob('*.npz')}
+        print("7. A warehouse rebuilt at the same path with the same data version retrains")
+        assert rebuilt is not stale
+        assert registry.get_stats()['trainings'] == 6
+        assert len(build_dirs) == 1
+
+        try:
+            registry.get_or_train(db, GradientBoostingForecasting)
+            raise AssertionError("GradientBoostingForecasting has no array state and must be rejected")
+        except ValueError:
+            pass
+        print("8. Strategies without array state are rejected before training")
+        assert registry.get_stats()['trainings'] == 6
+        assert not list(registry_dir.rglob('*.tmp'))
+
+    print("\n✅ Models are trained once per data version and reloaded from compact artifacts")
+
+
+if __name__ == "__main__":
+    test_model_registry()
@@ -0,0 +1,39 @@
+import tempfile
+
+from warehouse_fixtures import make_facade
+
+
+def load_warehouse(tmp_dir: str, name: str, parallel: bool):
+    facade = make_facade(tmp_dir, db_name=name)
+    facade.initialize_database()
+    result = facade.load_data_to_warehouse(parallel=parallel)
+    stats = facade.get_warehouse_stats()
+    facade.close()
+    return result, stats
+
+
+def test_parallel_etl():
+    print("\n" + "=" * 70)
+    print("TEST PARALLEL EXTRACT/TRANSFORM")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        make_facade(tmp_dir).generate_raw_data('2024-01-01', '2024-03-31')
+
+        sequential, sequential_stats = load_warehouse(tmp_dir, "sequential", parallel=False)
+        parallel, parallel_stats = load_warehouse(tmp_dir, "parallel", parallel=True)
+
+        print(f"\n1. Sequential timings: {sequential['timings']}")
+        print(f"2. Parallel timings:   {parallel['timings']}")
+        assert parallel_stats == sequential_stats
+        assert parallel['transform'] == sequential['transform']
+        assert parallel['load']['loaded_counts'] == sequential['load']['loaded_counts']
+        for stage in ('extract_lottery', 'extract_revenue', 'transform_lottery',
+                      'transform_revenue', 'merge_dim_date', 'load', 'total'):
+            assert stage in parallel['timings']
+
+        print("\n✅ Parallel pipeline loads the same warehouse")
+
+
+if __name__ == "__main__":
+    test_parallel_etl()
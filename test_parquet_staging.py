@@ -0,0 +1,40 @@
+import random
+import tempfile
+
+from warehouse_fixtures import build_warehouse, make_facade
+
+
+def load_warehouse(tmp_dir: str, fmt: str):
+    facade = make_facade(tmp_dir, db_name=fmt, staging=fmt)
+    try:
+        random.seed(7)
+        build_warehouse(facade, '2024-01-01', '2024-01-31')
+
+        random.seed(8)
+        facade.generate_raw_data('2024-01-01', '2024-02-29')
+        streamed = facade.load_data_to_warehouse(incremental=True, chunk_size=500)
+        return streamed, facade.get_warehouse_stats()
+    finally:
+        facade.close()
+
+
+def test_parquet_staging():
+    print("\n" + "=" * 70)
+    print("TEST PARQUET STAGING")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_result, csv_stats = load_warehouse(tmp_dir, 'csv')
+        parquet_result, parquet_stats = load_warehouse(tmp_dir, 'parquet')
+
+        print(f"\n1. CSV incremental extract:     {csv_result['extract']}")
+        print(f"2. Parquet incremental extract: {parquet_result['extract']}")
+        assert parquet_result['extract'] == csv_result['extract']
+        assert parquet_result['high_water_marks'] == csv_result['high_water_marks']
+        assert parquet_stats == csv_stats
+
+        print("\n✅ Parquet staging loads the same warehouse as CSV")
+
+
+if __name__ == "__main__":
+    test_parquet_staging()
@@ -0,0 +1,47 @@
+from src.database import ConnectionPool
+from warehouse_fixtures import temp_warehouse
+
+
+def test_pragma_profiles():
+    print("\n" + "=" * 70)
+    print("TEST PRAGMA PROFILES")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        pool = ConnectionPool(facade.db_path, size=1)
+
+        try:
+            db = facade.db_connection
+            print(f"\n1. After load: profile={db.profile}, journal_mode={db.fetchone('PRAGMA journal_mode')[0]}")
+            assert db.profile == 'default'
+            assert db.fetchone("PRAGMA journal_mode")[0] == 'wal'
+            assert db.fetchone("PRAGMA synchronous")[0] == 2
+
+            applied = db.apply_profile('bulk-load')
+            print(f"\n2. Bulk-load pragmas: {applied}")
+            assert applied['synchronous'] == 0
+            assert applied['temp_store'] == 2
+
+            db.conn.execute("BEGIN IMMEDIATE")
+            db.conn.execute("DELETE FROM Fact_Revenue")
+            with pool.reader() as reader:
+                assert reader.fetchone("PRAGMA query_only")[0] == 1
+                count = reader.fetchone("SELECT COUNT(*) as cnt FROM Fact_Revenue")['cnt']
+            db.conn.rollback()
+            db.apply_profile('default')
+            print(f"\n3. Reader during open write transaction: {count:,} revenue rows")
+            assert count > 0
+
+            try:
+                db.apply_profile('turbo')
+                raise AssertionError("Unknown profile was accepted")
+            except ValueError:
+                pass
+
+            print("\n✅ Pragma profiles switch around loads and keep readers serving")
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    test_pragma_profiles()
@@ -0,0 +1,50 @@
+from src.analysis import RevenueAnalysis, LotteryAnalysis, QueryCache
+from src.database.metadata import WarehouseMetadata
+from warehouse_fixtures import rebuild_warehouse, temp_warehouse
+
+
+def test_query_cache():
+    print("\n" + "=" * 70)
+    print("TEST QUERY CACHE")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        cache = QueryCache(max_entries=2)
+        revenue = RevenueAnalysis(facade.db_connection, cache=cache)
+        lottery = LotteryAnalysis(facade.db_connection, cache=cache)
+
+        first = revenue.get_daily_revenue_trend()
+        first['total_revenue'] = 0
+        second = revenue.get_daily_revenue_trend(start_date=None)
+        print(f"\n1. Repeated call: {cache.get_stats()}")
+        assert cache.get_stats()['hits'] == 1
+        assert (second['total_revenue'] > 0).all()
+
+        lottery.get_number_frequency(digit_length=2)
+        lottery.get_number_frequency(digit_length=3)
+        print(f"\n2. Over capacity: {cache.get_stats()}")
+        assert cache.get_stats()['entries'] == 2
+        assert cache.get_stats()['evictions'] == 1
+
+        facade.generate_raw_data('2024-01-01', '2024-02-15')
+        facade.load_data_to_warehouse(incremental=True)
+        refreshed = revenue.get_daily_revenue_trend()
+        print(f"\n3. After load: {cache.get_stats()}")
+        assert len(refreshed) > len(second)
+        assert cache.get_stats()['invalidations'] == 2
+
+        monthly = revenue.get_monthly_revenue_summary()
+        version = WarehouseMetadata(facade.db_connection).get_data_version()
+        rebuild_warehouse(facade, '2023-01-01', '2024-06-30')
+        while WarehouseMetadata(facade.db_connection).get_data_version() < version:
+            WarehouseMetadata(facade.db_connection).bump_data_version()
+        rebuilt = RevenueAnalysis(facade.db_connection, cache=cache).get_monthly_revenue_summary()
+        print(f"\n4. Rebuilt warehouse at the same path: {len(monthly)} -> {len(rebuilt)} months")
+        assert len(rebuilt) == 18
+        assert rebuilt.equals(RevenueAnalysis(facade.db_connection).get_monthly_revenue_summary())
+
+        print("\n✅ Query cache hits, evicts and invalidates on load")
+
+
+if __name__ == "__main__":
+    test_query_cache()
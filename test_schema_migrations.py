@@ -0,0 +1,68 @@
+from warehouse_fixtures import temp_warehouse, warehouse_snapshot
+
+
+def test_result_number_padding():
+    print("\n" + "=" * 70)
+    print("TEST RESULT NUMBER PADDING MIGRATION")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        expected = warehouse_snapshot(facade)
+        padded = facade.db_connection.fetchone(
+            "SELECT COUNT(*) AS cnt FROM Fact_Lottery_Result WHERE result_number LIKE '0%'"
+        )['cnt']
+        print(f"\n1. Fresh load keeps leading zeros on {padded} results")
+        assert padded > 0
+
+        # Loads before result numbers were staged as text stored them as integers
+        with facade.db_connection.transaction():
+            facade.db_connection.execute(
+                "UPDATE Fact_Lottery_Result SET result_number = CAST(CAST(result_number AS INTEGER) AS TEXT)"
+            )
+        assert warehouse_snapshot(facade) != expected
+
+        facade.close()
+        facade.initialize_database()
+        print("2. initialize_database() pads legacy results back to the prize's digits")
+        assert warehouse_snapshot(facade) == expected
+
+    print("\n✅ Legacy result numbers are zero-padded to Dim_Prize.digits")
+
+
+def test_suffix_column_migration():
+    print("\n" + "=" * 70)
+    print("TEST NUMBER SUFFIX COLUMN MIGRATION")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        expected = warehouse_snapshot(facade)
+
+        # Warehouses built before the suffix columns hold only the raw result number
+        with facade.db_connection.transaction():
+            facade.db_connection.execute("""
+            CREATE TABLE Legacy_Fact_Lottery_Result AS
+            SELECT result_id, date_id, station_id, prize_id, prize_sequence, result_number
+            FROM Fact_Lottery_Result
+            """)
+            facade.db_connection.execute("DROP TABLE Fact_Lottery_Result")
+            facade.db_connection.execute("ALTER TABLE Legacy_Fact_Lottery_Result RENAME TO Fact_Lottery_Result")
+        columns = {row['name'] for row in facade.db_connection.fetchall("PRAGMA table_info(Fact_Lottery_Result)")}
+        print(f"\n1. Legacy fact table columns: {sorted(columns)}")
+        assert 'last_digit' not in columns
+
+        facade.close()
+        facade.initialize_database()
+        print("2. initialize_database() backfills the suffixes a fresh load writes")
+        assert warehouse_snapshot(facade) == expected
+        short = facade.db_connection.fetchone("""
+        SELECT COUNT(*) AS cnt FROM Fact_Lottery_Result
+        WHERE LENGTH(result_number) < 3 AND last_three_digits IS NOT NULL
+        """)['cnt']
+        assert short == 0
+
+    print("\n✅ Legacy fact tables gain the suffix columns with the loader's values")
+
+
+if __name__ == "__main__":
+    test_result_number_padding()
+    test_suffix_column_migration()
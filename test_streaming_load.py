@@ -0,0 +1,53 @@
+import math
+import tempfile
+
+from src.etl.extractor import DataExtractor
+from warehouse_fixtures import build_warehouse, make_facade, warehouse_snapshot
+
+
+def test_streaming_load():
+    print("\n" + "=" * 70)
+    print("TEST CSV STREAMING LOAD")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        batch = make_facade(tmp_dir, db_name="batch")
+        streamed = make_facade(tmp_dir, db_name="streamed")
+        try:
+            batch_result = build_warehouse(batch, '2024-01-01', '2024-02-29')
+            extract = batch_result['extract']
+
+            chunks = list(DataExtractor(batch.lottery_csv, batch.revenue_csv).iter_chunks(chunk_size=700))
+            sizes = {'lottery': [], 'revenue': []}
+            for source, lottery, revenue in chunks:
+                sizes[source].append(len(lottery if source == 'lottery' else revenue))
+            print(f"\n1. iter_chunks: {len(sizes['lottery'])} lottery and {len(sizes['revenue'])} revenue chunks")
+            assert [source for source, _, _ in chunks] == sorted(source for source, _, _ in chunks)
+            assert sum(sizes['lottery']) == extract['lottery_records']
+            assert sum(sizes['revenue']) == extract['revenue_records']
+            assert max(sizes['lottery'] + sizes['revenue']) <= 700
+
+            streamed.initialize_database()
+            result = streamed.load_data_to_warehouse(chunk_size=700)
+            chunk_stats = result['load']['chunks']
+            print(f"2. load_stream: {len(chunk_stats)} chunks, peak RSS {result['load']['peak_rss_mb']} MB")
+            assert result['extract'] == {**extract, 'chunk_size': 700}
+            assert len(chunk_stats) == sum(math.ceil(extract[f'{source}_records'] / 700) for source in sizes)
+            assert [c['chunk'] for c in chunk_stats] == list(range(len(chunk_stats)))
+            assert [c['rows'] for c in chunk_stats] == sizes['lottery'] + sizes['revenue']
+            assert all(c['rows_per_sec'] > 0 for c in chunk_stats)
+            for table in ('fact_lottery', 'fact_revenue'):
+                assert result['load']['loaded_counts'][table] == batch_result['load']['loaded_counts'][table]
+
+            print("3. Streamed and batch loads hold the same facts and aggregates")
+            assert streamed.get_warehouse_stats() == batch.get_warehouse_stats()
+            assert warehouse_snapshot(streamed) == warehouse_snapshot(batch)
+        finally:
+            batch.close()
+            streamed.close()
+
+    print("\n✅ Streaming the CSVs in chunks loads the same warehouse as a batch load")
+
+
+if __name__ == "__main__":
+    test_streaming_load()
@@ -0,0 +1,55 @@
+from src.etl.extractor import DataExtractor
+from src.etl.transformer import DataTransformer
+from src.etl.loader import DataLoader
+from warehouse_fixtures import temp_warehouse
+
+
+class FailingLoader(DataLoader):
+    def _refresh_aggregates(self):
+        raise RuntimeError("Simulated failure after fact inserts")
+
+
+def test_transactional_load():
+    print("\n" + "=" * 70)
+    print("TEST TRANSACTIONAL LOAD")
+    print("=" * 70)
+
+    with temp_warehouse('2024-01-01', '2024-01-31') as facade:
+        stats_before = facade.get_warehouse_stats()
+
+        facade.generate_raw_data('2024-02-01', '2024-02-29')
+        extractor = DataExtractor(facade.lottery_csv, facade.revenue_csv)
+        extractor.extract()
+        transformer = DataTransformer(extractor.get_lottery_data(), extractor.get_revenue_data())
+        loader = FailingLoader(facade.db_connection, transformer.transform_all(), batch_size=1_000)
+        try:
+            loader.load_all()
+            raise AssertionError("Failing load did not raise")
+        except RuntimeError as e:
+            print(f"\n1. Load failed: {e}")
+
+        print(f"   Rows inserted before failure: {loader.loaded_counts}")
+        assert loader.loaded_counts['fact_revenue'] > 0
+        assert facade.get_warehouse_stats() == stats_before
+        assert not facade.db_connection.in_transaction
+
+        db = facade.db_connection
+        with db.transaction():
+            db.execute("DELETE FROM Warehouse_Metadata WHERE source = 'lottery'")
+            try:
+                with db.transaction():
+                    db.execute("DELETE FROM Fact_Revenue")
+                    raise RuntimeError("Roll back savepoint")
+            except RuntimeError:
+                pass
+        stats_after = facade.get_warehouse_stats()
+        print(f"\n2. Savepoint rollback: Fact_Revenue={stats_after['Fact_Revenue']:,}, "
+              f"Warehouse_Metadata={stats_after['Warehouse_Metadata']}")
+        assert stats_after['Fact_Revenue'] == stats_before['Fact_Revenue']
+        assert stats_after['Warehouse_Metadata'] == stats_before['Warehouse_Metadata'] - 1
+
+        print("\n✅ Failed loads leave no partial facts")
+
+
+if __name__ == "__main__":
+    test_transactional_load()
@@ -0,0 +1,109 @@
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from src import WarehouseFacade
+
+
+# Facts and aggregates keyed by dimension names, so warehouses loaded in a different order compare equal
+SNAPSHOT_QUERIES = {
+    'Fact_Lottery_Result': """
+        SELECT f.date_id, s.station_name, p.prize_name, f.prize_sequence, f.result_number,
+               f.last_digit, f.last_two_digits, f.last_three_digits
+        FROM Fact_Lottery_Result f
+        JOIN Dim_Station s ON f.station_id = s.station_id
+        JOIN Dim_Prize p ON f.prize_id = p.prize_id
+        ORDER BY 1, 2, 3, 4
+    """,
+    'Fact_Revenue': """
+        SELECT f.date_id, s.station_name, a.agency_name, f.tickets_sold, f.ticket_price,
+               f.total_revenue, f.total_payout, f.net_profit, f.commission
+        FROM Fact_Revenue f
+        JOIN Dim_Station s ON f.station_id = s.station_id
+        JOIN Dim_Agency a ON f.agency_id = a.agency_id
+        ORDER BY 1, 2, 3
+    """,
+    'Agg_Revenue_Daily': "SELECT * FROM Agg_Revenue_Daily ORDER BY date_id",
+    'Agg_Revenue_Daily_Station': """
+        SELECT g.date_id, s.station_name, g.transactions, g.tickets_sold, g.total_revenue,
+               g.total_payout, g.net_profit, g.commission
+        FROM Agg_Revenue_Daily_Station g
+        JOIN Dim_Station s ON g.station_id = s.station_id
+        ORDER BY 1, 2
+    """,
+    'Agg_Lottery_Number_Count': """
+        SELECT g.date_id, s.station_name, p.prize_name, g.suffix_len, g.suffix, g.frequency
+        FROM Agg_Lottery_Number_Count g
+        JOIN Dim_Station s ON g.station_id = s.station_id
+        JOIN Dim_Prize p ON g.prize_id = p.prize_id
+        ORDER BY 1, 2, 3, 4, 5
+    """
+}
+
+
+def warehouse_snapshot(facade: WarehouseFacade) -> Dict[str, List[tuple]]:
+    return {
+        table: [tuple(row) for row in facade.db_connection.fetchall(query)]
+        for table, query in SNAPSHOT_QUERIES.items()
+    }
+
+
+def legacy_df(facade: WarehouseFacade, query: str) -> pd.DataFrame:
+    return facade.db_connection.fetch_df(query)
+
+
+def assert_same_rows(actual: pd.DataFrame, expected: pd.DataFrame):
+    # Row order only matters up to ties, so both frames are sorted on every column first
+    assert list(actual.columns) == list(expected.columns), (list(actual.columns), list(expected.columns))
+    columns = list(expected.columns)
+    pd.testing.assert_frame_equal(
+        actual.sort_values(columns).reset_index(drop=True),
+        expected.sort_values(columns).reset_index(drop=True),
+        check_dtype=False
+    )
+
+
+def make_facade(
+    directory: str,
+    db_name: str = "warehouse",
+    staging: str = "csv",
+    raw_prefix: str = ""
+) -> WarehouseFacade:
+    directory = Path(directory)
+    return WarehouseFacade(
+        db_path=str(directory / f"{db_name}.db"),
+        lottery_csv=str(directory / f"{raw_prefix}lottery_results.{staging}"),
+        revenue_csv=str(directory / f"{raw_prefix}revenue_data.{staging}")
+    )
+
+
+def build_warehouse(facade: WarehouseFacade, start_date: str, end_date: str, **generate_options) -> dict:
+    facade.generate_raw_data(start_date, end_date, **generate_options)
+    facade.initialize_database()
+    return facade.load_data_to_warehouse()
+
+
+def rebuild_warehouse(facade: WarehouseFacade, start_date: str, end_date: str, **generate_options) -> dict:
+    facade.close()
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{facade.db_path}{suffix}").unlink(missing_ok=True)
+    return build_warehouse(facade, start_date, end_date, **generate_options)
+
+
+@contextmanager
+def temp_warehouse(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    **generate_options
+) -> Iterator[WarehouseFacade]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        facade = make_facade(tmp_dir)
+        try:
+            if start_date is not None:
+                build_warehouse(facade, start_date, end_date, **generate_options)
+            yield facade
+        finally:
+            facade.close()